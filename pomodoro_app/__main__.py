@@ -4,11 +4,17 @@ import argparse
 import sys
 import logging
 
+from pomodoro_app.adapters.cli.archive import add_archive_commands, run_archive_command
+from pomodoro_app.adapters.cli.backup import add_backup_commands, run_backup_command
+from pomodoro_app.adapters.cli.history import add_history_commands, run_history_command
 from pomodoro_app.infrastructure.logging import setup_logging, get_logger
 from pomodoro_app.core.timer_service import TimerService
-from pomodoro_app.infrastructure.db.connection import connect
-from pomodoro_app.infrastructure.db.schema import ensure_schema
-from pomodoro_app.infrastructure.db.integration import wire_persistence, load_settings
+from pomodoro_app.infrastructure.db.integration import get_settings, load_settings, wire_persistence
+from pomodoro_app.infrastructure.db.maintenance import DatabaseMaintenance
+from pomodoro_app.infrastructure.db.pool import close_pool, get_pool
+from pomodoro_app.infrastructure.db.schema import enable_incremental_vacuum, rebuild_daily_stats
+from pomodoro_app.infrastructure.db.writer import DatabaseWriter
+from pomodoro_app.infrastructure.journal.file_journal import FileJournal
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -23,6 +29,20 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Inicia a interface gráfica (Qt MainWindow)",
     )
+    parser.add_argument(
+        "--rebuild-stats",
+        action="store_true",
+        help="Recalcula a tabela de estatísticas diárias (daily_stats) e sai",
+    )
+    parser.add_argument(
+        "--enable-incremental-vacuum",
+        action="store_true",
+        help="Converte o banco para auto_vacuum=INCREMENTAL (VACUUM completo, bloqueia escritas) e sai",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="{export,import,backup,restore,archive}")
+    add_history_commands(commands)
+    add_backup_commands(commands)
+    add_archive_commands(commands)
     args = parser.parse_args(argv)
 
     setup_logging(app_name="pomodoro_app")
@@ -43,6 +63,38 @@ def main(argv: list[str] | None = None) -> int:
         plugin_demo_logger.error("Smoke: demo plugin error (expected)")
         return 0
 
+    if args.command in ("export", "import"):
+        try:
+            return run_history_command(args, get_pool())
+        finally:
+            close_pool()
+
+    if args.command in ("backup", "restore"):
+        try:
+            return run_backup_command(args, get_pool())
+        finally:
+            close_pool()
+
+    if args.command == "archive":
+        try:
+            return run_archive_command(args, get_pool())
+        finally:
+            close_pool()
+
+    if args.rebuild_stats:
+        with get_pool().writer() as conn:
+            rows = rebuild_daily_stats(conn)
+        print(f"daily_stats rebuilt: {rows} rows")
+        close_pool()
+        return 0
+
+    if args.enable_incremental_vacuum:
+        with get_pool().writer() as conn:
+            converted = enable_incremental_vacuum(conn)
+        print("auto_vacuum=INCREMENTAL enabled" if converted else "auto_vacuum=INCREMENTAL already enabled")
+        close_pool()
+        return 0
+
     if args.gui:
         # Checagem básica de disponibilidade de display (Linux/Unix)
         try:
@@ -64,16 +116,19 @@ def main(argv: list[str] | None = None) -> int:
         from pomodoro_app.adapters.gui.main_window import MainWindow  # type: ignore
         from pomodoro_app.adapters.gui.bridge import GuiBridge  # type: ignore
         from pomodoro_app.adapters.gui.controller import GuiController  # type: ignore
-        from pomodoro_app.core.timer_service import TimerService  # type: ignore
 
         # Carregar configurações para obter duração padrão de focus
-        conn = connect()
-        ensure_schema(conn)
-        settings = load_settings(conn)
+        settings = load_settings(get_settings())
         default_focus = int(settings.get("durations", {}).get("focus", 25 * 60))
 
-        service = TimerService()
+        journal = FileJournal()
+        service = TimerService(journal=journal)
         bridge = GuiBridge()
+        # Persist finished sessions, including one recover() finds expired in _factory
+        writer = DatabaseWriter(get_pool())
+        # Checkpoints the WAL while idle, vacuums in budgeted steps and truncates it on exit
+        maintenance = DatabaseMaintenance(get_pool())
+        unsubscribe = wire_persistence(service, writer)
 
         def _factory(_app: object) -> object:
             win = MainWindow()
@@ -84,22 +139,48 @@ def main(argv: list[str] | None = None) -> int:
                 logging.getLogger("pomodoro").exception("failed to set initial focus display")
             # Wire controller so that Play/Pause/Resume/Stop control the service
             GuiController(win, service, bridge, default_focus_seconds=default_focus)
+            # Resume a session interrupted by a crash or restart
+            try:
+                service.recover()
+            except Exception:
+                logging.getLogger("pomodoro").exception("failed to recover session from journal")
             return win
 
-        return int(run_app(_factory))
+        try:
+            return int(run_app(_factory))
+        finally:
+            # Quitting (or a logout/reboot) leaves a running session to recover() next time
+            service.close(keep_session=True)
+            unsubscribe()
+            journal.close()
+            writer.close()
+            maintenance.close()
+            close_pool()
 
     # Minimal wiring for persistence and service lifecycle (no GUI bootstrap here)
-    conn = connect()
-    ensure_schema(conn)
-    settings = load_settings(conn)
-
-    service = TimerService()
-    unsubscribe = wire_persistence(service, conn)
+    pool = get_pool()
+    settings = load_settings(get_settings())
+
+    journal = FileJournal()
+    service = TimerService(journal=journal)
+    # Session inserts run on the writer thread, off the timer thread
+    writer = DatabaseWriter(pool)
+    # Checkpoints the WAL while idle and truncates it on exit
+    maintenance = DatabaseMaintenance(pool)
+    unsubscribe = wire_persistence(service, writer)
     try:
+        # A session that finished while the app was down is persisted here
+        service.recover()
         app_logger.info("TimerService and persistence wiring initialized")
     finally:
-        # Ensure clean unsubscribe on exit path
+        # End a resumed worker before the journal and writer it feeds go away;
+        # the session itself stays in the journal for the next start
+        service.close(keep_session=True)
         unsubscribe()
+        journal.close()
+        writer.close()
+        maintenance.close()
+        close_pool()
     return 0
 
 
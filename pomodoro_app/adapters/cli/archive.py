@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+from datetime import date
+from typing import Any
+
+from pomodoro_app.infrastructure.db.archive import SessionArchive
+from pomodoro_app.infrastructure.db.pool import ConnectionPool
+
+
+def add_archive_commands(subparsers: Any) -> None:
+    """Register the `archive` subcommand."""
+
+    arc = subparsers.add_parser("archive", help="Move anos antigos do histórico para arquivos por ano")
+    arc.add_argument(
+        "--before",
+        type=int,
+        default=date.today().year - 1,
+        help="Arquiva as sessões iniciadas antes deste ano (padrão: ano passado)",
+    )
+
+
+def run_archive_command(args: argparse.Namespace, pool: ConnectionPool) -> int:
+    """Run a parsed `archive` command; prints a summary to stderr."""
+
+    if pool.db_file is None:
+        print("archive failed: the database is in memory", file=sys.stderr)
+        return 1
+    try:
+        with SessionArchive(pool.db_file.parent / "archive") as archive, pool.writer() as conn:
+            moved = archive.archive_before(conn, args.before)
+    except (OSError, sqlite3.Error) as exc:
+        print(f"archive failed: {exc}", file=sys.stderr)
+        return 1
+    for year, rows in moved.items():
+        print(f"archived {rows:,} sessions of {year} to {archive.path(year)}", file=sys.stderr)
+    if not moved:
+        print(f"nothing to archive before {args.before}", file=sys.stderr)
+    return 0
+
+
+__all__ = ["add_archive_commands", "run_archive_command"]
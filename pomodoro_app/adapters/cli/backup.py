@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any
+
+from pomodoro_app.infrastructure.db.backup import BackupService, restore_database
+from pomodoro_app.infrastructure.db.pool import ConnectionPool
+
+
+def add_backup_commands(subparsers: Any) -> None:
+    """Register the `backup` and `restore` subcommands."""
+
+    bkp = subparsers.add_parser("backup", help="Cria um backup online do banco de dados")
+    bkp.add_argument("--dir", type=Path, help="Pasta dos backups (padrão: backups/ ao lado do banco)")
+    bkp.add_argument("--keep", type=int, default=7, help="Quantos backups manter (padrão: 7)")
+    bkp.add_argument("--pages-per-step", type=int, default=256, help="Páginas copiadas por passo")
+
+    rst = subparsers.add_parser("restore", help="Restaura o banco de dados a partir de um backup")
+    rst.add_argument("path", type=Path, help="Arquivo de backup")
+
+
+def run_backup_command(args: argparse.Namespace, pool: ConnectionPool) -> int:
+    """Run a parsed `backup`/`restore` command; prints a summary to stderr."""
+
+    try:
+        if args.command == "backup":
+            with BackupService(pool, args.dir, keep=args.keep, pages_per_step=args.pages_per_step) as service:
+                result = service.backup_now().result()
+            verb = "backed up to"
+        else:
+            result = restore_database(pool, args.path)
+            verb = "restored from"
+    except (OSError, ValueError, sqlite3.Error) as exc:
+        print(f"{args.command} failed: {exc}", file=sys.stderr)
+        return 1
+    print(f"{verb} {result.path}: {result.pages:,} pages in {result.seconds:.2f}s", file=sys.stderr)
+    return 0
+
+
+__all__ = ["add_backup_commands", "run_backup_command"]
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
+from uuid import UUID
+
+from pomodoro_app.core.models import Session, SessionType, TimerState
+from pomodoro_app.infrastructure.db.archive import default_archive
+from pomodoro_app.infrastructure.db.pool import ConnectionPool
+from pomodoro_app.infrastructure.db.repositories import SessionRepository
+from pomodoro_app.infrastructure.logging import get_logger
+
+
+logger = get_logger("pomodoro.adapters.cli.history")
+
+FORMATS = ("csv", "jsonl")
+FIELDS = ("id", "type", "duration_s", "started_at", "ended_at", "state")
+
+
+@dataclass(frozen=True)
+class TransferReport:
+    """Outcome of an export or import.
+
+    - rows: records read from the database (export) or the file (import)
+    - written: records written to the file (export) or inserted/replaced (import)
+    """
+
+    rows: int
+    written: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def detect_format(path: str, fmt: str | None = None) -> str:
+    """Explicit `fmt`, else the file extension (.csv / .jsonl / .ndjson)."""
+
+    if fmt is not None:
+        if fmt not in FORMATS:
+            raise ValueError(f"unknown format {fmt!r}; expected one of {', '.join(FORMATS)}")
+        return fmt
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"cannot infer the format of {path!r}; pass --format")
+
+
+# --- Records ---------------------------------------------------------------------
+def _to_record(session: Session) -> dict[str, Any]:
+    return {
+        "id": str(session.id),
+        "type": session.type.name,
+        "duration_s": int(session.duration_s),
+        "started_at": session.started_at.isoformat() if session.started_at is not None else None,
+        "ended_at": session.ended_at.isoformat() if session.ended_at is not None else None,
+        "state": session.state.name,
+    }
+
+
+def _parse_dt(value: Any) -> datetime | None:
+    # CSV has no null; empty cells mean "not set"
+    return datetime.fromisoformat(value) if value not in (None, "") else None
+
+
+def _from_record(record: dict[str, Any], line: int) -> Session:
+    try:
+        return Session(
+            id=UUID(str(record["id"])),
+            type=SessionType[str(record["type"])],
+            duration_s=int(record["duration_s"]),
+            started_at=_parse_dt(record.get("started_at")),
+            ended_at=_parse_dt(record.get("ended_at")),
+            state=TimerState[str(record.get("state") or TimerState.IDLE.name)],
+        )
+    except (KeyError, ValueError, TypeError) as exc:
+        raise ValueError(f"line {line}: invalid session record ({exc!r})") from None
+
+
+def _write_records(fp: IO[str], fmt: str, sessions: Iterable[Session]) -> int:
+    count = 0
+    if fmt == "csv":
+        writer = csv.writer(fp)
+        writer.writerow(FIELDS)
+        for session in sessions:
+            record = _to_record(session)
+            writer.writerow(["" if record[f] is None else record[f] for f in FIELDS])
+            count += 1
+    else:
+        for session in sessions:
+            fp.write(json.dumps(_to_record(session), separators=(",", ":")))
+            fp.write("\n")
+            count += 1
+    return count
+
+
+def _read_records(fp: IO[str], fmt: str) -> Iterator[Session]:
+    if fmt == "csv":
+        reader = csv.DictReader(fp)
+        missing = {"id", "type", "duration_s"} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"CSV header is missing {', '.join(sorted(missing))}")
+        for record in reader:
+            # Header is line 1
+            yield _from_record(record, reader.line_num)
+    else:
+        for line, text in enumerate(fp, start=1):
+            if not text.strip():
+                continue
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"line {line}: invalid JSON ({exc.msg})") from None
+            if not isinstance(record, dict):
+                raise ValueError(f"line {line}: expected a JSON object")
+            yield _from_record(record, line)
+
+
+@contextmanager
+def _open(path: str, mode: str) -> Iterator[IO[str]]:
+    if path == "-":
+        yield sys.stdout if "w" in mode else sys.stdin
+        return
+    # newline="" keeps the csv module in charge of line endings
+    with open(path, mode, encoding="utf-8", newline="") as fp:
+        yield fp
+
+
+# --- Export / import ----------------------------------------------------------------
+def export_history(
+    repo: SessionRepository,
+    path: str,
+    fmt: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    chunk: int = 5_000,
+) -> TransferReport:
+    """Stream sessions started within [start, end] to `path` ("-" for stdout).
+
+    Rows are read with `SessionRepository.iter_by_period`, so memory stays
+    bounded by `chunk` whatever the history size.
+    """
+
+    fmt = detect_format(path, fmt) if path != "-" or fmt is not None else "jsonl"
+    t0 = time.perf_counter()
+    with _open(path, "w") as fp:
+        count = _write_records(fp, fmt, repo.iter_by_period(start, end, chunk=chunk))
+    report = TransferReport(rows=count, written=count, seconds=time.perf_counter() - t0)
+    logger.info("Exported %d sessions to %s (%.0f rows/s)", count, path, report.rows_per_second)
+    return report
+
+
+def import_history(
+    repo: SessionRepository,
+    path: str,
+    fmt: str | None = None,
+    on_duplicate: str = "skip",
+    batch_size: int = 10_000,
+) -> TransferReport:
+    """Stream sessions from `path` ("-" for stdin) into the database.
+
+    Records are inserted `batch_size` at a time, one transaction per batch
+    (see `SessionRepository.add_many` for `on_duplicate`). A malformed
+    record raises ValueError naming its line; batches before it stay
+    committed.
+    """
+
+    fmt = detect_format(path, fmt) if path != "-" or fmt is not None else "jsonl"
+    t0 = time.perf_counter()
+    read = 0
+
+    def _counted(sessions: Iterable[Session]) -> Iterator[Session]:
+        nonlocal read
+        for session in sessions:
+            read += 1
+            yield session
+
+    with _open(path, "r") as fp:
+        written = repo.add_many(_counted(_read_records(fp, fmt)), on_duplicate=on_duplicate, chunk=batch_size)
+    report = TransferReport(rows=read, written=written, seconds=time.perf_counter() - t0)
+    logger.info(
+        "Imported %d of %d sessions from %s (%.0f rows/s)", written, read, path, report.rows_per_second
+    )
+    return report
+
+
+# --- Command line -------------------------------------------------------------------
+def add_history_commands(subparsers: Any) -> None:
+    """Register the `export` and `import` subcommands."""
+
+    exp = subparsers.add_parser("export", help="Exporta o histórico de sessões (CSV ou JSONL)")
+    exp.add_argument("path", help="Arquivo de destino ('-' para stdout)")
+    exp.add_argument("--format", choices=FORMATS, help="Formato (padrão: extensão do arquivo)")
+    exp.add_argument("--start", type=datetime.fromisoformat, help="Início do período (ISO 8601)")
+    exp.add_argument("--end", type=datetime.fromisoformat, help="Fim do período (ISO 8601)")
+
+    imp = subparsers.add_parser("import", help="Importa histórico de sessões (CSV ou JSONL)")
+    imp.add_argument("path", help="Arquivo de origem ('-' para stdin)")
+    imp.add_argument("--format", choices=FORMATS, help="Formato (padrão: extensão do arquivo)")
+    imp.add_argument(
+        "--on-duplicate",
+        choices=("skip", "replace", "fail"),
+        default="skip",
+        help="O que fazer com ids já existentes (padrão: skip)",
+    )
+    imp.add_argument("--batch-size", type=int, default=10_000, help="Sessões por transação")
+
+
+def run_history_command(args: argparse.Namespace, pool: ConnectionPool) -> int:
+    """Run a parsed `export`/`import` command; prints a summary to stderr."""
+
+    try:
+        if args.command == "export":
+            # Archived years are exported too
+            with pool.reader() as conn, (default_archive(pool) or nullcontext()) as archive:
+                repo = SessionRepository(conn, archive=archive)
+                report = export_history(repo, args.path, args.format, args.start, args.end)
+            verb = "exported"
+        else:
+            with pool.writer() as conn:
+                report = import_history(
+                    SessionRepository(conn), args.path, args.format, args.on_duplicate, args.batch_size
+                )
+            verb = "imported"
+    except (OSError, ValueError) as exc:
+        print(f"{args.command} failed: {exc}", file=sys.stderr)
+        return 1
+    print(
+        f"{verb} {report.written:,} of {report.rows:,} sessions in {report.seconds:.2f}s "
+        f"({report.rows_per_second:,.0f} rows/s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+__all__ = [
+    "TransferReport",
+    "detect_format",
+    "export_history",
+    "import_history",
+    "add_history_commands",
+    "run_history_command",
+    "FORMATS",
+]
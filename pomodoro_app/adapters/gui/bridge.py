@@ -38,9 +38,14 @@ def _queue_emit(signal: QtCore.SignalInstance, *args: object) -> None:
     )
 
 
-def connect_service_to_bridge(service: TimerService, bridge: GuiBridge) -> Callable[[], None]:
+def connect_service_to_bridge(
+    service: TimerService, bridge: GuiBridge, tick_resolution: float | None = None
+) -> Callable[[], None]:
     """Wire TimerService callbacks to Qt signals via queued emission.
 
+    `tick_resolution` is forwarded to `on_tick` (e.g. 60.0 when only minutes are
+    shown, such as a tray tooltip with the window hidden).
+
     Returns an unsubscribe callable to detach all observers.
     """
 
@@ -64,9 +69,10 @@ def connect_service_to_bridge(service: TimerService, bridge: GuiBridge) -> Calla
         except RuntimeError:
             logger.debug("cycle_end emit skipped: bridge deleted")
 
-    unsub_tick = service.on_tick(on_tick)
-    unsub_state = service.on_state(on_state)
-    unsub_end = service.on_cycle_end(on_cycle_end)
+    unsub_tick = service.on_tick(on_tick, resolution=tick_resolution)
+    # One consumer: the GUI needs cycle_end before the state that follows it
+    unsub_state = service.on_state(on_state, consumer=bridge)
+    unsub_end = service.on_cycle_end(on_cycle_end, consumer=bridge)
 
     logger.info("GuiBridge connected to TimerService callbacks")
 
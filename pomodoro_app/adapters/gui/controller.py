@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Callable, Optional
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore
 
 from pomodoro_app.core.models import TimerState
 from pomodoro_app.core.timer_service import TimerService
@@ -14,6 +14,9 @@ from .main_window import MainWindow
 
 logger = get_logger("pomodoro.adapters.gui.controller")
 
+# Tick resolution while the window is hidden (e.g. to the tray) or minimized
+BACKGROUND_TICK_RESOLUTION = 60.0
+
 
 class GuiController(QtCore.QObject):
     """Controller wiring the MainWindow to TimerService using GuiBridge.
@@ -21,6 +24,8 @@ class GuiController(QtCore.QObject):
     - Connects UI intents (start/pause/resume/stop) to service methods
     - Subscribes to service events via bridge and updates UI safely
     - Manages button enabled states based on TimerState
+    - Takes ticks at `BACKGROUND_TICK_RESOLUTION` while the window is hidden
+      or minimized, and at the service's tick interval while it is shown
     """
 
     def __init__(
@@ -36,10 +41,16 @@ class GuiController(QtCore.QObject):
         self._bridge = bridge
         self._default_focus_seconds = int(default_focus_seconds)
         self._unsubscribe: Optional[Callable[[], None]] = None
+        self._unsubscribe_settings: Optional[Callable[[], None]] = None
         self._stopped: bool = False
+        self._background: bool = False
 
         self._wire_ui_to_service()
         self._wire_bridge_to_ui()
+        self._wire_settings()
+        self._window.installEventFilter(self)
+        # The settings cache is process-wide; let go of it with the window
+        self._window.destroyed.connect(self.dispose)
 
     # --- Wiring --------------------------------------------------------------
     def _wire_ui_to_service(self) -> None:
@@ -51,14 +62,54 @@ class GuiController(QtCore.QObject):
         self._window.settingsRequested.connect(self._show_settings_dialog)
 
     def _wire_bridge_to_ui(self) -> None:
-        if self._unsubscribe:
-            self._unsubscribe()
-        self._unsubscribe = connect_service_to_bridge(self._service, self._bridge)
+        self._subscribe_service()
 
         self._bridge.tick.connect(self._on_tick)
         self._bridge.state.connect(self._on_state)
         self._bridge.cycle_end.connect(self._on_cycle_end)
 
+    def _subscribe_service(self) -> None:
+        resolution = BACKGROUND_TICK_RESOLUTION if self._background else None
+        previous = self._unsubscribe
+        # Subscribe before dropping the old subscription so no state/cycle_end is missed
+        self._unsubscribe = connect_service_to_bridge(
+            self._service, self._bridge, tick_resolution=resolution
+        )
+        if previous:
+            previous()
+
+    def eventFilter(  # type: ignore[override]
+        self, watched: QtCore.QObject, event: QtCore.QEvent
+    ) -> bool:
+        if watched is self._window and event.type() in (
+            QtCore.QEvent.Type.Show,
+            QtCore.QEvent.Type.Hide,
+            QtCore.QEvent.Type.WindowStateChange,
+        ):
+            background = self._window.isHidden() or self._window.isMinimized()
+            if background != self._background and self._unsubscribe is not None:
+                self._background = background
+                self._subscribe_service()
+                logger.debug("ticks resubscribed (window %s)", "hidden" if background else "shown")
+        return super().eventFilter(watched, event)
+
+    def _wire_settings(self) -> None:
+        # Settings changes arrive from the cache; no need to re-query SQLite
+        try:
+            from pomodoro_app.infrastructure.db.integration import get_settings
+
+            self._unsubscribe_settings = get_settings().subscribe(self._on_settings_changed)
+        except Exception:
+            logger.exception("failed to subscribe to settings changes")
+
+    def _on_settings_changed(self, changed: dict) -> None:
+        durations = changed.get("durations")
+        if not isinstance(durations, dict):
+            return
+        self._default_focus_seconds = int(durations.get("focus", 25 * 60))
+        if self._service.snapshot().state == TimerState.IDLE:
+            self._window.update_remaining_seconds(self._default_focus_seconds)
+
     # --- UI Slots ------------------------------------------------------------
     @QtCore.Slot(object)
     def _on_start_requested(self, duration_s: object | None) -> None:
@@ -105,18 +156,8 @@ class GuiController(QtCore.QObject):
             from .settings_dialog import SettingsDialog
 
             dlg = SettingsDialog(self._window)
-            if dlg.exec() == QtWidgets.QDialog.Accepted:  # type: ignore[attr-defined]
-                # Reload defaults after persistence and reflect on UI if idle
-                from pomodoro_app.infrastructure.db.connection import connect
-                from pomodoro_app.infrastructure.db.schema import ensure_schema
-                from pomodoro_app.infrastructure.db.integration import load_settings
-
-                conn = connect()
-                ensure_schema(conn)
-                settings = load_settings(conn)
-                self._default_focus_seconds = int(settings.get("durations", {}).get("focus", 25 * 60))
-                if self._service.state == TimerState.IDLE:
-                    self._window.update_remaining_seconds(self._default_focus_seconds)
+            # Accepted values reach _on_settings_changed through the settings cache
+            dlg.exec()
         except Exception:
             logger.exception("failed to open/apply settings dialog")
 
@@ -151,10 +192,14 @@ class GuiController(QtCore.QObject):
         self._window.stopButton.setEnabled(stop_enabled)
 
     # --- Lifecycle -----------------------------------------------------------
+    @QtCore.Slot()
     def dispose(self) -> None:
         if self._unsubscribe:
             self._unsubscribe()
             self._unsubscribe = None
+        if self._unsubscribe_settings:
+            self._unsubscribe_settings()
+            self._unsubscribe_settings = None
 
 
 __all__ = ["GuiController"]
@@ -4,8 +4,7 @@ import gettext
 
 from PySide6 import QtCore, QtWidgets
 
-from pomodoro_app.infrastructure.db.connection import connect
-from pomodoro_app.infrastructure.db.schema import ensure_schema
+from pomodoro_app.infrastructure.db.integration import get_settings
 from pomodoro_app.infrastructure.db.repositories import SettingsRepository
 
 
@@ -24,10 +23,8 @@ class SettingsDialog(QtWidgets.QDialog):
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self.setWindowTitle(_("Settings"))
-        # Persistence
-        self._conn = connect()
-        ensure_schema(self._conn)
-        self._repo = SettingsRepository(self._conn)
+        # Persistence (process-wide settings cache)
+        self._settings = get_settings()
         self._build_ui()
         self._load_values()
 
@@ -55,8 +52,11 @@ class SettingsDialog(QtWidgets.QDialog):
         layout.addRow(buttons)
 
     def _load_values(self) -> None:
+        self._load_from(self._settings)
+
+    def _load_from(self, repo: SettingsRepository) -> None:
         try:
-            durations = self._repo.get("durations", {"focus": 25 * 60, "break": 5 * 60}) or {}
+            durations = repo.get("durations", {"focus": 25 * 60, "break": 5 * 60}) or {}
             focus_s = int(durations.get("focus", 25 * 60))
             break_s = int(durations.get("break", 5 * 60))
             self.focusSpin.setValue(max(1, focus_s // 60))
@@ -66,7 +66,7 @@ class SettingsDialog(QtWidgets.QDialog):
             self.focusSpin.setValue(25)
             self.breakSpin.setValue(5)
         try:
-            language = self._repo.get("language", "system") or "system"
+            language = repo.get("language", "system") or "system"
             idx = max(0, self.langCombo.findText(str(language)))
             self.langCombo.setCurrentIndex(idx)
         except Exception:
@@ -83,13 +83,13 @@ class SettingsDialog(QtWidgets.QDialog):
         # Persist values
         focus_s, break_s, language = self.get_values()
         try:
-            self._repo.set("durations", {"focus": focus_s, "break": break_s})
-            self._repo.set("language", language)
+            # One transaction; subscribers (e.g. the controller) are notified
+            self._settings.set_many({"durations": {"focus": focus_s, "break": break_s}, "language": language})
         except Exception:
             # Keep dialog open? For now, still close but values might not persist
             pass
         super().accept()
-        # Close once; do not reopen. The controller listens for Accepted and refreshes defaults.
+        # Close once; do not reopen. The controller is notified through its settings subscription.
 
 
 __all__ = ["SettingsDialog"]
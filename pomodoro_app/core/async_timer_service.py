@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Literal
+
+from .models import TickEvent, TimerState
+from .timer_service import TimerService
+
+
+class AsyncioScheduler:
+    """SchedulerPort backed by an asyncio event loop (`loop.call_at`)."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> asyncio.TimerHandle:
+        return self._loop.call_at(self._loop.time() + max(0.0, delay), callback)
+
+
+class AsyncTimerService(TimerService):
+    """asyncio-native TimerService: ticks run on the event loop, no threads.
+
+    Shares the state machine of `TimerService` (start_focus/start_break/pause/
+    resume/stop and their InvalidStateError guards). Differences:
+      - ticks are scheduled with `loop.call_at` on the loop's clock
+      - observers may be coroutine functions; awaitables they return are run as
+        tasks on the loop (exceptions are logged, see `drain()`)
+      - `ticks()` offers an `async for` stream of `TickEvent`
+
+    Must be created and controlled from the event loop thread. Defaults to the
+    "deadline" tick mode since ticks are absolute `call_at` deadlines anyway.
+    """
+
+    def __init__(
+        self,
+        tick_interval: float = 1.0,
+        loop: asyncio.AbstractEventLoop | None = None,
+        logger: logging.Logger | None = None,
+        tick_mode: Literal["interval", "deadline"] = "deadline",
+    ) -> None:
+        self._loop = loop or asyncio.get_running_loop()
+        super().__init__(
+            tick_interval=tick_interval,
+            clock=self._loop.time,
+            logger=logger,
+            scheduler=AsyncioScheduler(self._loop),
+            tick_mode=tick_mode,
+        )
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+    # Observer registration -----------------------------------------------------
+    def on(
+        self,
+        event: Literal["tick", "cycle_end", "state"],
+        callback: Callable[..., None | Awaitable[None]],
+        resolution: float | None = None,
+        consumer: object = None,
+    ) -> Callable[[], None]:
+        def _invoke(*args: object) -> None:
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                self._spawn(event, result)
+
+        if consumer is None:
+            # Group by the wrapped callback, not by this adapter
+            consumer = getattr(callback, "__self__", callback)
+        return super().on(event, _invoke, resolution=resolution, consumer=consumer)
+
+    def _spawn(self, event: str, awaitable: Awaitable[Any]) -> None:
+        task = asyncio.ensure_future(awaitable, loop=self._loop)
+        self._tasks.add(task)
+
+        def _done(t: asyncio.Task[Any]) -> None:
+            self._tasks.discard(t)
+            if not t.cancelled() and t.exception() is not None:
+                self._logger.error("async callback error in %s", event, exc_info=t.exception())
+
+        task.add_done_callback(_done)
+
+    async def drain(self) -> None:
+        """Wait until every pending awaitable observer has finished."""
+
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    # Streams ------------------------------------------------------------------
+    async def ticks(self, maxsize: int = 64, resolution: float | None = None) -> AsyncIterator[TickEvent]:
+        """Yield ticks of the running session until the timer becomes IDLE.
+
+        `resolution` is forwarded to `on_tick` (default: `tick_interval`).
+
+        The buffer holds at most `maxsize` ticks; when a consumer falls behind the
+        oldest tick is dropped, since only the latest remaining time matters.
+        """
+
+        queue: asyncio.Queue[TickEvent | None] = asyncio.Queue(maxsize=max(1, maxsize))
+
+        def _put(item: TickEvent | None) -> None:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(item)
+
+        def _on_tick(elapsed: int, remaining: int, state: TimerState) -> None:
+            _put(TickEvent(elapsed, remaining, state))
+
+        def _on_state(state: TimerState) -> None:
+            if state == TimerState.IDLE:
+                _put(None)
+
+        unsub_tick = self.on_tick(_on_tick, resolution=resolution)
+        unsub_state = self.on_state(_on_state)
+        try:
+            if self.state == TimerState.IDLE:
+                return
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                yield item
+        finally:
+            unsub_tick()
+            unsub_state()
+
+
+__all__ = ["AsyncTimerService", "AsyncioScheduler"]
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Literal
+
+BackpressurePolicy = Literal["latest", "drop_oldest", "block"]
+
+# Ticks are only useful while fresh; cycle_end/state must never be lost
+DEFAULT_POLICIES: dict[str, BackpressurePolicy] = {
+    "tick": "latest",
+    "cycle_end": "block",
+    "state": "block",
+}
+
+
+@dataclass(frozen=True)
+class SubscriberMetrics:
+    name: str
+    event: str
+    policy: BackpressurePolicy
+    depth: int
+    max_depth: int
+    delivered: int
+    dropped: int
+    last_lag: float
+    max_lag: float
+
+
+class _Lane:
+    """Queue of pending calls drained by one worker at a time."""
+
+    __slots__ = ("key", "items", "scheduled", "subscribers")
+
+    def __init__(self, key: object) -> None:
+        self.key = key
+        self.items: deque[tuple[_Subscription, tuple[object, ...], float]] = deque()
+        self.scheduled = False
+        self.subscribers = 0
+
+
+class _Subscription:
+    __slots__ = (
+        "name",
+        "event",
+        "callback",
+        "policy",
+        "lane",
+        "pending",
+        "closed",
+        "delivered",
+        "dropped",
+        "max_depth",
+        "last_lag",
+        "max_lag",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        event: str,
+        callback: Callable[..., None],
+        policy: BackpressurePolicy,
+        lane: _Lane,
+    ) -> None:
+        self.name = name
+        self.event = event
+        self.callback = callback
+        self.policy: BackpressurePolicy = policy
+        self.lane = lane
+        self.pending = 0
+        self.closed = False
+        self.delivered = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+
+class ObserverDispatcher:
+    """Run observers off the emitting thread, behind bounded queues.
+
+    - A small worker pool drains the queues; a queue is drained by one worker
+      at a time, so its calls run in order
+    - All guaranteed ("block") events of one consumer share a queue, so e.g.
+      its `cycle_end` callback runs before the `state` emitted after it;
+      coalesced and lossy events get a queue per subscription
+    - Backpressure policy per event type (see `DEFAULT_POLICIES`):
+        "latest"      keep only the newest pending event (latest-wins)
+        "drop_oldest" when full, discard the oldest pending event
+        "block"       when full, the producer waits (guaranteed delivery)
+    - `metrics()` exposes per-subscriber queue depth, drops and lag (time from
+      enqueue until the callback starts)
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        maxsize: int = 256,
+        policies: dict[str, BackpressurePolicy] | None = None,
+        clock: Callable[[], float] | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if workers <= 0:
+            raise ValueError("workers must be > 0")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        self._maxsize = int(maxsize)
+        self._policies: dict[str, BackpressurePolicy] = {**DEFAULT_POLICIES, **(policies or {})}
+        self._clock: Callable[[], float] = clock or time.monotonic
+        self._logger: logging.Logger = logger or logging.getLogger("pomodoro.core")
+
+        self._cond = threading.Condition()
+        self._ready: deque[_Lane] = deque()
+        self._subscriptions: tuple[_Subscription, ...] = ()
+        self._lanes: dict[object, _Lane] = {}
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"ObserverDispatcher-{i}", daemon=True)
+            for i in range(int(workers))
+        ]
+        self._worker_idents: set[int] = set()
+        for thread in self._threads:
+            thread.start()
+            if thread.ident is not None:
+                self._worker_idents.add(thread.ident)
+
+    # Subscription proxies -------------------------------------------------------
+    def wrap(
+        self, event: str, callback: Callable[..., None], consumer: object = None
+    ) -> Callable[..., None]:
+        """Return a proxy that enqueues calls to `callback` instead of running them.
+
+        Guaranteed events wrapped with the same `consumer` (default: the
+        object a bound method belongs to, else the callback) run in the
+        order they were emitted.
+        """
+
+        name = getattr(callback, "__qualname__", None) or repr(callback)
+        policy = self._policies.get(event, "block")
+        if consumer is None:
+            consumer = getattr(callback, "__self__", callback)
+        with self._cond:
+            if policy == "block":
+                lane = self._lanes.get(consumer)
+                if lane is None:
+                    lane = self._lanes[consumer] = _Lane(consumer)
+            else:
+                lane = _Lane(None)
+            lane.subscribers += 1
+            sub = _Subscription(name, event, callback, policy, lane)
+            self._subscriptions = self._subscriptions + (sub,)
+
+        def _enqueue(*args: object) -> None:
+            self._enqueue(sub, args)
+
+        _enqueue.__dispatcher_subscription__ = sub  # type: ignore[attr-defined]
+        return _enqueue
+
+    def release(self, proxy: Callable[..., None]) -> None:
+        """Forget a proxy returned by `wrap()`; pending events are discarded."""
+
+        sub = getattr(proxy, "__dispatcher_subscription__", None)
+        if sub is None:
+            return
+        with self._cond:
+            if sub.closed:
+                return
+            sub.closed = True
+            lane = sub.lane
+            if sub.pending:
+                lane.items = deque(item for item in lane.items if item[0] is not sub)
+                sub.pending = 0
+            lane.subscribers -= 1
+            if lane.subscribers == 0 and self._lanes.get(lane.key) is lane:
+                del self._lanes[lane.key]
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not sub)
+            self._cond.notify_all()
+
+    # Introspection --------------------------------------------------------------
+    def metrics(self) -> list[SubscriberMetrics]:
+        with self._cond:
+            return [
+                SubscriberMetrics(
+                    name=s.name,
+                    event=s.event,
+                    policy=s.policy,
+                    depth=s.pending,
+                    max_depth=s.max_depth,
+                    delivered=s.delivered,
+                    dropped=s.dropped,
+                    last_lag=s.last_lag,
+                    max_lag=s.max_lag,
+                )
+                for s in self._subscriptions
+            ]
+
+    # Lifecycle ------------------------------------------------------------------
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queue is drained; returns False on timeout."""
+
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            while any(s.lane.items or s.lane.scheduled for s in self._subscriptions):
+                remaining = None if deadline is None else deadline - self._clock()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(timeout=remaining)
+            return True
+
+    def shutdown(self, wait: bool = True, timeout: float | None = 2.0) -> None:
+        if wait:
+            self.flush(timeout=timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                if thread is not threading.current_thread():
+                    thread.join(timeout=timeout)
+
+    # Internals ------------------------------------------------------------------
+    def _enqueue(self, sub: _Subscription, args: tuple[object, ...]) -> None:
+        item = (sub, args, self._clock())
+        with self._cond:
+            if not self._running or sub.closed:
+                return
+            lane = sub.lane
+            if sub.policy == "latest":
+                # The lane is this subscription's own
+                sub.dropped += len(lane.items)
+                sub.pending = 0
+                lane.items.clear()
+            elif len(lane.items) >= self._maxsize:
+                if sub.policy == "drop_oldest":
+                    lane.items.popleft()
+                    sub.pending -= 1
+                    sub.dropped += 1
+                elif threading.get_ident() not in self._worker_idents:
+                    # "block": wait for room; never from a worker (it could wait on itself)
+                    while len(lane.items) >= self._maxsize and self._running and not sub.closed:
+                        self._cond.wait()
+                    if not self._running or sub.closed:
+                        return
+            lane.items.append(item)
+            sub.pending += 1
+            if sub.pending > sub.max_depth:
+                sub.max_depth = sub.pending
+            if not lane.scheduled:
+                lane.scheduled = True
+                self._ready.append(lane)
+                self._cond.notify_all()
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._ready:
+                    self._cond.wait()
+                if not self._ready:
+                    return
+                lane = self._ready.popleft()
+                if not lane.items:
+                    lane.scheduled = False
+                    self._cond.notify_all()
+                    continue
+                sub, args, enqueued_at = lane.items.popleft()
+                sub.pending -= 1
+                # Room was made for producers blocked on this queue
+                self._cond.notify_all()
+
+            lag = max(0.0, self._clock() - enqueued_at)
+            try:
+                sub.callback(*args)
+            except Exception:
+                self._logger.exception("callback error in %s (%s)", sub.event, sub.name)
+
+            with self._cond:
+                sub.delivered += 1
+                sub.last_lag = lag
+                if lag > sub.max_lag:
+                    sub.max_lag = lag
+                if lane.items:
+                    self._ready.append(lane)
+                else:
+                    lane.scheduled = False
+                self._cond.notify_all()
+
+
+__all__ = ["ObserverDispatcher", "SubscriberMetrics", "BackpressurePolicy", "DEFAULT_POLICIES"]
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone, tzinfo
 from enum import Enum, auto
+from typing import Any, NamedTuple
 from uuid import UUID
 
 
@@ -28,3 +30,286 @@ class Session:
     state: TimerState
 
 
+_EPOCH = datetime(1970, 1, 1)
+_ONE_US = timedelta(microseconds=1)
+_NO_TS = -(1 << 63)
+# uuid bytes, started_at us, ended_at us, duration_s
+_PACKED = struct.Struct("<16sqqq")
+
+
+def datetime_to_epoch_us(dt: datetime | None) -> int:
+    """Encode a datetime as integer microseconds since 1970-01-01 (`_NO_TS` for None).
+
+    Naive datetimes are encoded as-is (no local-time conversion) so they
+    round-trip exactly; aware ones are normalized to UTC.
+    """
+
+    if dt is None:
+        return _NO_TS
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH) // _ONE_US
+
+
+def epoch_us_to_datetime(us: int, tz: tzinfo | None = None) -> datetime | None:
+    if us == _NO_TS:
+        return None
+    dt = _EPOCH + timedelta(microseconds=us)
+    return dt.replace(tzinfo=timezone.utc).astimezone(tz) if tz is not None else dt
+
+
+class CompactSession:
+    """Memory-compact, attribute-compatible variant of `Session`.
+
+    Uses `__slots__` and packs the UUID, both timestamps (epoch microseconds)
+    and the duration into one 40-byte `bytes` value; `id`, `started_at`,
+    `ended_at` and `duration_s` are decoded on access (and re-packed on
+    assignment). `type` and `state` are plain enum references.
+    """
+
+    __slots__ = ("_packed", "_tz", "type", "state")
+
+    def __init__(
+        self,
+        id: UUID,
+        type: SessionType,
+        duration_s: int,
+        started_at: datetime | None,
+        ended_at: datetime | None,
+        state: TimerState,
+    ) -> None:
+        self._tz = _tz_of(started_at, ended_at)
+        self._packed = _PACKED.pack(
+            id.bytes, datetime_to_epoch_us(started_at), datetime_to_epoch_us(ended_at), int(duration_s)
+        )
+        self.type = type
+        self.state = state
+
+    @classmethod
+    def from_raw(
+        cls,
+        id_bytes: bytes,
+        type: SessionType,
+        duration_s: int,
+        started_us: int,
+        ended_us: int,
+        state: TimerState,
+        tz: tzinfo | None = None,
+    ) -> "CompactSession":
+        """Build from already-encoded values (no datetime/UUID objects created)."""
+
+        obj = cls.__new__(cls)
+        obj._tz = tz
+        obj._packed = _PACKED.pack(id_bytes, started_us, ended_us, duration_s)
+        obj.type = type
+        obj.state = state
+        return obj
+
+    @classmethod
+    def from_session(cls, session: Session) -> "CompactSession":
+        return cls(
+            session.id,
+            session.type,
+            session.duration_s,
+            session.started_at,
+            session.ended_at,
+            session.state,
+        )
+
+    def to_session(self) -> Session:
+        return Session(
+            id=self.id,
+            type=self.type,
+            duration_s=self.duration_s,
+            started_at=self.started_at,
+            ended_at=self.ended_at,
+            state=self.state,
+        )
+
+    # Lazily decoded fields -------------------------------------------------------
+    @property
+    def id(self) -> UUID:
+        return UUID(bytes=self._packed[:16])
+
+    @id.setter
+    def id(self, value: UUID) -> None:
+        self._repack(0, value.bytes)
+
+    @property
+    def started_at(self) -> datetime | None:
+        return epoch_us_to_datetime(_PACKED.unpack(self._packed)[1], self._tz)
+
+    @started_at.setter
+    def started_at(self, value: datetime | None) -> None:
+        self._set_datetime(1, value)
+
+    @property
+    def ended_at(self) -> datetime | None:
+        return epoch_us_to_datetime(_PACKED.unpack(self._packed)[2], self._tz)
+
+    @ended_at.setter
+    def ended_at(self, value: datetime | None) -> None:
+        self._set_datetime(2, value)
+
+    @property
+    def duration_s(self) -> int:
+        return _PACKED.unpack(self._packed)[3]
+
+    @duration_s.setter
+    def duration_s(self, value: int) -> None:
+        self._repack(3, int(value))
+
+    @property
+    def started_at_us(self) -> int | None:
+        us = _PACKED.unpack(self._packed)[1]
+        return None if us == _NO_TS else us
+
+    @property
+    def ended_at_us(self) -> int | None:
+        us = _PACKED.unpack(self._packed)[2]
+        return None if us == _NO_TS else us
+
+    # Helpers ------------------------------------------------------------------------
+    def _set_datetime(self, index: int, value: datetime | None) -> None:
+        if value is not None and value.tzinfo is not None and self._tz is None:
+            others = _PACKED.unpack(self._packed)
+            if others[1] == _NO_TS and others[2] == _NO_TS:
+                self._tz = value.tzinfo
+        self._repack(index, datetime_to_epoch_us(value))
+
+    def _repack(self, index: int, value: Any) -> None:
+        fields = list(_PACKED.unpack(self._packed))
+        fields[index] = value
+        self._packed = _PACKED.pack(*fields)
+
+    def _fields(self) -> tuple[Any, ...]:
+        return (self.id, self.type, self.duration_s, self.started_at, self.ended_at, self.state)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (CompactSession, Session)):
+            return self._fields() == (
+                other.id,
+                other.type,
+                other.duration_s,
+                other.started_at,
+                other.ended_at,
+                other.state,
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]  # mutable, like the Session dataclass
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactSession(id={self.id!r}, type={self.type!r}, duration_s={self.duration_s!r}, "
+            f"started_at={self.started_at!r}, ended_at={self.ended_at!r}, state={self.state!r})"
+        )
+
+
+def _tz_of(*values: datetime | None) -> tzinfo | None:
+    for value in values:
+        if value is not None and value.tzinfo is not None:
+            return value.tzinfo
+    return None
+
+
+@dataclass(frozen=True)
+class TickTiming:
+    """Scheduling metadata of the most recent tick.
+
+    - seq: index of the tick boundary (running elapsed // tick_interval)
+    - deadline: clock time the tick was due
+    - lateness: seconds between `deadline` and the actual wakeup
+    - coalesced: number of missed boundaries (of the subscribed resolutions)
+      folded into this tick
+    """
+
+    seq: int
+    deadline: float
+    lateness: float
+    coalesced: int
+
+
+@dataclass(frozen=True)
+class TimerSnapshot:
+    """Immutable, internally consistent view of a `TimerService`.
+
+    Published by the service on every transition and tick; `remaining` and
+    `elapsed` are as of `taken_at` (service clock). `tick_seq` is the index
+    of the last tick boundary (running elapsed // tick_interval).
+    """
+
+    state: TimerState
+    remaining: float
+    elapsed: float
+    session_id: UUID | None
+    session_type: SessionType | None
+    duration_s: int
+    tick_seq: int
+    plan_index: int | None
+    taken_at: float
+
+
+IDLE_SNAPSHOT = TimerSnapshot(TimerState.IDLE, 0.0, 0.0, None, None, 0, 0, None, 0.0)
+
+
+class TickEvent(NamedTuple):
+    """Tick payload as yielded by tick streams (same order as `on_tick` args)."""
+
+    elapsed: int
+    remaining: int
+    state: TimerState
+
+
+@dataclass(frozen=True)
+class JournalRecord:
+    """One timer state transition as written to the session journal.
+
+    - op: "start", "pause", "resume", "stop" or "finish"
+    - remaining: seconds left in the session right after the transition
+    - mono: service clock reading (only comparable within one process)
+    - wall: wall-clock time of the transition, used to recover across restarts
+    """
+
+    op: str
+    session_id: UUID
+    session_type: SessionType
+    duration_s: int
+    remaining: float
+    mono: float
+    wall: datetime
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """One session of a cycle plan."""
+
+    type: SessionType
+    duration_s: int
+
+
+@dataclass(frozen=True)
+class CyclePlan:
+    """Precomputed sequence of sessions run back to back by `TimerService.start_plan`."""
+
+    steps: tuple[PlanStep, ...]
+
+    @classmethod
+    def pomodoro(
+        cls,
+        focus_s: int = 25 * 60,
+        break_s: int = 5 * 60,
+        long_break_s: int = 15 * 60,
+        cycles: int = 4,
+    ) -> "CyclePlan":
+        """Classic plan: `cycles` focus sessions separated by short breaks, then a long break."""
+
+        steps: list[PlanStep] = []
+        for i in range(cycles):
+            steps.append(PlanStep(SessionType.FOCUS, focus_s))
+            last = i == cycles - 1
+            steps.append(PlanStep(SessionType.BREAK, long_break_s if last else break_s))
+        return cls(tuple(steps))
+
+    def __len__(self) -> int:
+        return len(self.steps)
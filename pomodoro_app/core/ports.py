@@ -1,18 +1,63 @@
 from __future__ import annotations
 
-from typing import Callable, Protocol
+import threading
+from typing import Callable, Generic, Iterator, Protocol, TypeVar
 
-from .models import Session, TimerState
+from .models import JournalRecord, Session, TimerState
 
 # Typed callback aliases
 TickCallback = Callable[[int, int, TimerState], None]
 CycleEndCallback = Callable[[Session], None]
 StateCallback = Callable[[TimerState], None]
 
+_C = TypeVar("_C")
+
+
+class CallbackRegistry(Generic[_C]):
+    """Set-like, copy-on-write callback registry.
+
+    Mutations rebuild the immutable `snapshot` tuple under a lock; readers (event
+    emission) just read the attribute and iterate, without locking or copying.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.snapshot: tuple[_C, ...] = ()
+
+    def add(self, callback: _C) -> None:
+        with self._lock:
+            if callback not in self.snapshot:
+                self.snapshot = self.snapshot + (callback,)
+
+    def discard(self, callback: _C) -> None:
+        with self._lock:
+            if callback in self.snapshot:
+                self.snapshot = tuple(cb for cb in self.snapshot if cb != callback)
+
+    def remove(self, callback: _C) -> None:
+        with self._lock:
+            if callback not in self.snapshot:
+                raise KeyError(callback)
+            self.snapshot = tuple(cb for cb in self.snapshot if cb != callback)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.snapshot = ()
+
+    def __iter__(self) -> Iterator[_C]:
+        return iter(self.snapshot)
+
+    def __len__(self) -> int:
+        return len(self.snapshot)
+
+    def __contains__(self, callback: object) -> bool:
+        return callback in self.snapshot
+
+
 # Minimal module-level registries for callbacks
-TICK_CALLBACKS: set[TickCallback] = set()
-CYCLE_END_CALLBACKS: set[CycleEndCallback] = set()
-STATE_CALLBACKS: set[StateCallback] = set()
+TICK_CALLBACKS: CallbackRegistry[TickCallback] = CallbackRegistry()
+CYCLE_END_CALLBACKS: CallbackRegistry[CycleEndCallback] = CallbackRegistry()
+STATE_CALLBACKS: CallbackRegistry[StateCallback] = CallbackRegistry()
 
 
 class TimerPort(Protocol):
@@ -32,7 +77,7 @@ class TimerPort(Protocol):
         ...
 
     # Registration methods for observers
-    def on_tick(self, callback: TickCallback) -> None:
+    def on_tick(self, callback: TickCallback, resolution: float | None = None) -> None:
         ...
 
     def on_cycle_end(self, callback: CycleEndCallback) -> None:
@@ -42,3 +87,35 @@ class TimerPort(Protocol):
         ...
 
 
+class ScheduledHandle(Protocol):
+    def cancel(self) -> None:
+        ...
+
+
+class SchedulerPort(Protocol):
+    """Engine able to run a callback after a delay (e.g. a shared timing wheel).
+
+    Used by TimerService instead of spawning one ticking thread per timer.
+    """
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> ScheduledHandle:
+        ...
+
+
+class JournalPort(Protocol):
+    """Durable append-only log of timer state transitions.
+
+    `TimerService` appends one record per transition and rebuilds a running
+    or paused session from `recover()` after a crash or restart.
+    """
+
+    def append(self, record: JournalRecord) -> None:
+        ...
+
+    def recover(self) -> list[JournalRecord]:
+        """Return the records of the most recent session, oldest first."""
+        ...
+
+    def reset(self) -> None:
+        """Discard all records (the previous session is no longer needed)."""
+        ...
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+
+class WheelTimer:
+    """Handle for a callback registered on a `TimingWheelScheduler`."""
+
+    __slots__ = ("expires", "callback", "cancelled")
+
+    def __init__(self, expires: int, callback: Callable[[], None]) -> None:
+        self.expires = expires
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class TimingWheelScheduler:
+    """Hierarchical timing wheel driving many timers from a single thread.
+
+    - Time is quantized in `resolution` seconds ("wheel ticks")
+    - Level 0 holds timers due within 2**bits[0] ticks; each higher level covers
+      2**bits[i] slots of the level below and is cascaded down when the lower
+      level wraps around (insert/cancel are O(1))
+    - Expired callbacks run on the wheel thread, or on a small fixed pool when
+      `workers > 0`
+    - The thread parks while the wheel is empty
+    """
+
+    def __init__(
+        self,
+        resolution: float = 0.01,
+        wheel_bits: tuple[int, ...] = (8, 6, 6, 6),
+        workers: int = 0,
+        clock: Callable[[], float] | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if resolution <= 0:
+            raise ValueError("resolution must be > 0")
+        if not wheel_bits or any(b <= 0 for b in wheel_bits):
+            raise ValueError("wheel_bits must be a non-empty tuple of positive ints")
+        self._resolution = float(resolution)
+        self._clock: Callable[[], float] = clock or time.monotonic
+        self._logger: logging.Logger = logger or logging.getLogger("pomodoro.core")
+
+        self._bits = tuple(wheel_bits)
+        self._shifts: list[int] = []
+        shift = 0
+        for b in self._bits:
+            self._shifts.append(shift)
+            shift += b
+        self._masks = [(1 << b) - 1 for b in self._bits]
+        self._range = 1 << shift
+        self._levels: list[list[list[WheelTimer]]] = [[[] for _ in range(1 << b)] for b in self._bits]
+
+        self._origin = self._clock()
+        self._current = 0  # last processed wheel tick
+        self._count = 0
+
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._workers = int(workers)
+        self._pool: ThreadPoolExecutor | None = None
+
+    # Lifecycle ----------------------------------------------------------------
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            if self._workers > 0:
+                self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="TimingWheelWorker")
+            self._thread = threading.Thread(target=self._run, name="TimingWheelThread", daemon=True)
+            self._thread.start()
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+            thread = self._thread
+            pool = self._pool
+            self._thread = None
+            self._pool = None
+        if thread and wait and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "TimingWheelScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.shutdown()
+
+    def __len__(self) -> int:
+        with self._cond:
+            return self._count
+
+    # SchedulerPort --------------------------------------------------------------
+    def call_later(self, delay: float, callback: Callable[[], None]) -> WheelTimer:
+        with self._cond:
+            now_tick = self._tick_for(self._clock())
+            if self._count == 0 and now_tick > self._current:
+                # Wheel was idle: jump forward instead of replaying empty ticks
+                self._current = now_tick
+            deadline = self._clock() + max(0.0, float(delay))
+            expires = max(self._current + 1, -int(-(deadline - self._origin) // self._resolution))
+            timer = WheelTimer(expires, callback)
+            self._insert(timer)
+            self._count += 1
+            self._cond.notify()
+        if not self._running:
+            self.start()
+        return timer
+
+    # Wheel internals ------------------------------------------------------------
+    def _tick_for(self, now: float) -> int:
+        return int((now - self._origin) // self._resolution)
+
+    def _insert(self, timer: WheelTimer) -> None:
+        delta = timer.expires - self._current
+        if delta < 0:
+            timer.expires = self._current
+            delta = 0
+        last = len(self._bits) - 1
+        for level, bits in enumerate(self._bits):
+            if level == last or delta < (1 << (self._shifts[level] + bits)):
+                shift = self._shifts[level]
+                if delta >= self._range:
+                    # Beyond the wheel horizon: park in the slot cascaded last and re-evaluate then
+                    index = ((self._current >> shift) - 1) & self._masks[level]
+                else:
+                    index = (timer.expires >> shift) & self._masks[level]
+                self._levels[level][index].append(timer)
+                return
+
+    def _cascade(self, level: int) -> None:
+        index = (self._current >> self._shifts[level]) & self._masks[level]
+        slot = self._levels[level][index]
+        if not slot:
+            return
+        self._levels[level][index] = []
+        for timer in slot:
+            if timer.cancelled:
+                self._count -= 1
+            else:
+                self._insert(timer)
+
+    def _advance_to(self, target: int) -> list[WheelTimer]:
+        expired: list[WheelTimer] = []
+        while self._current < target and self._count > 0:
+            self._current += 1
+            for level in range(1, len(self._bits)):
+                if (self._current >> self._shifts[level - 1]) & self._masks[level - 1]:
+                    break
+                self._cascade(level)
+            slot = self._levels[0][self._current & self._masks[0]]
+            if slot:
+                self._levels[0][self._current & self._masks[0]] = []
+                self._count -= len(slot)
+                expired.extend(t for t in slot if not t.cancelled)
+        if self._count == 0 and self._current < target:
+            self._current = target
+        return expired
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                if self._count == 0:
+                    self._cond.wait()
+                    continue
+                now = self._clock()
+                target = self._tick_for(now)
+                if target <= self._current:
+                    wake_at = self._origin + (self._current + 1) * self._resolution
+                    self._cond.wait(timeout=max(0.0, wake_at - now))
+                    continue
+                expired = self._advance_to(target)
+                pool = self._pool
+
+            for timer in expired:
+                if pool is not None:
+                    pool.submit(self._fire, timer)
+                else:
+                    self._fire(timer)
+
+    def _fire(self, timer: WheelTimer) -> None:
+        if timer.cancelled:
+            return
+        try:
+            timer.callback()
+        except Exception:
+            self._logger.exception("scheduled callback failed")
+
+
+__all__ = ["TimingWheelScheduler", "WheelTimer"]
@@ -1,34 +1,96 @@
 from __future__ import annotations
 
+import dataclasses
+import functools
 import logging
 import threading
-from typing import Callable, Literal
-
-from .models import Session, SessionType, TimerState
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, Iterable, Literal
+
+from .models import (
+    IDLE_SNAPSHOT,
+    CyclePlan,
+    JournalRecord,
+    PlanStep,
+    Session,
+    SessionType,
+    TickTiming,
+    TimerSnapshot,
+    TimerState,
+)
 from .errors import InvalidDurationError, InvalidStateError
 from .ports import (
     CYCLE_END_CALLBACKS,
     STATE_CALLBACKS,
     TICK_CALLBACKS,
+    CallbackRegistry,
     CycleEndCallback,
+    JournalPort,
+    ScheduledHandle,
+    SchedulerPort,
     StateCallback,
     TickCallback,
 )
 
+if TYPE_CHECKING:
+    from .dispatch import ObserverDispatcher
+
 
 class TimerService:
-    """Skeleton for the TimerService; ticking loop is implemented in subtask 2.4."""
+    """Pomodoro timer state machine with observer callbacks.
+
+    By default the service owns one long-lived `TimerServiceThread`, started on
+    the first session and parked while IDLE (`close()` ends it). When a shared
+    `scheduler` (see `core.scheduler.TimingWheelScheduler`) is given, ticks are
+    registered with it instead and no thread is spawned.
+
+    `start_plan()` runs a `CyclePlan` (e.g. focus -> break -> ... -> long
+    break): each finished session is replaced by the next one atomically, at
+    the exact end boundary, without passing through IDLE.
+
+    Tick modes:
+      - "interval" (default): sleep `tick_interval` after each tick; boundaries
+        drift by the time spent in callbacks
+      - "deadline": wake at absolute boundaries of the running time
+        (k * tick_interval since session start); missed boundaries are coalesced
+        into a single catch-up tick. `last_tick_timing` reports the lateness.
+
+    With an `ObserverDispatcher`, service-level observers run on its worker pool
+    behind bounded per-subscriber queues instead of on the ticking thread.
+
+    Tick observers may declare a `resolution` (e.g. 60.0 for minute updates);
+    the loop only wakes for boundaries some subscriber needs. Without any tick
+    subscriber it sleeps straight to the end of the session.
+
+    `snapshot()` returns an immutable `TimerSnapshot` (state, remaining,
+    elapsed, session, tick sequence) without locking; it is republished on
+    every transition and tick.
+
+    With a `journal`, every transition (start/pause/resume/stop/finish) is
+    appended to it and `recover()` restores a session interrupted by a crash
+    or restart.
+    """
 
     def __init__(
         self,
         tick_interval: float = 1.0,
         clock: Callable[[], float] | None = None,
         logger: logging.Logger | None = None,
+        scheduler: SchedulerPort | None = None,
+        tick_mode: Literal["interval", "deadline"] = "interval",
+        dispatcher: ObserverDispatcher | None = None,
+        wall_clock: Callable[[], datetime] | None = None,
+        journal: JournalPort | None = None,
     ) -> None:
         if tick_interval <= 0:
             raise ValueError("tick_interval must be > 0")
+        if tick_mode not in ("interval", "deadline"):
+            raise ValueError("tick_mode must be 'interval' or 'deadline'")
         self._tick_interval: float = tick_interval
+        self._tick_mode: Literal["interval", "deadline"] = tick_mode
         self._clock: Callable[[], float] = clock or __import__("time").monotonic
+        # Source of Session.started_at/ended_at timestamps
+        self._wall_clock: Callable[[], datetime] = wall_clock or datetime.now
         self._logger: logging.Logger = logger or logging.getLogger("pomodoro.core")
 
         self.state: TimerState = TimerState.IDLE
@@ -38,31 +100,90 @@ class TimerService:
         self._lock = threading.RLock()
         self._thread: threading.Thread | None = None
         self._shutdown_event = threading.Event()
-
-        # Local observer registry; service-level callbacks (separate from module-level)
-        self._observers: dict[str, set[Callable[..., None]]] = {
-            "tick": set(),
-            "cycle_end": set(),
-            "state": set(),
+        self._closed = threading.Event()
+        self._scheduler: SchedulerPort | None = scheduler
+        self._dispatcher: ObserverDispatcher | None = dispatcher
+        self._journal: JournalPort | None = journal
+        self._scheduled: ScheduledHandle | None = None
+        self._generation: int = 0
+        self._last: float = 0.0
+        self._deadline: float = 0.0
+        self.last_tick_timing: TickTiming | None = None
+        self._wakeup = threading.Event()
+        # Remaining steps of the running cycle plan and the index of the current one
+        self._plan: tuple[PlanStep, ...] = ()
+        self._plan_index: int | None = None
+        # Replaced (never mutated) under the lock; readers just load the reference
+        self._snapshot: TimerSnapshot = IDLE_SNAPSHOT
+
+        # Local observer registry; service-level callbacks (separate from module-level).
+        # Copy-on-write: tuples are rebuilt on (un)subscribe so _emit never locks or copies.
+        self._observers: dict[str, tuple[Callable[..., None], ...]] = {
+            "tick": (),
+            "cycle_end": (),
+            "state": (),
         }
+        # Tick resolution per observer and the derived (resolution, callbacks) groups
+        self._tick_resolutions: dict[Callable[..., None], float] = {}
+        self._tick_groups: tuple[tuple[float, tuple[Callable[..., None], ...]], ...] = ()
+        # Last delivered boundary index per resolution for the running session
+        self._group_seq: dict[float, int] = {}
 
     # Observer registration -----------------------------------------------------
-    def on_tick(self, callback: TickCallback) -> Callable[[], None]:
-        return self.on("tick", callback)
+    def on_tick(self, callback: TickCallback, resolution: float | None = None) -> Callable[[], None]:
+        """Subscribe to ticks every `resolution` seconds (default: `tick_interval`)."""
+
+        return self.on("tick", callback, resolution=resolution)
 
-    def on_cycle_end(self, callback: CycleEndCallback) -> Callable[[], None]:
-        return self.on("cycle_end", callback)
+    def on_cycle_end(
+        self, callback: CycleEndCallback, consumer: object = None
+    ) -> Callable[[], None]:
+        return self.on("cycle_end", callback, consumer=consumer)
 
-    def on_state(self, callback: StateCallback) -> Callable[[], None]:
-        return self.on("state", callback)
+    def on_state(self, callback: StateCallback, consumer: object = None) -> Callable[[], None]:
+        return self.on("state", callback, consumer=consumer)
 
-    def on(self, event: Literal["tick", "cycle_end", "state"], callback: Callable[..., None]) -> Callable[[], None]:
+    def on(
+        self,
+        event: Literal["tick", "cycle_end", "state"],
+        callback: Callable[..., None],
+        resolution: float | None = None,
+        consumer: object = None,
+    ) -> Callable[[], None]:
+        """Subscribe `callback` to `event`; returns an unsubscribe callable.
+
+        With a dispatcher, guaranteed events of one `consumer` are delivered
+        in emission order (see `ObserverDispatcher.wrap`).
+        """
+
+        if resolution is not None and resolution <= 0:
+            raise ValueError("resolution must be > 0")
+        dispatcher = self._dispatcher
+        if dispatcher is not None:
+            callback = dispatcher.wrap(event, callback, consumer=consumer)
         with self._lock:
-            self._observers[event].add(callback)
+            current = self._observers[event]
+            if callback not in current:
+                self._observers[event] = current + (callback,)
+            if event == "tick":
+                r = float(resolution) if resolution is not None else self._tick_interval
+                self._tick_resolutions[callback] = r
+                if r not in self._group_seq and self._current_session is not None:
+                    # Joining mid-session: count boundaries from now on
+                    elapsed = self._running_elapsed(self._clock())
+                    self._group_seq[r] = int(elapsed / r + 1e-9)
+                self._rebuild_tick_groups()
+                # A finer resolution may need an earlier wakeup than the one pending
+                self._reschedule()
 
         def _unsubscribe() -> None:
             with self._lock:
-                self._observers[event].discard(callback)
+                self._observers[event] = tuple(cb for cb in self._observers[event] if cb != callback)
+                if event == "tick":
+                    self._tick_resolutions.pop(callback, None)
+                    self._rebuild_tick_groups()
+            if dispatcher is not None:
+                dispatcher.release(callback)
 
         return _unsubscribe
 
@@ -73,11 +194,48 @@ class TimerService:
     def start_break(self, dur_s: int | None = None) -> None:
         self._start(SessionType.BREAK, dur_s)
 
+    def start_plan(self, plan: CyclePlan | Iterable[PlanStep | tuple[SessionType, int]]) -> None:
+        """Run the sessions of `plan` back to back.
+
+        Emits `cycle_end` for every finished session followed directly by the
+        state of the next one; IDLE is only reached after the last step (or on
+        `stop()`, which abandons the rest of the plan).
+        """
+
+        steps = tuple(
+            step if isinstance(step, PlanStep) else PlanStep(*step)
+            for step in (plan.steps if isinstance(plan, CyclePlan) else plan)
+        )
+        if not steps:
+            raise ValueError("plan must contain at least one step")
+        if any(step.duration_s <= 0 for step in steps):
+            raise InvalidDurationError("duration must be positive")
+        self._start(steps[0].type, steps[0].duration_s, plan=steps)
+
+    def snapshot(self) -> TimerSnapshot:
+        """Return the latest published state; never blocks on the timer lock."""
+
+        return self._snapshot
+
+    @property
+    def plan_index(self) -> int | None:
+        """Index of the running step of the current plan (None without a plan)."""
+
+        return self._plan_index
+
     def pause(self) -> None:
         with self._lock:
             if self.state not in (TimerState.RUNNING_FOCUS, TimerState.RUNNING_BREAK):
                 raise InvalidStateError("pause() only valid when timer is running")
+            # Account for the running time since the last tick before freezing
+            now = self._clock()
+            self._remaining = max(0.0, self._remaining - max(0.0, now - self._last))
+            self._last = now
             self.state = TimerState.PAUSED
+            self._journal_append("pause")
+            self._publish(now)
+            # Park the loop: no wakeups until resume()
+            self._reschedule()
             self._logger.info("Timer paused")
         self._emit("state", self.state)
 
@@ -92,33 +250,67 @@ class TimerService:
                 if self._current_session.type == SessionType.FOCUS
                 else TimerState.RUNNING_BREAK
             )
+            self._last = self._clock()
+            self._journal_append("resume")
+            self._publish(self._last)
+            self._reschedule()
             self._logger.info("Timer resumed")
         self._emit("state", self.state)
 
     def stop(self) -> None:
-        from datetime import datetime
-
         # Signal loop to shutdown promptly
         self._shutdown_event.set()
         with self._lock:
+            self._cancel_scheduled()
             if self._current_session and self._current_session.ended_at is None:
-                self._current_session.ended_at = datetime.now()
+                self._current_session.ended_at = self._wall_clock()
+            if self.state != TimerState.IDLE:
+                self._journal_append("stop")
             self.state = TimerState.IDLE
             self._remaining = 0.0
+            self._plan = ()
+            self._plan_index = None
+            self._publish(self._clock())
             self._logger.info("Timer stopped")
+        # The worker thread notices IDLE and parks
+        self._wakeup.set()
+        self._emit("state", self.state)
+
+    def close(self, keep_session: bool = False) -> None:
+        """Stop the timer and end the worker thread (a later start spawns a new one).
+
+        With `keep_session` (application shutdown), a running or paused
+        session is not stopped: the service just lets go of it without
+        journaling a transition or emitting `state`, so `recover()` resumes
+        it on the next start.
+        """
+
+        if keep_session:
+            with self._lock:
+                self._cancel_scheduled()
+                if self._current_session is not None and self.state != TimerState.IDLE:
+                    self._logger.info("Leaving session %s to the journal", self._current_session.id)
+                self.state = TimerState.IDLE
+                self._current_session = None
+                self._remaining = 0.0
+                self._plan = ()
+                self._plan_index = None
+                self._publish(self._clock())
+        elif self.state != TimerState.IDLE:
+            self.stop()
+        self._closed.set()
+        self._wakeup.set()
         # Join thread outside of lock to avoid deadlocks
         self._join_thread_if_running(timeout=2.0)
         with self._lock:
             # Clear thread reference for idempotency and to allow restarts
             if self._thread and not self._thread.is_alive():
                 self._thread = None
-        self._emit("state", self.state)
 
     # Internal helpers ---------------------------------------------------------
-    def _start(self, session_type: SessionType, dur_s: int | None) -> None:
-        from datetime import datetime
-        from uuid import uuid4
-
+    def _start(
+        self, session_type: SessionType, dur_s: int | None, plan: tuple[PlanStep, ...] = ()
+    ) -> None:
         DEFAULT_FOCUS_SECONDS = 25 * 60
         DEFAULT_BREAK_SECONDS = 5 * 60
 
@@ -138,37 +330,164 @@ class TimerService:
             if duration <= 0:
                 raise InvalidDurationError("duration must be positive")
 
-            self._current_session = Session(
-                id=uuid4(),
-                type=session_type,
-                duration_s=int(duration),
-                started_at=datetime.now(),
+            self._plan = plan
+            self._plan_index = 0 if plan else None
+            self._begin_session(session_type, int(duration))
+            self._start_loop()
+            self._publish(self._last)
+        # Emit state change outside of lock
+        self._emit("state", self.state)
+
+    def recover(self) -> bool:
+        """Restore the session left running or paused by a crash or restart.
+
+        Reads the journal: a paused session comes back paused with the same
+        remaining time; a running one is advanced by the wall-clock time that
+        passed since its last record, and emits `cycle_end` right away if it
+        finished meanwhile. Returns True when a session was restored.
+        """
+
+        if self._journal is None:
+            return False
+        records = self._journal.recover()
+        if not records or records[0].op != "start" or records[-1].op in ("stop", "finish"):
+            return False
+        first, last = records[0], records[-1]
+        running_state = (
+            TimerState.RUNNING_FOCUS if first.session_type == SessionType.FOCUS else TimerState.RUNNING_BREAK
+        )
+        with self._lock:
+            if self.state != TimerState.IDLE:
+                raise InvalidStateError("recover() only valid when timer is idle")
+            remaining = last.remaining
+            if last.op != "pause":
+                # Monotonic readings do not survive a restart; use wall time
+                remaining -= max(0.0, (self._wall_clock() - last.wall).total_seconds())
+            session = Session(
+                id=first.session_id,
+                type=first.session_type,
+                duration_s=first.duration_s,
+                started_at=first.wall,
                 ended_at=None,
-                state=TimerState.IDLE,  # will be updated below
+                state=running_state,
             )
+            self._current_session = session
+            if remaining <= 0:
+                # Finished while the process was down
+                session.ended_at = last.wall + timedelta(seconds=last.remaining)
+                self._remaining = 0.0
+                self._journal_append("finish")
+                self._publish(self._clock())
+                self._logger.info("Recovered session %s finished while stopped", session.id)
+            else:
+                self._remaining = remaining
+                self.state = TimerState.PAUSED if last.op == "pause" else running_state
+                self._logger.info(
+                    "Recovered %s session %s with %.0fs left", self.state.name.lower(), session.id, remaining
+                )
+                self._start_loop()
+                self._publish(self._last)
+            state = self.state
+        if state == TimerState.IDLE:
+            self._emit("cycle_end", session)
+        else:
+            self._emit("state", state)
+        return True
 
-            self._remaining = float(duration)
-            self.state = (
-                TimerState.RUNNING_FOCUS
-                if session_type == SessionType.FOCUS
-                else TimerState.RUNNING_BREAK
-            )
-            self._current_session.state = self.state
-            self._logger.info(
-                "Timer started: %s for %ss", session_type.name.lower(), int(duration)
-            )
+    def _begin_session(self, session_type: SessionType, duration: int) -> None:
+        # Caller holds the lock
+        from uuid import uuid4
 
-            # prepare and start loop
-            self._shutdown_event.clear()
+        self._current_session = Session(
+            id=uuid4(),
+            type=session_type,
+            duration_s=duration,
+            started_at=self._wall_clock(),
+            ended_at=None,
+            state=TimerState.IDLE,  # will be updated below
+        )
+
+        self._remaining = float(duration)
+        self.state = (
+            TimerState.RUNNING_FOCUS
+            if session_type == SessionType.FOCUS
+            else TimerState.RUNNING_BREAK
+        )
+        self._current_session.state = self.state
+        if self._journal is not None:
+            # Only the current session is ever needed for recovery
+            self._journal_reset()
+        self._journal_append("start")
+        self._logger.info("Timer started: %s for %ss", session_type.name.lower(), duration)
+
+    def _start_loop(self) -> None:
+        # Caller holds the lock; boundaries already passed are not re-delivered
+        self._last = self._clock()
+        elapsed = self._running_elapsed(self._last)
+        self._group_seq = {r: int(elapsed / r + 1e-9) for r in self._active_resolutions()}
+        self.last_tick_timing = None
+        self._shutdown_event.clear()
+        if self._scheduler is not None:
+            self._cancel_scheduled()
+            self._schedule_next()
+        else:
             self._spawn_thread()
-        # Emit state change outside of lock
-        self._emit("state", self.state)
+
+    def _publish(self, now: float) -> None:
+        # Caller holds the lock; one reference swap makes the new view visible
+        session = self._current_session
+        if self.state == TimerState.IDLE or session is None:
+            self._snapshot = dataclasses.replace(IDLE_SNAPSHOT, taken_at=now)
+            return
+        elapsed = self._running_elapsed(now)
+        self._snapshot = TimerSnapshot(
+            state=self.state,
+            remaining=max(0.0, session.duration_s - elapsed),
+            elapsed=elapsed,
+            session_id=session.id,
+            session_type=session.type,
+            duration_s=session.duration_s,
+            tick_seq=int(elapsed / self._tick_interval + 1e-9),
+            plan_index=self._plan_index,
+            taken_at=now,
+        )
+
+    def _journal_append(self, op: str) -> None:
+        # Caller holds the lock, so records are written in transition order
+        journal = self._journal
+        session = self._current_session
+        if journal is None or session is None:
+            return
+        try:
+            journal.append(
+                JournalRecord(
+                    op=op,
+                    session_id=session.id,
+                    session_type=session.type,
+                    duration_s=session.duration_s,
+                    remaining=self._remaining,
+                    mono=self._clock(),
+                    wall=self._wall_clock(),
+                )
+            )
+        except Exception:
+            # Losing crash safety must not stop the timer itself
+            self._logger.exception("failed to append %s to the journal", op)
+
+    def _journal_reset(self) -> None:
+        try:
+            self._journal.reset()  # type: ignore[union-attr]
+        except Exception:
+            self._logger.exception("failed to reset the journal")
 
     # Internal ticking loop (implemented for subtask 2.4) ---------------------
     def _spawn_thread(self) -> None:
         with self._lock:
-            if self._thread and self._thread.is_alive():
+            if self._thread and self._thread.is_alive() and not self._closed.is_set():
+                # Unpark the existing worker
+                self._wakeup.set()
                 return
+            self._closed.clear()
             self._shutdown_event.clear()
             self._thread = threading.Thread(target=self._run_loop, name="TimerServiceThread", daemon=True)
             self._thread.start()
@@ -184,80 +503,220 @@ class TimerService:
 
     @property
     def is_running(self) -> bool:
-        with self._lock:
-            return self.state in (TimerState.RUNNING_FOCUS, TimerState.RUNNING_BREAK)
+        return self._snapshot.state in (TimerState.RUNNING_FOCUS, TimerState.RUNNING_BREAK)
 
     @property
     def is_paused(self) -> bool:
-        with self._lock:
-            return self.state == TimerState.PAUSED
+        return self._snapshot.state == TimerState.PAUSED
 
     def _run_loop(self) -> None:
-        import time
+        while not self._closed.is_set():
+            self._wakeup.clear()
+            with self._lock:
+                parked = self.state in (TimerState.IDLE, TimerState.PAUSED)
+            if parked:
+                # Nothing to time: sleep until a control call (start/resume/close) wakes us
+                self._wakeup.wait()
+                continue
+            delay = self._next_delay(self._clock())
+            if delay > 0 and self._wakeup.wait(delay):
+                # Interrupted (stop, new subscriber, new session): recompute the next wakeup
+                continue
+            self._advance(self._clock())
+
+    def _next_delay(self, now: float) -> float:
+        """Return seconds to wait before the next tick and record its deadline."""
 
-        last = self._clock()
-        while not self._shutdown_event.is_set():
-            time.sleep(self._tick_interval)
-            now = self._clock()
+        with self._lock:
+            resolutions = self._active_resolutions()
+            total = float(self._current_session.duration_s) if self._current_session else 0.0
+            elapsed = self._running_elapsed(now)
+            if self.state == TimerState.PAUSED:
+                # Not normally reached: paused timers are parked, not polled
+                delay = self._tick_interval
+            elif not resolutions:
+                # Nobody needs ticks: only the end of the session matters
+                delay = max(0.0, total - elapsed)
+            elif self._tick_mode == "interval":
+                # Coarse subscribers must not postpone the end of the session
+                delay = min(min(resolutions), max(0.0, total - elapsed))
+            else:
+                # Next absolute boundary any subscriber needs, capped at the session end
+                next_boundary = min((int(elapsed / r + 1e-9) + 1) * r for r in resolutions)
+                delay = max(0.0, min(next_boundary, total) - elapsed)
+            self._deadline = now + delay
+            return delay
+
+    def _running_elapsed(self, now: float) -> float:
+        # Caller holds the lock
+        total = float(self._current_session.duration_s) if self._current_session else 0.0
+        elapsed = max(0.0, total - self._remaining)
+        if self.state in (TimerState.RUNNING_FOCUS, TimerState.RUNNING_BREAK):
+            elapsed += max(0.0, now - self._last)
+        return elapsed
+
+    def _active_resolutions(self) -> list[float]:
+        resolutions = [r for r, _ in self._tick_groups]
+        if TICK_CALLBACKS.snapshot and self._tick_interval not in resolutions:
+            resolutions.append(self._tick_interval)
+        return resolutions
+
+    def _rebuild_tick_groups(self) -> None:
+        # Caller holds the lock
+        groups: dict[float, list[Callable[..., None]]] = {}
+        for cb in self._observers["tick"]:
+            groups.setdefault(self._tick_resolutions.get(cb, self._tick_interval), []).append(cb)
+        self._tick_groups = tuple((r, tuple(cbs)) for r, cbs in sorted(groups.items(), key=lambda kv: kv[0]))
+
+    def _reschedule(self) -> None:
+        # Caller holds the lock; wake the loop so it recomputes its next deadline
+        if self._scheduler is None:
+            self._wakeup.set()
+        elif self.state in (TimerState.RUNNING_FOCUS, TimerState.RUNNING_BREAK):
+            self._cancel_scheduled()
+            self._schedule_next()
+        else:
+            # Paused or idle: drop the pending tick instead of polling
+            self._cancel_scheduled()
+
+    # Shared scheduler path ----------------------------------------------------
+    def _schedule_next(self) -> None:
+        # Caller holds the lock
+        assert self._scheduler is not None
+        callback = functools.partial(self._on_scheduled_tick, self._generation)
+        self._scheduled = self._scheduler.call_later(self._next_delay(self._clock()), callback)
+
+    def _cancel_scheduled(self) -> None:
+        # Caller holds the lock; bumping the generation drops in-flight callbacks
+        self._generation += 1
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+            self._scheduled = None
+
+    def _on_scheduled_tick(self, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation or self._shutdown_event.is_set():
+                return
+            self._scheduled = None
+        if not self._advance(self._clock()):
+            return
+        with self._lock:
+            if generation == self._generation and self._scheduled is None:
+                self._schedule_next()
 
-            with self._lock:
-                # Only progress time while running; paused keeps last synced
-                if self.state == TimerState.PAUSED:
-                    last = now
-                    continue
-
-                if self.state not in (TimerState.RUNNING_FOCUS, TimerState.RUNNING_BREAK):
-                    # Not actively running; end the loop gracefully
-                    break
-
-                delta = max(0.0, now - last)
-                last = now
-                self._remaining = max(0.0, self._remaining - delta)
-
-                # Prepare tick payload while holding the lock
-                if self._current_session is not None:
-                    elapsed_i = int(self._current_session.duration_s - self._remaining)
-                    remaining_i = int(self._remaining)
-                else:
-                    elapsed_i = 0
-                    remaining_i = int(self._remaining)
-                state_now = self.state
+    def _advance(self, now: float) -> bool:
+        """Progress the running session to `now` and emit events.
+
+        Returns False once the loop/scheduler chain should end.
+        """
 
-                # Has the session finished?
-                if self._remaining <= 0:
-                    from datetime import datetime
+        with self._lock:
+            # Only progress time while running; paused keeps last synced
+            if self.state == TimerState.PAUSED:
+                self._last = now
+                return True
 
-                    finished_session = self._current_session
-                    if finished_session is not None and finished_session.ended_at is None:
-                        finished_session.ended_at = datetime.now()
+            if self.state not in (TimerState.RUNNING_FOCUS, TimerState.RUNNING_BREAK):
+                # Not actively running; end the loop gracefully
+                return False
+
+            delta = max(0.0, now - self._last)
+            # Time past the end of the session, credited to the next plan step
+            overshoot = max(0.0, delta - self._remaining)
+            self._last = now
+            self._remaining = max(0.0, self._remaining - delta)
+            if self._remaining < 1e-6:
+                self._remaining = 0.0
+
+            # Prepare tick payloads while holding the lock: one per resolution that
+            # crossed a boundary since its last delivery
+            total = float(self._current_session.duration_s) if self._current_session else 0.0
+            elapsed_f = total - self._remaining
+            state_now = self.state
+            deliveries: list[tuple[tuple[Callable[..., None], ...], tuple[object, ...]]] = []
+            coalesced = 0
+            if self._remaining > 0:
+                groups = list(self._tick_groups)
+                module_callbacks = TICK_CALLBACKS.snapshot
+                if module_callbacks:
+                    groups.append((self._tick_interval, module_callbacks))
+                due: dict[float, tuple[object, ...] | None] = {}
+                for r, callbacks in groups:
+                    if r not in due:
+                        bucket = int(elapsed_f / r + 1e-9)
+                        last = self._group_seq.get(r, 0)
+                        if bucket > last:
+                            coalesced = max(coalesced, bucket - last - 1)
+                            self._group_seq[r] = bucket
+                            due[r] = self._tick_payload(total, bucket * r, state_now)
+                        else:
+                            due[r] = None
+                    payload = due[r]
+                    if payload is not None:
+                        deliveries.append((callbacks, payload))
+                if not deliveries:
+                    # Woke before any boundary a subscriber needs; nothing to report
+                    return True
+
+            self.last_tick_timing = TickTiming(
+                seq=int(elapsed_f / self._tick_interval + 1e-9),
+                deadline=self._deadline,
+                lateness=max(0.0, now - self._deadline),
+                coalesced=coalesced,
+            )
+            if coalesced and self._tick_mode == "deadline":
+                self._logger.debug("Coalesced %d missed ticks (late by %.3fs)", coalesced, now - self._deadline)
+
+            # Has the session finished?
+            if self._remaining <= 0:
+                finished_session = self._current_session
+                if finished_session is not None and finished_session.ended_at is None:
+                    finished_session.ended_at = self._wall_clock()
+                self._journal_append("finish")
+                if self._plan_index is not None and self._plan_index + 1 < len(self._plan):
+                    # Next plan step, in the same critical section: no IDLE gap
+                    self._plan_index += 1
+                    step = self._plan[self._plan_index]
+                    self._begin_session(step.type, step.duration_s)
+                    self._last = now - overshoot
+                    self._group_seq = {}
+                    self._deadline = now
+                else:
                     # Transition to IDLE; emit outside the lock
+                    self._plan = ()
+                    self._plan_index = None
                     self.state = TimerState.IDLE
-                    state_after = self.state
-                else:
-                    finished_session = None
-                    state_after = None
-
-            # Outside lock: emit tick or cycle_end/state
-            if finished_session is not None:
-                self._emit("cycle_end", finished_session)
-                self._emit("state", state_after or TimerState.IDLE)
-                break
+                state_after = self.state
             else:
-                self._emit("tick", elapsed_i, remaining_i, state_now)
+                finished_session = None
+                state_after = None
+            self._publish(now)
+
+        # Outside lock: emit tick or cycle_end/state
+        if finished_session is not None:
+            self._emit("cycle_end", finished_session)
+            self._emit("state", state_after or TimerState.IDLE)
+            return state_after not in (None, TimerState.IDLE)
+        for callbacks, payload in deliveries:
+            self._call_all("tick", callbacks, payload)
+        return True
+
+    def _tick_payload(self, total: float, boundary: float, state: TimerState) -> tuple[object, ...]:
+        # Caller holds the lock
+        if self._tick_mode == "deadline":
+            # Report the boundary itself so displayed seconds never skip/repeat
+            boundary = min(total, round(boundary, 6))
+            return (int(boundary), int(total - boundary), state)
+        return (int(total - self._remaining), int(self._remaining), state)
 
     # Event emission helpers ---------------------------------------------------
     def _emit(self, event: Literal["tick", "cycle_end", "state"], *args: object) -> None:
-        # Collect callbacks from service-local observers and module-level registries
-        with self._lock:
-            local_callbacks = list(self._observers[event])
-        if event == "tick":
-            module_callbacks = list(TICK_CALLBACKS)
-        elif event == "cycle_end":
-            module_callbacks = list(CYCLE_END_CALLBACKS)
-        else:
-            module_callbacks = list(STATE_CALLBACKS)
+        # Service-local observers first, then module-level registries; both are
+        # immutable snapshots, so no lock or copy is needed here
+        self._call_all(event, self._observers[event], args)
+        self._call_all(event, _MODULE_REGISTRIES[event].snapshot, args)
 
-        callbacks: list[Callable[..., None]] = local_callbacks + module_callbacks
+    def _call_all(self, event: str, callbacks: tuple[Callable[..., None], ...], args: tuple[object, ...]) -> None:
         for cb in callbacks:
             try:
                 cb(*args)
@@ -266,3 +725,8 @@ class TimerService:
                 self._logger.exception("callback error in %s", event)
 
 
+_MODULE_REGISTRIES: dict[str, CallbackRegistry[Callable[..., None]]] = {
+    "tick": TICK_CALLBACKS,  # type: ignore[dict-item]
+    "cycle_end": CYCLE_END_CALLBACKS,  # type: ignore[dict-item]
+    "state": STATE_CALLBACKS,  # type: ignore[dict-item]
+}
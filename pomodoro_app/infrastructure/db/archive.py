@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import re
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+from pomodoro_app.core.models import datetime_to_epoch_us, epoch_us_to_datetime
+from pomodoro_app.infrastructure.logging import get_logger
+
+from .connection import connect
+from .pool import ConnectionPool
+from .schema import DAY_US, ensure_schema
+from .utils import transaction
+
+
+logger = get_logger("pomodoro.infrastructure.db")
+
+T = TypeVar("T")
+
+_SHARD_NAME = re.compile(r"^sessions-(\d{4})\.sqlite3$")
+_ARCHIVED_COLUMNS = (
+    "seq, id, type, duration_s, started_at, ended_at, state, started_at_us, ended_at_us, elapsed_s"
+)
+
+
+def year_bounds_us(year: int) -> tuple[int, int]:
+    """First and last epoch microsecond of `year`, as stored in `started_at_us`."""
+
+    first = datetime_to_epoch_us(datetime(year, 1, 1))
+    return first, datetime_to_epoch_us(datetime(year + 1, 1, 1)) - 1
+
+
+# Read-only shard connections of this process; worker processes keep theirs between tasks
+_shard_connections: dict[Path, sqlite3.Connection] = {}
+_shard_lock = threading.Lock()
+
+
+def shard_connection(path: Path) -> sqlite3.Connection:
+    """Cached read-only connection to an archive shard, opened on first use."""
+
+    path = Path(path).resolve()
+    with _shard_lock:
+        conn = _shard_connections.get(path)
+        if conn is None:
+            conn = sqlite3.connect(
+                f"{path.as_uri()}?mode=ro", uri=True, isolation_level=None, check_same_thread=False
+            )
+            _shard_connections[path] = conn
+        return conn
+
+
+def _close_shard_connections(directory: Path) -> None:
+    with _shard_lock:
+        for path in [p for p in _shard_connections if p.parent == directory]:
+            _shard_connections.pop(path).close()
+
+
+class SessionArchive:
+    """Per-year archive databases for sessions older than the live table.
+
+    `archive_before(conn, year)` moves every session started before `year`
+    out of the live `sessions` table into `sessions-<year>.sqlite3` files in
+    `directory`, one per calendar year of `started_at`. Each shard has the
+    full schema, `daily_stats` rollup included, so it can be aggregated on
+    its own. Undated sessions always stay live.
+
+    Readers combine shards and the live table: `SessionRepository` ATTACHes
+    the shards a query touches for the duration of that query (SQLite caps
+    attached databases at 10, so they are never all attached at once), and
+    `StatsService` aggregates each shard separately through `map()`, which
+    fans out across a `ProcessPoolExecutor` (one task per shard, up to
+    `max_workers` processes, default: CPU count) when more than one shard
+    is involved and `parallel` is set. Workers use the "spawn" start method,
+    since forking a process that runs database threads can copy held locks.
+    Call `close()` to shut the workers down.
+    """
+
+    def __init__(
+        self, directory: Path, parallel: bool = True, max_workers: int | None = None
+    ) -> None:
+        self._directory = Path(directory)
+        self._parallel = parallel
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._years = self._scan()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def path(self, year: int) -> Path:
+        return self._directory / f"sessions-{year:04d}.sqlite3"
+
+    def years(self) -> list[int]:
+        """Archived years, ascending."""
+
+        return list(self._years)
+
+    def years_between(self, start_us: int | None, end_us: int | None) -> list[int]:
+        """Archived years overlapping [start_us, end_us] (None: open bound)."""
+
+        years = []
+        for year in self._years:
+            first, last = year_bounds_us(year)
+            if (end_us is None or first <= end_us) and (start_us is None or last >= start_us):
+                years.append(year)
+        return years
+
+    def _scan(self) -> list[int]:
+        if not self._directory.is_dir():
+            return []
+        names = (_SHARD_NAME.match(p.name) for p in self._directory.iterdir())
+        return sorted(int(m.group(1)) for m in names if m)
+
+    # Archiving -----------------------------------------------------------------
+    def archive_before(self, conn: sqlite3.Connection, year: int) -> dict[int, int]:
+        """Move sessions started before `year` into their year's shard.
+
+        `conn` is the live database's writer (not inside a transaction).
+        Each year is copied into its shard in one transaction and then
+        deleted from the live table in another; re-running after a crash
+        between the two skips the rows already copied. Returns the rows
+        moved per year.
+        """
+
+        cutoff, _ = year_bounds_us(year)
+        oldest = conn.execute(
+            "SELECT MIN(started_at_us) FROM sessions WHERE started_at_us < ?", (cutoff,)
+        ).fetchone()[0]
+        moved: dict[int, int] = {}
+        if oldest is None:
+            return moved
+        first_year = epoch_us_to_datetime(oldest).year  # type: ignore[union-attr]
+        for shard_year in range(first_year, year):
+            lo, hi = year_bounds_us(shard_year)
+            exists = conn.execute(
+                "SELECT 1 FROM sessions WHERE started_at_us BETWEEN ? AND ? LIMIT 1", (lo, hi)
+            ).fetchone()
+            if exists is None:
+                continue
+            self._create(shard_year)
+            with self.attached(conn, shard_year) as schema:
+                with transaction(conn):
+                    conn.execute(
+                        f"""
+                        INSERT INTO {schema}.sessions({_ARCHIVED_COLUMNS})
+                        SELECT {_ARCHIVED_COLUMNS} FROM main.sessions
+                        WHERE started_at_us BETWEEN ? AND ?
+                        ON CONFLICT DO NOTHING
+                        """,
+                        (lo, hi),
+                    )
+                with transaction(conn):
+                    count = conn.execute(
+                        "DELETE FROM main.sessions WHERE started_at_us BETWEEN ? AND ?", (lo, hi)
+                    ).rowcount
+                    # The delete trigger left zeroed rollup rows behind
+                    conn.execute(
+                        "DELETE FROM main.daily_stats WHERE day BETWEEN ? AND ?",
+                        (lo // DAY_US, hi // DAY_US),
+                    )
+            moved[shard_year] = count
+            logger.info(
+                "Archived %d sessions of %d to %s", count, shard_year, self.path(shard_year)
+            )
+        return moved
+
+    def _create(self, year: int) -> None:
+        path = self.path(year)
+        if year in self._years:
+            return
+        self._directory.mkdir(parents=True, exist_ok=True)
+        shard = connect(path)
+        try:
+            ensure_schema(shard)
+            # Written once, then read-only: no -wal/-shm files next to it
+            shard.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            shard.close()
+        self._years = sorted({*self._years, year})
+
+    # Reading -------------------------------------------------------------------
+    @contextmanager
+    def attached(self, conn: sqlite3.Connection, year: int) -> Iterator[str]:
+        """ATTACH the shard of `year` to `conn`; yields its schema name."""
+
+        if year not in self._years:
+            raise ValueError(f"no archive for {year}")
+        schema = f"archive_{year}"
+        conn.execute(f"ATTACH DATABASE ? AS {schema}", (str(self.path(year)),))
+        try:
+            yield schema
+        finally:
+            conn.execute(f"DETACH DATABASE {schema}")
+
+    def map(self, fn: Callable[..., T], years: list[int], *args: Any) -> list[T]:
+        """`[fn(path(year), *args) for year in years]`, in worker processes when useful.
+
+        `fn` must be a module-level function and `args` picklable.
+        """
+
+        paths = [self.path(year) for year in years]
+        if len(paths) < 2 or not self._parallel:
+            return [fn(path, *args) for path in paths]
+        executor = self._get_executor()
+        futures = [executor.submit(fn, path, *args) for path in paths]
+        return [future.result() for future in futures]
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers or os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    # Lifecycle -----------------------------------------------------------------
+    def close(self) -> None:
+        """Shut the worker processes down and close this process's shard connections."""
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        _close_shard_connections(self._directory.resolve())
+
+    def __enter__(self) -> "SessionArchive":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def default_archive(pool: ConnectionPool) -> SessionArchive | None:
+    """The archive in `archive/` next to the pool's database, if there is one."""
+
+    if pool.db_file is None:
+        return None
+    directory = pool.db_file.parent / "archive"
+    return SessionArchive(directory) if directory.is_dir() else None
+
+
+__all__ = ["SessionArchive", "default_archive", "shard_connection", "year_bounds_us"]
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from pomodoro_app.infrastructure.logging import get_logger
+
+from .connection import connect
+from .pool import ConnectionPool
+from .schema import SCHEMA_VERSION, ensure_schema, schema_version
+
+
+logger = get_logger("pomodoro.infrastructure.db")
+
+BACKUP_PREFIX = "pomodoro-"
+BACKUP_SUFFIX = ".sqlite3"
+
+# Queued by close(); everything requested before it still runs
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class BackupResult:
+    """Outcome of a backup or restore.
+
+    - path: the backup file written (backup) or read (restore)
+    - pages: database pages copied
+    - steps: backup steps taken (each copies at most `pages_per_step` pages)
+    - seconds: wall time, pauses between steps included
+    """
+
+    path: Path
+    pages: int
+    steps: int
+    seconds: float
+
+
+def _copy(
+    source: sqlite3.Connection, target: sqlite3.Connection, pages_per_step: int, pause: float
+) -> tuple[int, int]:
+    steps = 0
+    total = 0
+
+    def _progress(status: int, remaining: int, pages: int) -> None:
+        nonlocal steps, total
+        steps += 1
+        total = pages
+        # sqlite3's own `sleep` only applies after SQLITE_BUSY; yield after every step
+        if remaining and pause > 0:
+            time.sleep(pause)
+
+    source.backup(target, pages=pages_per_step, progress=_progress)
+    return total, steps
+
+
+@contextmanager
+def _snapshot(pool: ConnectionPool) -> Iterator[sqlite3.Connection]:
+    """A connection holding a read transaction on the pool's database.
+
+    `Connection.backup` restarts from page 1 whenever another connection
+    commits between two steps; reading from one WAL snapshot makes the copy
+    consistent and lets writers carry on. An in-memory database can only be
+    read through the pool writer, which is then held for the whole copy.
+    """
+
+    if pool.db_file is None:
+        with pool.writer() as conn:
+            yield conn
+        return
+    conn = connect(pool.db_file)
+    try:
+        conn.execute("BEGIN")
+        conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+        yield conn
+    finally:
+        conn.close()
+
+
+def backup_database(
+    pool: ConnectionPool, dest: Path, pages_per_step: int = 256, pause: float = 0.005
+) -> BackupResult:
+    """Copy the pool's database to `dest` with the SQLite online backup API.
+
+    Copies `pages_per_step` pages at a time and sleeps `pause` seconds
+    between steps. The copy is written to `<dest>.partial` and renamed once
+    complete, so `dest` is never a torn file. The result is a standalone
+    rollback-journal database (no -wal file needed).
+    """
+
+    if pages_per_step <= 0:
+        raise ValueError("pages_per_step must be > 0")
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    partial = dest.with_name(dest.name + ".partial")
+    partial.unlink(missing_ok=True)
+    t0 = time.perf_counter()
+    target = sqlite3.connect(str(partial), isolation_level=None)
+    try:
+        with _snapshot(pool) as source:
+            pages, steps = _copy(source, target, pages_per_step, pause)
+        target.execute("PRAGMA journal_mode=DELETE")
+    except BaseException:
+        target.close()
+        partial.unlink(missing_ok=True)
+        raise
+    target.close()
+    os.replace(partial, dest)
+    result = BackupResult(path=dest, pages=pages, steps=steps, seconds=time.perf_counter() - t0)
+    logger.info("Backed up %d pages to %s in %d steps (%.2fs)", pages, dest, steps, result.seconds)
+    return result
+
+
+def restore_database(pool: ConnectionPool, source: Path, pages_per_step: int = 1024) -> BackupResult:
+    """Replace the pool's database with the backup at `source`.
+
+    The backup is checked first (`PRAGMA quick_check`, schema not newer than
+    this version) and ValueError is raised without touching the database if
+    it fails. The copy runs while holding the pool writer and the restored
+    database is then migrated to `SCHEMA_VERSION`. Caches built on the old
+    contents (e.g. `SettingsRepository`) must be reloaded by the caller.
+    """
+
+    source = Path(source)
+    if not source.is_file():
+        raise ValueError(f"backup file {str(source)!r} does not exist")
+    t0 = time.perf_counter()
+    backup = sqlite3.connect(f"{source.resolve().as_uri()}?mode=ro", uri=True, isolation_level=None)
+    try:
+        try:
+            check = backup.execute("PRAGMA quick_check").fetchone()[0]
+            version = schema_version(backup)
+        except sqlite3.DatabaseError as exc:
+            raise ValueError(f"{source} is not a valid database backup ({exc})") from None
+        if check != "ok":
+            raise ValueError(f"{source} failed the integrity check: {check}")
+        if version > SCHEMA_VERSION:
+            raise ValueError(f"{source} has schema v{version}, newer than supported v{SCHEMA_VERSION}")
+        with pool.writer() as conn:
+            pages, steps = _copy(backup, conn, pages_per_step, 0.0)
+            ensure_schema(conn)
+    finally:
+        backup.close()
+    result = BackupResult(path=source, pages=pages, steps=steps, seconds=time.perf_counter() - t0)
+    logger.info("Restored %d pages from %s (%.2fs)", pages, source, result.seconds)
+    return result
+
+
+class BackupService:
+    """Background online backups of a `ConnectionPool` with rotation.
+
+    Backups run on one daemon thread through `backup_database`, so a large
+    copy never runs on the caller's thread and yields between steps.
+    `backup_now()` queues one and returns a `concurrent.futures.Future`;
+    with `interval` set the thread also takes one every `interval` seconds.
+    Files are named `pomodoro-YYYYmmdd-HHMMSS-mmm.sqlite3` in `directory`
+    (default: `backups/` next to the database) and only the newest `keep`
+    are retained.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        directory: Path | None = None,
+        keep: int = 7,
+        pages_per_step: int = 256,
+        pause: float = 0.005,
+        interval: float | None = None,
+    ) -> None:
+        if keep <= 0:
+            raise ValueError("keep must be > 0")
+        if directory is None:
+            if pool.db_file is None:
+                raise ValueError("directory is required for an in-memory database")
+            directory = pool.db_file.parent / "backups"
+        self._pool = pool
+        self._directory = Path(directory)
+        self._keep = keep
+        self._pages_per_step = pages_per_step
+        self._pause = pause
+        self._interval = interval
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="DatabaseBackup", daemon=True)
+        self._thread.start()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def backups(self) -> list[Path]:
+        """Backup files in `directory`, oldest first."""
+
+        return sorted(self._directory.glob(f"{BACKUP_PREFIX}*{BACKUP_SUFFIX}"))
+
+    def backup_now(self) -> Future[BackupResult]:
+        """Queue a backup; the future holds its `BackupResult`."""
+
+        future: Future[BackupResult] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("backup service is closed")
+            self._queue.put(future)
+        return future
+
+    def _backup(self) -> BackupResult:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")[:-3]
+        result = backup_database(
+            self._pool, self._directory / f"{BACKUP_PREFIX}{stamp}{BACKUP_SUFFIX}", self._pages_per_step, self._pause
+        )
+        for old in self.backups()[: -self._keep]:
+            old.unlink(missing_ok=True)
+            logger.info("Removed old backup %s", old)
+        return result
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self._interval)
+            except queue.Empty:
+                # Scheduled backup
+                try:
+                    self._backup()
+                except Exception:
+                    logger.exception("Scheduled database backup failed")
+                continue
+            if item is _STOP:
+                return
+            if not item.set_running_or_notify_cancel():
+                continue
+            try:
+                item.set_result(self._backup())
+            except Exception as exc:
+                logger.exception("Database backup failed")
+                item.set_exception(exc)
+
+    # Lifecycle -----------------------------------------------------------------
+    def close(self, timeout: float | None = None) -> None:
+        """Finish queued backups, then stop the thread."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def __enter__(self) -> "BackupService":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+__all__ = ["BackupService", "BackupResult", "backup_database", "restore_database"]
@@ -34,6 +34,8 @@ def connect(db_path: Path | None = None) -> sqlite3.Connection:
     - check_same_thread=False to allow usage from controller/threads with care
     - isolation_level=None (autocommit) and explicit transactions if needed
     - PRAGMA journal_mode=WAL and foreign_keys=ON
+    - auto_vacuum=INCREMENTAL for a new, empty database (it can only be set
+      before the first page is written, and WAL mode writes one)
     """
 
     # When running under pytest and no explicit path is provided, use an in-memory DB
@@ -49,6 +51,8 @@ def connect(db_path: Path | None = None) -> sqlite3.Connection:
         conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
     # Apply recommended pragmas
     try:
+        if conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL;")
         conn.execute("PRAGMA journal_mode=WAL;")
         conn.execute("PRAGMA foreign_keys=ON;")
         conn.execute("PRAGMA synchronous=NORMAL;")
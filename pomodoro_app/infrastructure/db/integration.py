@@ -1,32 +1,55 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+from concurrent.futures import Future
 from typing import Any, Callable, Dict
 
 from pomodoro_app.core.models import Session
 from pomodoro_app.core.timer_service import TimerService
 from pomodoro_app.infrastructure.logging import get_logger
 
+from .pool import ConnectionPool, get_pool
 from .repositories import SessionRepository, SettingsRepository
+from .writer import DatabaseWriter
 
 
 logger = get_logger("pomodoro.infrastructure.db")
 
 
-def wire_persistence(service: TimerService, conn: sqlite3.Connection) -> Callable[[], None]:
+def wire_persistence(
+    service: TimerService, conn: sqlite3.Connection | ConnectionPool | DatabaseWriter
+) -> Callable[[], None]:
     """Subscribe to domain events and persist data accordingly.
 
     - On cycle_end: persist the finished `Session`.
 
-    Returns an unsubscribe callable.
+    `conn` may be a `ConnectionPool`, in which case each write checks out
+    its writer connection, or a `DatabaseWriter`, in which case the insert
+    is only queued and the timer thread goes on to emit `state` without
+    waiting for SQLite. Returns an unsubscribe callable.
     """
 
-    repo = SessionRepository(conn)
+    def _log_failure(future: Future[None]) -> None:
+        exc = future.exception()
+        if exc is not None:
+            logger.error("Failed to persist finished session", exc_info=exc)
+
+    def _add(session: Session) -> None:
+        if isinstance(conn, DatabaseWriter):
+            conn.add_session(session).add_done_callback(_log_failure)
+            logger.info("Queued finished session %s", session.id)
+            return
+        if isinstance(conn, ConnectionPool):
+            with conn.writer() as writer:
+                SessionRepository(writer).add(session)
+        else:
+            SessionRepository(conn).add(session)
+        logger.info("Persisted finished session %s", session.id)
 
     def on_cycle_end(session: Session) -> None:
         try:
-            repo.add(session)
-            logger.info("Persisted finished session %s", session.id)
+            _add(session)
         except Exception:
             logger.exception("Failed to persist finished session")
 
@@ -42,13 +65,32 @@ def wire_persistence(service: TimerService, conn: sqlite3.Connection) -> Callabl
     return unsubscribe
 
 
-def load_settings(conn: sqlite3.Connection) -> Dict[str, Any]:
+_settings: SettingsRepository | None = None
+_settings_lock = threading.Lock()
+
+
+def get_settings() -> SettingsRepository:
+    """Return the process-wide settings cache, bound to `get_pool()`.
+
+    A new cache is created when the pool was closed and reopened.
+    """
+
+    global _settings
+    pool = get_pool()
+    with _settings_lock:
+        if _settings is None or _settings._conn is not pool:
+            _settings = SettingsRepository(pool)
+        return _settings
+
+
+def load_settings(conn: sqlite3.Connection | ConnectionPool | SettingsRepository) -> Dict[str, Any]:
     """Load application settings with safe defaults.
 
-    Returns a dictionary with keys: durations, overlay, language.
+    Returns a dictionary with keys: durations, overlay, language. Pass a
+    `SettingsRepository` (e.g. `get_settings()`) to read from its cache.
     """
 
-    repo = SettingsRepository(conn)
+    repo = conn if isinstance(conn, SettingsRepository) else SettingsRepository(conn)
     durations = repo.get("durations", {"focus": 25 * 60, "break": 5 * 60})
     overlay = repo.get("overlay", False)
     language = repo.get("language", "system")
@@ -60,4 +102,4 @@ def load_settings(conn: sqlite3.Connection) -> Dict[str, Any]:
     }
 
 
-__all__ = ["wire_persistence", "load_settings"]
+__all__ = ["wire_persistence", "load_settings", "get_settings"]
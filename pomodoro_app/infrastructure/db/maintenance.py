@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+from pomodoro_app.infrastructure.logging import get_logger
+
+from .connection import connect
+from .pool import ConnectionPool
+
+
+logger = get_logger("pomodoro.infrastructure.db")
+
+# SQLite's default wal_autocheckpoint, restored on close()
+_DEFAULT_AUTOCHECKPOINT = 1000
+
+
+@dataclass(frozen=True)
+class MaintenanceMetrics:
+    """Counters of a `DatabaseMaintenance`.
+
+    - wal_bytes: size of the -wal file at the last check
+    - checkpoints / last_checkpoint_s / max_checkpoint_s: checkpoints run and their duration
+    - frames_checkpointed: WAL frames copied back by the last checkpoint
+    - vacuum_runs / pages_vacuumed: incremental vacuum passes and pages released
+    - max_writer_hold_s: longest single writer checkout taken by maintenance
+    """
+
+    wal_bytes: int
+    checkpoints: int
+    last_checkpoint_s: float
+    max_checkpoint_s: float
+    frames_checkpointed: int
+    vacuum_runs: int
+    pages_vacuumed: int
+    max_writer_hold_s: float
+
+
+class DatabaseMaintenance:
+    """Background WAL checkpoints and incremental vacuum for a `ConnectionPool`.
+
+    Takes over checkpointing from SQLite's auto-checkpoint (which runs on
+    the committing connection, i.e. inside a write): every `check_interval`
+    seconds the thread runs a PASSIVE checkpoint on its own connection once
+    the pool has seen no checkouts for `idle_after` seconds, or right away
+    when the WAL has grown past `max_wal_bytes`. PASSIVE never waits for, or
+    blocks, the writer. Every `vacuum_interval` seconds (when idle) it
+    releases free pages with `PRAGMA incremental_vacuum` in steps sized to
+    hold the pool writer for at most about `writer_budget` seconds each
+    (databases not in `auto_vacuum=INCREMENTAL` mode are only checkpointed,
+    see `enable_incremental_vacuum`).
+    `close()` runs a TRUNCATE checkpoint, leaving an empty -wal file.
+
+    In-memory databases have no WAL; maintenance is then a no-op.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        check_interval: float = 1.0,
+        idle_after: float = 5.0,
+        max_wal_bytes: int = 16 * 1024 * 1024,
+        vacuum_interval: float = 3600.0,
+        writer_budget: float = 0.02,
+    ) -> None:
+        if check_interval <= 0 or writer_budget <= 0:
+            raise ValueError("check_interval and writer_budget must be > 0")
+        self._pool = pool
+        self._check_interval = check_interval
+        self._idle_after = idle_after
+        self._max_wal_bytes = max_wal_bytes
+        self._vacuum_interval = vacuum_interval
+        self._writer_budget = writer_budget
+        self._db_file = pool.db_file
+        self._stop = threading.Event()
+        # Serializes run_once() between the thread and direct callers
+        self._run_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._counts = {
+            "wal_bytes": 0,
+            "checkpoints": 0,
+            "last_checkpoint_s": 0.0,
+            "max_checkpoint_s": 0.0,
+            "frames_checkpointed": 0,
+            "vacuum_runs": 0,
+            "pages_vacuumed": 0,
+            "max_writer_hold_s": 0.0,
+        }
+        self._vacuum_step = 64
+        self._last_activity = -1
+        self._active_at = time.monotonic()
+        self._vacuumed_at = time.monotonic()
+        self._conn: sqlite3.Connection | None = None
+        self._thread: threading.Thread | None = None
+        if self._db_file is None:
+            logger.info("Database maintenance disabled (in-memory database)")
+            return
+
+        self._conn = connect(self._db_file)
+        with pool.writer() as writer:
+            writer.execute("PRAGMA wal_autocheckpoint=0")
+        self._thread = threading.Thread(target=self._run, name="DatabaseMaintenance", daemon=True)
+        self._thread.start()
+
+    # Maintenance steps -----------------------------------------------------------
+    def run_once(self) -> None:
+        """One scheduling pass: checkpoint and/or vacuum if due."""
+
+        if self._conn is None:
+            return
+        with self._run_lock:
+            now = time.monotonic()
+            idle = self._is_idle(now)
+            wal = self._wal_bytes()
+            if wal and (idle or wal >= self._max_wal_bytes):
+                self.checkpoint()
+            if idle and now - self._vacuumed_at >= self._vacuum_interval:
+                self.vacuum()
+                self._vacuumed_at = now
+                # Our own writer checkouts are not activity
+                self._last_activity = self._activity()
+
+    def checkpoint(self, mode: str = "PASSIVE") -> tuple[int, int, int]:
+        """Run `PRAGMA wal_checkpoint(mode)`; returns (busy, wal_frames, checkpointed_frames)."""
+
+        if self._conn is None:
+            return (0, 0, 0)
+        if mode not in ("PASSIVE", "FULL", "RESTART", "TRUNCATE"):
+            raise ValueError(f"unknown checkpoint mode {mode!r}")
+        started = time.perf_counter()
+        busy, frames, done = self._conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        elapsed = time.perf_counter() - started
+        self._wal_bytes()
+        with self._lock:
+            self._counts["checkpoints"] += 1
+            self._counts["last_checkpoint_s"] = elapsed
+            self._counts["max_checkpoint_s"] = max(self._counts["max_checkpoint_s"], elapsed)
+            self._counts["frames_checkpointed"] = max(0, done)
+        logger.info("WAL checkpoint %s: %s/%s frames in %.1f ms (busy=%s)", mode, done, frames, elapsed * 1e3, busy)
+        return int(busy), int(frames), int(done)
+
+    def vacuum(self) -> int:
+        """Release free pages in writer-budget sized steps; returns the pages released."""
+
+        if self._conn is None:
+            return 0
+        if int(self._conn.execute("PRAGMA auto_vacuum").fetchone()[0]) != 2:
+            # incremental_vacuum is a no-op until the database is converted
+            return 0
+        released = 0
+        free = self._free_pages()
+        while free > 0 and not self._stop.is_set():
+            try:
+                with self._pool.writer(timeout=self._writer_budget) as writer:
+                    started = time.perf_counter()
+                    writer.execute(f"PRAGMA incremental_vacuum({self._vacuum_step})").fetchall()
+                    held = time.perf_counter() - started
+            except TimeoutError:
+                # The writer is busy: not idle after all, try again next time
+                break
+            remaining = self._free_pages()
+            released += free - remaining
+            free = remaining
+            with self._lock:
+                self._counts["max_writer_hold_s"] = max(self._counts["max_writer_hold_s"], held)
+            # Size the next step to the budget
+            if held > self._writer_budget:
+                self._vacuum_step = max(1, self._vacuum_step // 2)
+            elif held < self._writer_budget / 4:
+                self._vacuum_step = min(self._vacuum_step * 2, 65_536)
+        with self._lock:
+            self._counts["vacuum_runs"] += 1
+            self._counts["pages_vacuumed"] += released
+        if released:
+            logger.info("Incremental vacuum released %d pages", released)
+        return released
+
+    def _activity(self) -> int:
+        metrics = self._pool.metrics()
+        # A reader held across passes counts as continuous activity
+        return metrics.writer_checkouts + metrics.reader_checkouts + metrics.readers_in_use
+
+    def _is_idle(self, now: float) -> bool:
+        activity = self._activity()
+        if activity != self._last_activity:
+            self._last_activity = activity
+            self._active_at = now
+        return now - self._active_at >= self._idle_after
+
+    def _wal_bytes(self) -> int:
+        try:
+            size = os.path.getsize(f"{self._db_file}-wal")
+        except OSError:
+            size = 0
+        with self._lock:
+            self._counts["wal_bytes"] = size
+        return size
+
+    def _free_pages(self) -> int:
+        assert self._conn is not None
+        return int(self._conn.execute("PRAGMA freelist_count").fetchone()[0])
+
+    # Lifecycle -------------------------------------------------------------------
+    def metrics(self) -> MaintenanceMetrics:
+        with self._lock:
+            return MaintenanceMetrics(**self._counts)  # type: ignore[arg-type]
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._check_interval):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Database maintenance pass failed")
+
+    def close(self) -> None:
+        """Stop the thread, truncate the WAL and restore auto-checkpointing."""
+
+        if self._conn is None:
+            return
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        try:
+            # Holding the writer: nothing is appended while the WAL is reset
+            with self._pool.writer() as writer, self._run_lock:
+                self.checkpoint("TRUNCATE")
+                writer.execute(f"PRAGMA wal_autocheckpoint={_DEFAULT_AUTOCHECKPOINT}")
+        except Exception:
+            logger.exception("Shutdown WAL checkpoint failed")
+        finally:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "DatabaseMaintenance":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+__all__ = ["DatabaseMaintenance", "MaintenanceMetrics"]
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from pomodoro_app.infrastructure.logging import get_logger
+
+from .connection import connect
+from .schema import ensure_schema
+
+
+logger = get_logger("pomodoro.infrastructure.db")
+
+
+@dataclass(frozen=True)
+class PoolMetrics:
+    """Checkout counters of a `ConnectionPool`.
+
+    - *_checkouts: completed checkouts
+    - *_waits: checkouts that found no free connection and had to wait
+    - max_*_wait: longest wait in seconds
+    - readers_open / readers_in_use: reader connections created / checked out
+    """
+
+    writer_checkouts: int
+    writer_waits: int
+    max_writer_wait: float
+    reader_checkouts: int
+    reader_waits: int
+    max_reader_wait: float
+    readers_open: int
+    readers_in_use: int
+
+
+class ConnectionPool:
+    """One writer connection plus up to `readers` read-only connections.
+
+    In WAL mode readers never block the writer (or each other), so queries
+    run concurrently with inserts; writes are serialized on the single writer
+    connection instead of contending for SQLite's write lock. Reader
+    connections are opened lazily. The schema is ensured once, on the writer.
+
+    An in-memory database cannot be shared between connections, so there
+    (e.g. `connect()` under pytest) readers check out the writer connection.
+    """
+
+    def __init__(self, db_path: Path | None = None, readers: int = 4, timeout: float = 5.0) -> None:
+        if readers < 0:
+            raise ValueError("readers must be >= 0")
+        self._db_path = db_path
+        self._timeout = timeout
+        self._writer = connect(db_path)
+        ensure_schema(self._writer)
+        file = self._writer.execute("PRAGMA database_list").fetchone()[2]
+        self._db_file = Path(file) if file else None
+        self._shared = self._db_file is None
+        self._max_readers = 0 if self._shared else readers
+        # Reentrant so a thread holding the writer can also check out a reader
+        self._writer_lock = threading.RLock()
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._readers: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._counts = {
+            "writer_checkouts": 0,
+            "writer_waits": 0,
+            "max_writer_wait": 0.0,
+            "reader_checkouts": 0,
+            "reader_waits": 0,
+            "max_reader_wait": 0.0,
+            "readers_in_use": 0,
+        }
+
+    # Checkout ------------------------------------------------------------------
+    @contextmanager
+    def writer(self, timeout: float | None = None) -> Iterator[sqlite3.Connection]:
+        """Check out the writer connection (exclusive)."""
+
+        self._check_open()
+        started = time.perf_counter()
+        waited = not self._writer_lock.acquire(blocking=False)
+        if waited and not self._writer_lock.acquire(timeout=self._timeout if timeout is None else timeout):
+            raise TimeoutError("timed out waiting for the database writer")
+        try:
+            self._record("writer", waited, time.perf_counter() - started)
+            yield self._writer
+        finally:
+            self._writer_lock.release()
+
+    @contextmanager
+    def reader(self, timeout: float | None = None) -> Iterator[sqlite3.Connection]:
+        """Check out a read-only connection."""
+
+        if self._max_readers == 0:
+            with self.writer(timeout) as conn:
+                yield conn
+            return
+        self._check_open()
+        started = time.perf_counter()
+        conn, waited = self._acquire_reader(self._timeout if timeout is None else timeout)
+        try:
+            self._record("reader", waited, time.perf_counter() - started)
+            yield conn
+        finally:
+            with self._lock:
+                self._counts["readers_in_use"] -= 1
+                closed = self._closed
+            if closed:
+                conn.close()
+            else:
+                self._idle.put(conn)
+
+    def _acquire_reader(self, timeout: float) -> tuple[sqlite3.Connection, bool]:
+        try:
+            conn = self._idle.get_nowait()
+            waited = False
+        except queue.Empty:
+            conn = self._open_reader()
+            waited = conn is None
+            if conn is None:
+                try:
+                    conn = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError("timed out waiting for a database reader") from None
+        with self._lock:
+            self._counts["readers_in_use"] += 1
+        return conn, waited
+
+    def _open_reader(self) -> sqlite3.Connection | None:
+        with self._lock:
+            if len(self._readers) >= self._max_readers:
+                return None
+            conn = connect(self._db_path)
+            conn.execute("PRAGMA query_only=ON")
+            self._readers.append(conn)
+            return conn
+
+    def _record(self, kind: str, waited: bool, wait: float) -> None:
+        with self._lock:
+            self._counts[f"{kind}_checkouts"] += 1
+            if waited:
+                self._counts[f"{kind}_waits"] += 1
+                self._counts[f"max_{kind}_wait"] = max(self._counts[f"max_{kind}_wait"], wait)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("connection pool is closed")
+
+    # Lifecycle -----------------------------------------------------------------
+    @property
+    def db_file(self) -> Path | None:
+        """Path of the database file; None for an in-memory database."""
+
+        return self._db_file
+
+    def metrics(self) -> PoolMetrics:
+        with self._lock:
+            return PoolMetrics(readers_open=len(self._readers), **self._counts)  # type: ignore[arg-type]
+
+    def close(self) -> None:
+        """Close idle connections; checked-out readers close when returned."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._writer_lock:
+            self._writer.close()
+        logger.info("Connection pool closed")
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(db_path: Path | None = None, readers: int = 4) -> ConnectionPool:
+    """Return the process-wide pool, creating it on first use.
+
+    Raises ValueError if `db_path` names another database than the open pool's.
+    """
+
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._closed:
+            _pool = ConnectionPool(db_path, readers=readers)
+        elif db_path is not None and (
+            _pool.db_file is None or _pool.db_file.resolve() != Path(db_path).resolve()
+        ):
+            raise ValueError(f"the database pool is already open on {_pool.db_file or ':memory:'}")
+        return _pool
+
+
+def close_pool() -> None:
+    """Close the process-wide pool (also registered with atexit)."""
+
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(close_pool)
+
+
+__all__ = ["ConnectionPool", "PoolMetrics", "get_pool", "close_pool"]
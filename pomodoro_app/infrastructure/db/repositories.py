@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import copy
 import sqlite3
+import threading
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Iterable, Sequence
+from typing import Any, Callable, Iterable, Iterator, Sequence
 import json
+from itertools import islice
 from uuid import UUID
 
-from pomodoro_app.core.models import Session, SessionType, TimerState
+from pomodoro_app.core.models import CompactSession, Session, datetime_to_epoch_us
 from pomodoro_app.infrastructure.logging import get_logger
-from .utils import safe_execute, transaction
+from .archive import SessionArchive
+from .pool import ConnectionPool
+from .schema import SESSION_TYPE_CODES, TIMER_STATE_CODES, elapsed_seconds
+from .utils import safe_execute, safe_executemany, transaction
 
 
 logger = get_logger("pomodoro.infrastructure.db")
@@ -22,11 +30,112 @@ def _str_to_dt(val: str | None) -> datetime | None:
     return datetime.fromisoformat(val) if val is not None else None
 
 
+def _dt_to_us(dt: datetime | None) -> int | None:
+    return datetime_to_epoch_us(dt) if dt is not None else None
+
+
+_INSERT_SESSION = """
+INSERT INTO sessions(id, type, duration_s, started_at, ended_at, state, started_at_us, ended_at_us, elapsed_s)
+VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+# Conflict clause per `add_many(on_duplicate=...)`. "replace" is an upsert rather
+# than INSERT OR REPLACE so the daily_stats update triggers fire.
+_ON_DUPLICATE = {
+    "fail": "",
+    "skip": "ON CONFLICT(id) DO NOTHING",
+    "replace": """ON CONFLICT(id) DO UPDATE SET
+    type = excluded.type, duration_s = excluded.duration_s, started_at = excluded.started_at,
+    ended_at = excluded.ended_at, state = excluded.state, started_at_us = excluded.started_at_us,
+    ended_at_us = excluded.ended_at_us, elapsed_s = excluded.elapsed_s""",
+}
+
+
+_TYPES_BY_CODE = {code: member for member, code in SESSION_TYPE_CODES.items()}
+_STATES_BY_CODE = {code: member for member, code in TIMER_STATE_CODES.items()}
+
+
+def _session_params(session: Session) -> tuple[Any, ...]:
+    started_us, ended_us = _dt_to_us(session.started_at), _dt_to_us(session.ended_at)
+    return (
+        session.id.bytes,
+        SESSION_TYPE_CODES[session.type],
+        int(session.duration_s),
+        _dt_to_str(session.started_at),
+        _dt_to_str(session.ended_at),
+        TIMER_STATE_CODES[session.state],
+        started_us,
+        ended_us,
+        elapsed_seconds(started_us, ended_us),
+    )
+
+
+_SESSION_COLUMNS = "id, type, duration_s, started_at, ended_at, state"
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Position after the last row of a page: its `(started_at_us, seq)` sort key.
+
+    `seq` is the integer rowid key. Sessions without a start time sort
+    first (`started_at_us` None).
+    """
+
+    started_at_us: int | None
+    seq: int
+
+
+@dataclass(frozen=True)
+class SessionPage:
+    items: list[Session | CompactSession]
+    # None once the last page has been returned
+    next_cursor: PageCursor | None
+
+
 class SessionRepository:
-    """Repository for persisting and querying `Session` records."""
+    """Repository for persisting and querying `Session` records.
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
+    With `compact=True`, queries materialise `CompactSession` objects (slotted,
+    packed fields) instead of `Session` dataclasses, for large histories.
+
+    With `write_behind=True`, `add()` only buffers the session; buffered rows
+    are written with one `executemany` inside a single transaction once
+    `batch_size` rows are pending, `flush_interval` seconds after the first
+    pending row, on `flush()`, before every query and on `close()`. Call
+    `close()` (or use the repository as a context manager) at shutdown.
+
+    With an `archive`, `list_by_period`, `iter_by_period` and `page` also
+    read the archived years they cover (each shard is attached for the
+    duration of its query). Writes and `last_n` use the live table only.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        compact: bool = False,
+        write_behind: bool = False,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        archive: SessionArchive | None = None,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be > 0")
         self._conn = conn
+        self._compact = compact
+        self._archive = archive
+        self._write_behind = write_behind
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._pending: list[tuple[Any, ...]] = []
+        self._pending_lock = threading.Lock()
+        # Serializes flushes so batches reach the database in add() order
+        self._flush_lock = threading.Lock()
+        self._has_pending = threading.Event()
+        self._closed = threading.Event()
+        self._flusher: threading.Thread | None = None
 
     # --- Commands ------------------------------------------------------------
     def add(self, session: Session) -> None:
@@ -35,22 +144,12 @@ class SessionRepository:
         Idempotency is not guaranteed; caller is responsible for unique IDs.
         """
 
+        if self._write_behind:
+            self._buffer(session)
+            return
+
         logger.info("Inserting session %s (%s)", session.id, session.type.name)
-        safe_execute(
-            self._conn,
-            """
-            INSERT INTO sessions(id, type, duration_s, started_at, ended_at, state)
-            VALUES(?, ?, ?, ?, ?, ?)
-            """,
-            (
-                str(session.id),
-                session.type.name,
-                int(session.duration_s),
-                _dt_to_str(session.started_at),
-                _dt_to_str(session.ended_at),
-                session.state.name,
-            ),
-        )
+        safe_execute(self._conn, _INSERT_SESSION, _session_params(session))
         # autocommit is enabled by connection factory; keep explicit commit for clarity
         try:
             self._conn.commit()
@@ -58,95 +157,400 @@ class SessionRepository:
             logger.exception("Commit failed after session insert")
             raise
 
+    def add_many(self, sessions: Iterable[Session], on_duplicate: str = "fail", chunk: int = 10_000) -> int:
+        """Insert sessions with one `executemany` per `chunk`-row transaction.
+
+        `sessions` is consumed lazily, so it may be a generator over a large
+        source. `on_duplicate` decides what happens to an id already stored:
+        "fail" (IntegrityError; earlier chunks stay committed), "skip" (keep
+        the stored row) or "replace" (overwrite it). Returns the number of
+        rows inserted or replaced.
+        """
+
+        if on_duplicate not in _ON_DUPLICATE:
+            raise ValueError(f"unknown on_duplicate {on_duplicate!r}; expected one of {', '.join(_ON_DUPLICATE)}")
+        if chunk <= 0:
+            raise ValueError("chunk must be > 0")
+        if self._write_behind:
+            self.flush()
+        sql = _INSERT_SESSION + _ON_DUPLICATE[on_duplicate]
+        params = (_session_params(session) for session in sessions)
+        written = 0
+        while True:
+            rows = list(islice(params, chunk))
+            if not rows:
+                break
+            with transaction(self._conn):
+                # rowcount excludes rows changed by the daily_stats triggers
+                written += safe_executemany(self._conn, sql, rows).rowcount
+            logger.info("Inserted %d sessions (%d so far)", len(rows), written)
+        return written
+
+    def flush(self) -> int:
+        """Write all buffered sessions now; returns the number of rows written."""
+
+        with self._flush_lock:
+            with self._pending_lock:
+                rows, self._pending = self._pending, []
+                self._has_pending.clear()
+            if not rows:
+                return 0
+            try:
+                with transaction(self._conn):
+                    safe_executemany(self._conn, _INSERT_SESSION, rows)
+            except Exception:
+                logger.exception("Failed to flush %d buffered sessions", len(rows))
+                raise
+            logger.info("Flushed %d buffered sessions", len(rows))
+            return len(rows)
+
+    def close(self) -> None:
+        """Flush buffered sessions and stop the background flusher."""
+
+        self._closed.set()
+        self._has_pending.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=2.0)
+            self._flusher = None
+        self.flush()
+
+    def __enter__(self) -> "SessionRepository":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _buffer(self, session: Session) -> None:
+        with self._pending_lock:
+            if self._closed.is_set():
+                raise RuntimeError("repository is closed")
+            self._pending.append(_session_params(session))
+            full = len(self._pending) >= self._batch_size
+            self._has_pending.set()
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="SessionWriteBehind", daemon=True
+                )
+                self._flusher.start()
+        if full:
+            self.flush()
+
+    def _flush_loop(self) -> None:
+        while not self._closed.is_set():
+            self._has_pending.wait()
+            if self._closed.is_set():
+                return
+            # Give the batch `flush_interval` to fill up; close() cuts the wait short
+            self._closed.wait(self._flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                # Already logged by flush(); keep the flusher alive for later batches
+                pass
+
     # --- Queries -------------------------------------------------------------
-    def list_by_period(self, start: datetime | None, end: datetime | None) -> list[Session]:
+    def list_by_period(self, start: datetime | None, end: datetime | None) -> list[Session | CompactSession]:
         """List sessions whose `started_at` falls within [start, end].
 
         If `start` or `end` are None, the bound is open on that side.
         Results are ordered by `started_at` ascending.
         """
 
-        clauses: list[str] = []
-        params: list[Any] = []
-        if start is not None:
-            clauses.append("started_at >= ?")
-            params.append(_dt_to_str(start))
-        if end is not None:
-            clauses.append("started_at <= ?")
-            params.append(_dt_to_str(end))
+        start_us, end_us = _dt_to_us(start), _dt_to_us(end)
+        if self._write_behind:
+            self.flush()
+        years = self._archive_years(start_us, end_us)
+        if not years:
+            rows = self._period_rows("main", start_us, end_us)
+        else:
+            # Shards only hold dated sessions of earlier years: undated live
+            # rows sort first, dated live rows last
+            rows = []
+            if start is None and end is None:
+                rows += self._period_rows("main", None, None, "started_at_us IS NULL")
+            for year in years:
+                with self._attached(year) as schema:
+                    rows += self._period_rows(schema, start_us, end_us)
+            rows += self._period_rows("main", start_us, end_us, "started_at_us IS NOT NULL")
+        return [self._map_row(row) for row in rows]
 
+    def _period_rows(
+        self, schema: str, start_us: int | None, end_us: int | None, condition: str | None = None
+    ) -> list[Sequence[Any]]:
+        clauses = [condition] if condition else []
+        params: list[Any] = []
+        if start_us is not None:
+            clauses.append("started_at_us >= ?")
+            params.append(start_us)
+        if end_us is not None:
+            clauses.append("started_at_us <= ?")
+            params.append(end_us)
         where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
-        sql = f"SELECT id, type, duration_s, started_at, ended_at, state FROM sessions{where} ORDER BY started_at ASC"
+        sql = f"SELECT {_SESSION_COLUMNS} FROM {schema}.sessions{where} ORDER BY started_at_us ASC"
+        return safe_execute(self._conn, sql, params).fetchall()
+
+    def _archive_years(self, start_us: int | None, end_us: int | None) -> list[int]:
+        return self._archive.years_between(start_us, end_us) if self._archive is not None else []
 
-        rows = safe_execute(self._conn, sql, params).fetchall()
-        return [self._row_to_session(row) for row in rows]
+    def _attached(self, year: int) -> AbstractContextManager[str]:
+        assert self._archive is not None
+        return self._archive.attached(self._conn, year)
 
-    def last_n(self, n: int) -> list[Session]:
+    def last_n(self, n: int) -> list[Session | CompactSession]:
         """Return the last `n` sessions ordered by `started_at` descending."""
 
+        if self._write_behind:
+            self.flush()
         rows = safe_execute(
             self._conn,
-            """
-            SELECT id, type, duration_s, started_at, ended_at, state
+            f"""
+            SELECT {_SESSION_COLUMNS}
             FROM sessions
-            ORDER BY started_at DESC
+            ORDER BY started_at_us DESC
             LIMIT ?
             """,
             (int(max(0, n)),),
         ).fetchall()
-        sessions = [self._row_to_session(row) for row in rows]
+        sessions = [self._map_row(row) for row in rows]
         sessions.reverse()  # return ascending chronological order
         return sessions
 
+    def iter_by_period(
+        self, start: datetime | None, end: datetime | None, chunk: int = 500
+    ) -> Iterator[Session | CompactSession]:
+        """Yield the sessions of `list_by_period(start, end)` in bounded memory.
+
+        Rows are read `chunk` at a time with keyset pagination on
+        `(started_at_us, seq)`; no statement stays open between chunks, so the
+        connection can be used (and written to) while iterating. Rows inserted
+        behind the current position during iteration are not returned.
+        """
+
+        cursor: PageCursor | None = None
+        while True:
+            page = self.page(cursor, chunk, start, end)
+            yield from page.items
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def page(
+        self,
+        after_cursor: PageCursor | None = None,
+        limit: int = 100,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> SessionPage:
+        """Return up to `limit` sessions after `after_cursor`, ordered by `(started_at, seq)`.
+
+        Pass the returned `next_cursor` to fetch the following page. `start`
+        and `end` bound the period as in `list_by_period`; sessions without a
+        start time are only listed when both are None.
+        """
+
+        if limit <= 0:
+            raise ValueError("limit must be > 0")
+        if self._write_behind:
+            self.flush()
+
+        rows: list[Sequence[Any]] = []
+        if start is None and end is None and (after_cursor is None or after_cursor.started_at_us is None):
+            # Undated sessions sort first; page through them by seq
+            undated_sql = f"SELECT {_SESSION_COLUMNS}, started_at_us, seq FROM sessions WHERE started_at_us IS NULL"
+            undated_params: list[Any] = []
+            if after_cursor is not None:
+                undated_sql += " AND seq > ?"
+                undated_params.append(after_cursor.seq)
+            undated_sql += " ORDER BY seq LIMIT ?"
+            undated_params.append(limit + 1)
+            rows = safe_execute(self._conn, undated_sql, undated_params).fetchmany(limit + 1)
+
+        # Dated rows: archived years in order (those not before the cursor), then the live table
+        start_us, end_us = _dt_to_us(start), _dt_to_us(end)
+        cursor_us = after_cursor.started_at_us if after_cursor is not None else None
+        lower = [bound for bound in (start_us, cursor_us) if bound is not None]
+        for year in [*self._archive_years(max(lower, default=None), end_us), None]:
+            if len(rows) > limit:
+                break
+            if year is None:
+                rows += self._dated_page_rows("main", after_cursor, start_us, end_us, limit + 1 - len(rows))
+            else:
+                with self._attached(year) as schema:
+                    rows += self._dated_page_rows(schema, after_cursor, start_us, end_us, limit + 1 - len(rows))
+
+        # One extra row tells whether another page follows
+        more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = PageCursor(rows[-1][6], rows[-1][7]) if more else None
+        return SessionPage(items=[self._map_row(row[:6]) for row in rows], next_cursor=next_cursor)
+
+    def _dated_page_rows(
+        self, schema: str, after_cursor: PageCursor | None, start_us: int | None, end_us: int | None, limit: int
+    ) -> list[Sequence[Any]]:
+        clauses = ["started_at_us IS NOT NULL"]
+        params: list[Any] = []
+        if after_cursor is not None and after_cursor.started_at_us is not None:
+            clauses.append("(started_at_us, seq) > (?, ?)")
+            params.extend((after_cursor.started_at_us, after_cursor.seq))
+        if start_us is not None:
+            clauses.append("started_at_us >= ?")
+            params.append(start_us)
+        if end_us is not None:
+            clauses.append("started_at_us <= ?")
+            params.append(end_us)
+        params.append(limit)
+        sql = (
+            f"SELECT {_SESSION_COLUMNS}, started_at_us, seq FROM {schema}.sessions WHERE {' AND '.join(clauses)} "
+            "ORDER BY started_at_us, seq LIMIT ?"
+        )
+        return safe_execute(self._conn, sql, params).fetchmany(limit)
+
     # --- Mapping -------------------------------------------------------------
+    def _map_row(self, row: Sequence[Any]) -> Session | CompactSession:
+        return self._row_to_compact_session(row) if self._compact else self._row_to_session(row)
+
+    @staticmethod
+    def _row_to_compact_session(row: Sequence[Any]) -> CompactSession:
+        sid, stype, duration_s, started_at, ended_at, state = row
+        # Temporaries (UUID, datetime) are only used for encoding and freed right away
+        return CompactSession(
+            id=UUID(bytes=sid),
+            type=_TYPES_BY_CODE[stype],
+            duration_s=int(duration_s),
+            started_at=_str_to_dt(started_at),
+            ended_at=_str_to_dt(ended_at),
+            state=_STATES_BY_CODE[state],
+        )
+
     @staticmethod
     def _row_to_session(row: Sequence[Any]) -> Session:
         sid, stype, duration_s, started_at, ended_at, state = row
         return Session(
-            id=UUID(str(sid)),
-            type=SessionType[str(stype)],
+            id=UUID(bytes=sid),
+            type=_TYPES_BY_CODE[stype],
             duration_s=int(duration_s),
             started_at=_str_to_dt(started_at),
             ended_at=_str_to_dt(ended_at),
-            state=TimerState[str(state)],
+            state=_STATES_BY_CODE[state],
         )
 
 
+SettingsCallback = Callable[[dict[str, Any]], None]
+
+_UPSERT_SETTING = """
+INSERT INTO settings(key, value) VALUES(?, ?)
+ON CONFLICT(key) DO UPDATE SET value = excluded.value
+"""
+
+
 class SettingsRepository:
-    """Key-value settings repository with JSON-encoded values."""
+    """Key-value settings repository with JSON-encoded values.
+
+    Write-through cache: all keys are loaded with one query on first read
+    and served from memory afterwards; writes update SQLite first, then the
+    cache, then notify `subscribe()` callbacks with the keys that changed.
+    The cache assumes all writes go through this instance (see
+    `get_settings()` for the process-wide one). `conn` may be a
+    `ConnectionPool`, in which case reads and writes check out its writer.
+    """
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
+    def __init__(self, conn: sqlite3.Connection | ConnectionPool) -> None:
         self._conn = conn
+        self._cache: dict[str, Any] | None = None
+        self._lock = threading.RLock()
+        self._subscribers: tuple[SettingsCallback, ...] = ()
 
     def get(self, key: str, default: Any | None = None) -> Any | None:
-        row = safe_execute(self._conn, "SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
-        if not row:
-            return default
-        try:
-            return json.loads(row[0])
-        except Exception:
-            logger.exception("Failed to decode JSON for settings key '%s'", key)
-            return default
+        with self._lock:
+            cache = self._load()
+            if key not in cache:
+                return default
+            # Callers may mutate what they get; never hand out the cached object
+            return copy.deepcopy(cache[key])
+
+    def all(self) -> dict[str, Any]:
+        with self._lock:
+            return copy.deepcopy(self._load())
 
     def set(self, key: str, value: Any) -> None:
-        try:
-            raw = json.dumps(value)
-        except Exception:
-            logger.exception("Failed to encode JSON for settings key '%s'", key)
-            raise
-        safe_execute(
-            self._conn,
-            """
-            INSERT INTO settings(key, value) VALUES(?, ?)
-            ON CONFLICT(key) DO UPDATE SET value = excluded.value
-            """,
-            (key, raw),
-        )
-        try:
-            self._conn.commit()
-        except Exception:
-            logger.exception("Commit failed after settings upsert for key '%s'", key)
-            raise
+        self.set_many({key: value})
+
+    def set_many(self, values: dict[str, Any]) -> None:
+        """Upsert several keys in one transaction, then notify subscribers once."""
+
+        rows = []
+        for key, value in values.items():
+            try:
+                rows.append((key, json.dumps(value)))
+            except Exception:
+                logger.exception("Failed to encode JSON for settings key '%s'", key)
+                raise
+        if not rows:
+            return
+        with self._lock:
+            cache = self._load()
+            with self._connection() as conn:
+                try:
+                    with transaction(conn):
+                        safe_executemany(conn, _UPSERT_SETTING, rows)
+                except Exception:
+                    logger.exception("Settings upsert failed for keys %s", ", ".join(values))
+                    raise
+            changed = {key: value for key, value in values.items() if cache.get(key, _MISSING) != value}
+            # Store copies decoded from the JSON actually written (tuples become lists, ...)
+            for key, raw in rows:
+                cache[key] = json.loads(raw)
+            subscribers = self._subscribers
+        if changed:
+            for callback in subscribers:
+                try:
+                    callback(copy.deepcopy(changed))
+                except Exception:
+                    logger.exception("Settings subscriber failed")
+
+    def subscribe(self, callback: SettingsCallback) -> Callable[[], None]:
+        """Call `callback(changed)` after each write that changes values; returns an unsubscribe callable."""
+
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers = self._subscribers + (callback,)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                self._subscribers = tuple(cb for cb in self._subscribers if cb != callback)
+
+        return _unsubscribe
+
+    def reload(self) -> None:
+        """Drop the cache; the next read loads every key again."""
+
+        with self._lock:
+            self._cache = None
+
+    def _load(self) -> dict[str, Any]:
+        if self._cache is None:
+            with self._connection() as conn:
+                rows = safe_execute(conn, "SELECT key, value FROM settings").fetchall()
+            cache: dict[str, Any] = {}
+            for key, raw in rows:
+                try:
+                    cache[key] = json.loads(raw)
+                except Exception:
+                    # Undecodable values read as missing (callers get their default)
+                    logger.exception("Failed to decode JSON for settings key '%s'", key)
+            self._cache = cache
+        return self._cache
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        if isinstance(self._conn, ConnectionPool):
+            with self._conn.writer() as conn:
+                yield conn
+        else:
+            yield self._conn
+
+
+_MISSING = object()
 
 
-__all__ = ["SessionRepository", "SettingsRepository"]
+__all__ = ["SessionRepository", "SettingsRepository", "PageCursor", "SessionPage"]
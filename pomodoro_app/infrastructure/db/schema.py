@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Iterable
+from datetime import datetime
+from typing import Callable, Iterable
+from uuid import UUID
 
+from pomodoro_app.core.models import SessionType, TimerState, datetime_to_epoch_us
 from pomodoro_app.infrastructure.logging import get_logger
 
+from .utils import safe_executemany, transaction
+
 
 logger = get_logger("pomodoro.infrastructure.db")
 
@@ -28,12 +33,21 @@ SCHEMA_STATEMENTS: tuple[str, ...] = (
         value TEXT NOT NULL
     );
     """,
-    # Optional indices to speed common queries
-    """
-    CREATE INDEX IF NOT EXISTS idx_sessions_started_at ON sessions(started_at);
-    """,
 )
 
+# Rows updated per transaction when backfilling new columns
+BACKFILL_CHUNK = 10_000
+
+# Integer codes stored in sessions.type / sessions.state (and daily_stats.type)
+# from schema v4 on. Stored on disk: never renumber, only add.
+SESSION_TYPE_CODES: dict[SessionType, int] = {SessionType.FOCUS: 1, SessionType.BREAK: 2}
+TIMER_STATE_CODES: dict[TimerState, int] = {
+    TimerState.IDLE: 1,
+    TimerState.RUNNING_FOCUS: 2,
+    TimerState.RUNNING_BREAK: 3,
+    TimerState.PAUSED: 4,
+}
+
 
 def _execute_many(conn: sqlite3.Connection, statements: Iterable[str]) -> None:
     cursor = conn.cursor()
@@ -45,19 +59,326 @@ def _execute_many(conn: sqlite3.Connection, statements: Iterable[str]) -> None:
         cursor.close()
 
 
+def _columns(conn: sqlite3.Connection, table: str) -> set[str]:
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _epoch_us(value: str | None) -> int | None:
+    return datetime_to_epoch_us(datetime.fromisoformat(value)) if value is not None else None
+
+
+def elapsed_seconds(started_us: int | None, ended_us: int | None) -> int | None:
+    """Actual session length in whole seconds (rounded), None if unknown."""
+
+    if started_us is None or ended_us is None:
+        return None
+    return int(round((ended_us - started_us) / 1_000_000))
+
+
+def _migrate_epoch_columns(conn: sqlite3.Connection) -> None:
+    """v1: integer epoch-microsecond timestamps and a precomputed `elapsed_s`.
+
+    The ISO text columns stay (they keep the original UTC offset); queries
+    filter and order on `started_at_us` and detect interruptions with
+    `elapsed_s` instead of parsing text per row. Existing rows are backfilled
+    in `BACKFILL_CHUNK`-sized transactions; re-running after an interruption
+    is safe.
+    """
+
+    existing = _columns(conn, "sessions")
+    for column in ("started_at_us", "ended_at_us", "elapsed_s"):
+        if column not in existing:
+            conn.execute(f"ALTER TABLE sessions ADD COLUMN {column} INTEGER")
+
+    last_rowid = 0
+    while True:
+        rows = conn.execute(
+            "SELECT rowid, started_at, ended_at FROM sessions WHERE rowid > ? ORDER BY rowid LIMIT ?",
+            (last_rowid, BACKFILL_CHUNK),
+        ).fetchall()
+        if not rows:
+            break
+        updates = []
+        for rowid, started_at, ended_at in rows:
+            started_us, ended_us = _epoch_us(started_at), _epoch_us(ended_at)
+            elapsed = elapsed_seconds(started_us, ended_us)
+            updates.append((started_us, ended_us, elapsed, rowid))
+        with transaction(conn):
+            safe_executemany(
+                conn,
+                "UPDATE sessions SET started_at_us = ?, ended_at_us = ?, elapsed_s = ? WHERE rowid = ?",
+                updates,
+            )
+        last_rowid = rows[-1][0]
+        logger.info("Backfilled epoch columns up to rowid %s", last_rowid)
+
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_started_at_us ON sessions(started_at_us)")
+    # Range queries no longer use the text column
+    conn.execute("DROP INDEX IF EXISTS idx_sessions_started_at")
+
+
+# Day bucket of a session in daily_stats: started_at_us // DAY_US
+DAY_US = 86_400 * 1_000_000
+
+_ROLLUP_ADD = f"""
+    INSERT INTO daily_stats(day, type, sessions, total_s, interruptions)
+    VALUES(NEW.started_at_us / {DAY_US}, NEW.type, 1, NEW.duration_s, COALESCE(NEW.elapsed_s < NEW.duration_s, 0))
+    ON CONFLICT(day, type) DO UPDATE SET
+        sessions = sessions + 1,
+        total_s = total_s + excluded.total_s,
+        interruptions = interruptions + excluded.interruptions;
+"""
+_ROLLUP_REMOVE = f"""
+    UPDATE daily_stats SET
+        sessions = sessions - 1,
+        total_s = total_s - OLD.duration_s,
+        interruptions = interruptions - COALESCE(OLD.elapsed_s < OLD.duration_s, 0)
+    WHERE day = OLD.started_at_us / {DAY_US} AND type = OLD.type;
+"""
+
+ROLLUP_STATEMENTS: tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS daily_stats (
+        day INTEGER NOT NULL,
+        type INTEGER NOT NULL,
+        sessions INTEGER NOT NULL,
+        total_s INTEGER NOT NULL,
+        interruptions INTEGER NOT NULL,
+        PRIMARY KEY (day, type)
+    ) WITHOUT ROWID;
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_sessions_rollup_insert AFTER INSERT ON sessions
+    WHEN NEW.started_at_us IS NOT NULL
+    BEGIN {_ROLLUP_ADD} END;
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_sessions_rollup_delete AFTER DELETE ON sessions
+    WHEN OLD.started_at_us IS NOT NULL
+    BEGIN {_ROLLUP_REMOVE} END;
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_sessions_rollup_update_old
+    AFTER UPDATE OF started_at_us, type, duration_s, elapsed_s ON sessions
+    WHEN OLD.started_at_us IS NOT NULL
+    BEGIN {_ROLLUP_REMOVE} END;
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_sessions_rollup_update_new
+    AFTER UPDATE OF started_at_us, type, duration_s, elapsed_s ON sessions
+    WHEN NEW.started_at_us IS NOT NULL
+    BEGIN {_ROLLUP_ADD} END;
+    """,
+)
+
+
+def rebuild_daily_stats(conn: sqlite3.Connection) -> int:
+    """Recompute `daily_stats` from the sessions table; returns the number of rows."""
+
+    with transaction(conn):
+        conn.execute("DELETE FROM daily_stats")
+        conn.execute(
+            f"""
+            INSERT INTO daily_stats(day, type, sessions, total_s, interruptions)
+            SELECT started_at_us / {DAY_US}, type, COUNT(*), SUM(duration_s),
+                   COALESCE(SUM(elapsed_s < duration_s), 0)
+            FROM sessions
+            WHERE started_at_us IS NOT NULL
+            GROUP BY 1, 2
+            """
+        )
+    count = int(conn.execute("SELECT COUNT(*) FROM daily_stats").fetchone()[0])
+    logger.info("Rebuilt daily_stats rollup (%d rows)", count)
+    return count
+
+
+def _migrate_daily_stats(conn: sqlite3.Connection) -> None:
+    """v2: `daily_stats` rollup (day x type) kept current by triggers on sessions."""
+
+    for stmt in ROLLUP_STATEMENTS:
+        conn.execute(stmt)
+    rebuild_daily_stats(conn)
+
+
+def _migrate_keyset_index(conn: sqlite3.Connection) -> None:
+    """v3: `(started_at_us, id)` index for keyset pagination.
+
+    The id tie-breaker makes the order total, so a page cursor resumes
+    exactly; the index still serves every `started_at_us` range query and
+    replaces the single-column one.
+    """
+
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_started_at_us_id ON sessions(started_at_us, id)")
+    conn.execute("DROP INDEX IF EXISTS idx_sessions_started_at_us")
+
+
+_COMPACT_SESSIONS = """
+CREATE TABLE sessions_v4 (
+    seq INTEGER PRIMARY KEY,
+    id BLOB NOT NULL UNIQUE,
+    type INTEGER NOT NULL,
+    duration_s INTEGER NOT NULL,
+    started_at TEXT,
+    ended_at TEXT,
+    state INTEGER NOT NULL,
+    started_at_us INTEGER,
+    ended_at_us INTEGER,
+    elapsed_s INTEGER
+)
+"""
+
+
+def _uuid_bytes(value: str) -> bytes:
+    return UUID(value).bytes
+
+
+def _name_to_code(column: str, codes: dict[SessionType, int] | dict[TimerState, int]) -> str:
+    # Unknown names map to NULL and fail the NOT NULL constraint
+    whens = " ".join(f"WHEN '{member.name}' THEN {code}" for member, code in codes.items())
+    return f"CASE {column} {whens} END"
+
+
+def _migrate_compact_keys(conn: sqlite3.Connection) -> None:
+    """v4: INTEGER rowid key (`seq`), 16-byte BLOB uuid and integer enum codes.
+
+    Random UUID text keys scattered inserts across the table B-tree; rows
+    are now appended in rowid order and the uuid lives in a unique index
+    of 16-byte keys. `type`/`state` hold `SESSION_TYPE_CODES` /
+    `TIMER_STATE_CODES`. Rows are copied in `BACKFILL_CHUNK` transactions
+    into a new table that replaces `sessions` in one transaction; an
+    interrupted copy is restarted. `daily_stats` is rebuilt with codes.
+    """
+
+    if "seq" not in _columns(conn, "sessions"):
+        conn.create_function("uuid_bytes", 1, _uuid_bytes, deterministic=True)
+        conn.execute("DROP TABLE IF EXISTS sessions_v4")
+        conn.execute(_COMPACT_SESSIONS)
+        copy = f"""
+            INSERT INTO sessions_v4(id, type, duration_s, started_at, ended_at, state,
+                                    started_at_us, ended_at_us, elapsed_s)
+            SELECT uuid_bytes(id), {_name_to_code("type", SESSION_TYPE_CODES)}, duration_s,
+                   started_at, ended_at, {_name_to_code("state", TIMER_STATE_CODES)},
+                   started_at_us, ended_at_us, elapsed_s
+            FROM sessions WHERE rowid > ? AND rowid <= ? ORDER BY rowid
+        """
+        last_rowid = 0
+        while True:
+            bound = conn.execute(
+                "SELECT rowid FROM sessions WHERE rowid > ? ORDER BY rowid LIMIT 1 OFFSET ?",
+                (last_rowid, BACKFILL_CHUNK - 1),
+            ).fetchone()
+            upper = bound[0] if bound is not None else (1 << 63) - 1
+            with transaction(conn):
+                conn.execute(copy, (last_rowid, upper))
+            if bound is None:
+                break
+            last_rowid = upper
+            logger.info("Copied sessions up to rowid %s", last_rowid)
+        with transaction(conn):
+            # Drops the old indexes and rollup triggers with the table
+            conn.execute("DROP TABLE sessions")
+            conn.execute("ALTER TABLE sessions_v4 RENAME TO sessions")
+
+    # Covers keyset pagination on (started_at_us, seq): the rowid is part of every index entry
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_started_at_us ON sessions(started_at_us)")
+    conn.execute("DROP TABLE IF EXISTS daily_stats")
+    for stmt in ROLLUP_STATEMENTS:
+        conn.execute(stmt)
+    rebuild_daily_stats(conn)
+
+
+def _migrate_incremental_vacuum(conn: sqlite3.Connection) -> None:
+    """v5: `auto_vacuum=INCREMENTAL`, so free pages can be released in small steps.
+
+    New databases get it from `connect()` before their first page is
+    written. Switching an existing database needs a full VACUUM, which
+    would hold the writer for as long as it takes to rewrite the file, so
+    it is not done here: run `enable_incremental_vacuum` explicitly
+    (`--enable-incremental-vacuum`). Until then `DatabaseMaintenance` only
+    checkpoints.
+    """
+
+    if int(conn.execute("PRAGMA auto_vacuum").fetchone()[0]) != 2:
+        logger.info("auto_vacuum is not INCREMENTAL; run --enable-incremental-vacuum to convert the database")
+
+
+def enable_incremental_vacuum(conn: sqlite3.Connection) -> bool:
+    """Switch an existing database to `auto_vacuum=INCREMENTAL` with one full VACUUM.
+
+    Rewrites the whole file (and needs as much free disk space), blocking
+    writers meanwhile; meant for an explicit maintenance command. Returns
+    False if the database was already INCREMENTAL.
+    """
+
+    if int(conn.execute("PRAGMA auto_vacuum").fetchone()[0]) == 2:
+        return False
+    pages = int(conn.execute("PRAGMA page_count").fetchone()[0])
+    logger.info("Converting database to auto_vacuum=INCREMENTAL (VACUUM of %d pages)", pages)
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("VACUUM")
+    logger.info("Database converted to auto_vacuum=INCREMENTAL")
+    return True
+
+
+# Ordered schema migrations; entry N upgrades `PRAGMA user_version` N -> N+1
+MIGRATIONS: tuple[Callable[[sqlite3.Connection], None], ...] = (
+    _migrate_epoch_columns,
+    _migrate_daily_stats,
+    _migrate_keyset_index,
+    _migrate_compact_keys,
+    _migrate_incremental_vacuum,
+)
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """Apply pending migrations in order; returns the resulting schema version.
+
+    Each migration is recorded in `PRAGMA user_version` once it completed,
+    so an interrupted migration is re-run from the start on the next call.
+    """
+
+    version = schema_version(conn)
+    if version > SCHEMA_VERSION:
+        raise RuntimeError(f"database schema v{version} is newer than supported v{SCHEMA_VERSION}")
+    for target, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+        logger.info("Migrating SQLite schema to v%d (%s)", target, migration.__name__)
+        migration(conn)
+        conn.execute(f"PRAGMA user_version = {target}")
+        conn.commit()
+    return schema_version(conn)
+
+
 def ensure_schema(conn: sqlite3.Connection) -> None:
     """Create the database schema if it does not already exist.
 
-    Idempotent. Safe to call multiple times at startup.
+    Idempotent. Safe to call multiple times at startup. Brings existing
+    databases up to `SCHEMA_VERSION` through `MIGRATIONS`.
     """
     try:
         _execute_many(conn, SCHEMA_STATEMENTS)
-        logger.info("SQLite schema ensured (sessions, settings)")
+        version = migrate(conn)
+        logger.info("SQLite schema ensured (sessions, settings) at v%d", version)
     except Exception:
         logger.exception("Failed to ensure SQLite schema")
         raise
 
 
-__all__ = ["ensure_schema", "SCHEMA_STATEMENTS"]
-
-
+__all__ = [
+    "ensure_schema",
+    "migrate",
+    "schema_version",
+    "elapsed_seconds",
+    "rebuild_daily_stats",
+    "enable_incremental_vacuum",
+    "DAY_US",
+    "SESSION_TYPE_CODES",
+    "TIMER_STATE_CODES",
+    "SCHEMA_STATEMENTS",
+    "MIGRATIONS",
+    "SCHEMA_VERSION",
+]
@@ -3,10 +3,15 @@ from __future__ import annotations
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable
 
+from pomodoro_app.core.models import SessionType, datetime_to_epoch_us, epoch_us_to_datetime
 from pomodoro_app.infrastructure.logging import get_logger
 
+from .archive import SessionArchive, shard_connection
+from .schema import DAY_US, SESSION_TYPE_CODES
+
 
 logger = get_logger("pomodoro.infrastructure.db")
 
@@ -19,6 +24,21 @@ class StatsResult:
     sessions_count: int
 
 
+@dataclass(frozen=True)
+class StatsBucket:
+    """One row of `StatsService.compute_series`.
+
+    `key` is the bucket start (hour/day/week) or the weekday number;
+    `type` is None when the series is not grouped by session type.
+    """
+
+    key: datetime | int
+    type: SessionType | None
+    total_seconds: int
+    interruptions: int
+    sessions_count: int
+
+
 class StatsService:
     """Compute statistics from the `sessions` table.
 
@@ -29,74 +49,245 @@ class StatsService:
       - interruptions: count of sessions whose actual elapsed time is strictly less than
         the nominal `duration_s` (i.e., user stopped early).
       - sessions_count: number of sessions started within period.
+
+    Whole days inside the period are answered from the `daily_stats` rollup;
+    only the partial days at its edges are summed from raw session rows, in
+    the same statement.
+
+    With an `archive`, archived years overlapping the period are computed
+    on each shard (in parallel, see `SessionArchive.map`) and added to the
+    live table's figures.
     """
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
+    def __init__(self, conn: sqlite3.Connection, archive: SessionArchive | None = None) -> None:
         self._conn = conn
+        self._archive = archive
 
     def compute(self, start: datetime | None = None, end: datetime | None = None) -> StatsResult:
-        where, params = self._build_where_clause(start, end)
+        result = self._compute(start, end)
+        years = self._archive_years(start, end)
+        if not years:
+            return result
+        assert self._archive is not None
+        parts = [result, *self._archive.map(_compute_shard, years, start, end)]
+        return StatsResult(
+            total_focus_seconds=sum(p.total_focus_seconds for p in parts),
+            total_break_seconds=sum(p.total_break_seconds for p in parts),
+            interruptions=sum(p.interruptions for p in parts),
+            sessions_count=sum(p.sessions_count for p in parts),
+        )
 
-        # Sum durations by type
-        sums_row = self._conn.execute(
+    def _compute(self, start: datetime | None, end: datetime | None) -> StatsResult:
+        start_us = datetime_to_epoch_us(start) if start is not None else None
+        end_us = datetime_to_epoch_us(end) if end is not None else None
+        # Sessions without a start time are not in the rollup; count them only
+        # when the period is unbounded
+        source, params = self._source(start_us, end_us, undated=start_us is None and end_us is None)
+        row = self._conn.execute(
             f"""
             SELECT
-                COALESCE(SUM(CASE WHEN type='FOCUS' THEN duration_s ELSE 0 END), 0) as focus_sum,
-                COALESCE(SUM(CASE WHEN type='BREAK' THEN duration_s ELSE 0 END), 0) as break_sum,
-                COUNT(*) as sessions_count
-            FROM sessions
-            {where}
+                COALESCE(SUM(CASE WHEN type = {_FOCUS} THEN total_s ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN type = {_BREAK} THEN total_s ELSE 0 END), 0),
+                COALESCE(SUM(interruptions), 0),
+                COALESCE(SUM(sessions), 0)
+            FROM ({source})
             """,
             params,
         ).fetchone()
-        focus_sum = int(sums_row[0]) if sums_row else 0
-        break_sum = int(sums_row[1]) if sums_row else 0
-        sessions_count = int(sums_row[2]) if sums_row else 0
-
-        # Interruptions: ended early vs declared duration
-        # Use julianday diff to compute elapsed seconds approximately
-        intr_clauses: list[str] = []
-        intr_params: list[Any] = []
-        if start is not None:
-            intr_clauses.append("started_at >= ?")
-            intr_params.append(start.isoformat())
-        if end is not None:
-            intr_clauses.append("started_at <= ?")
-            intr_params.append(end.isoformat())
-        intr_clauses.extend(
-            [
-                "started_at IS NOT NULL",
-                "ended_at IS NOT NULL",
-                "(CAST(duration_s AS INTEGER) > CAST(ROUND((julianday(ended_at) - julianday(started_at)) * 86400.0) AS INTEGER))",
-            ]
+        return StatsResult(
+            total_focus_seconds=int(row[0]),
+            total_break_seconds=int(row[1]),
+            interruptions=int(row[2]),
+            sessions_count=int(row[3]),
         )
-        intr_where = ("WHERE " + " AND ".join(intr_clauses)) if intr_clauses else ""
-        intr_row = self._conn.execute(
-            f"SELECT COUNT(*) FROM sessions {intr_where}", intr_params
-        ).fetchone()
-        interruptions = int(intr_row[0]) if intr_row else 0
 
-        return StatsResult(
-            total_focus_seconds=focus_sum,
-            total_break_seconds=break_sum,
-            interruptions=interruptions,
-            sessions_count=sessions_count,
+    def compute_series(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        bucket: str = "day",
+        group_by_type: bool = True,
+    ) -> list[StatsBucket]:
+        """Statistics per time bucket within the period, in a single query per database.
+
+        `bucket` is "hour", "day", "week" (starting Monday) or "weekday"
+        (0 = Monday, summed over the whole period). Buckets follow the stored
+        timestamps (naive values are not converted). Empty buckets are
+        omitted; rows are ordered by key, then type.
+        """
+
+        if bucket not in _BUCKET_KEYS:
+            raise ValueError(f"unknown bucket {bucket!r}; expected one of {', '.join(_BUCKET_KEYS)}")
+        series = self._compute_series(start, end, bucket, group_by_type)
+        years = self._archive_years(start, end)
+        if not years:
+            return series
+        assert self._archive is not None
+        # Buckets are sums, so a bucket spanning shards (a week across New
+        # Year, any weekday) is the sum of its parts
+        merged: dict[tuple[Any, SessionType | None], list[int]] = {}
+        for part in (series, *self._archive.map(_compute_shard_series, years, start, end, bucket, group_by_type)):
+            for b in part:
+                totals = merged.setdefault((b.key, b.type), [0, 0, 0])
+                totals[0] += b.total_seconds
+                totals[1] += b.interruptions
+                totals[2] += b.sessions_count
+        return [
+            StatsBucket(key=key, type=s_type, total_seconds=total, interruptions=intr, sessions_count=count)
+            for (key, s_type), (total, intr, count) in sorted(merged.items(), key=_merged_order)
+        ]
+
+    def _compute_series(
+        self, start: datetime | None, end: datetime | None, bucket: str, group_by_type: bool
+    ) -> list[StatsBucket]:
+        start_us = datetime_to_epoch_us(start) if start is not None else None
+        end_us = datetime_to_epoch_us(end) if end is not None else None
+        # Hours are finer than the rollup; other buckets are unions of days
+        source, params = self._source(start_us, end_us, use_rollup=bucket != "hour")
+        type_col = "type" if group_by_type else "NULL"
+        rows = self._conn.execute(
+            f"""
+            SELECT {_BUCKET_KEYS[bucket]} AS bucket, {type_col} AS grouped_type,
+                   SUM(total_s), SUM(interruptions), SUM(sessions)
+            FROM ({source})
+            GROUP BY bucket, grouped_type
+            ORDER BY bucket, grouped_type
+            """,
+            params,
+        ).fetchall()
+        to_key = _BUCKET_TO_KEY[bucket]
+        return [
+            StatsBucket(
+                key=to_key(int(key)),
+                type=_TYPES_BY_CODE[s_type] if s_type is not None else None,
+                total_seconds=int(total),
+                interruptions=int(intr),
+                sessions_count=int(count),
+            )
+            for key, s_type, total, intr, count in rows
+        ]
+
+    def _archive_years(self, start: datetime | None, end: datetime | None) -> list[int]:
+        if self._archive is None:
+            return []
+        return self._archive.years_between(
+            datetime_to_epoch_us(start) if start is not None else None,
+            datetime_to_epoch_us(end) if end is not None else None,
+        )
+
+    def _source(
+        self,
+        start_us: int | None,
+        end_us: int | None,
+        use_rollup: bool = True,
+        undated: bool = False,
+    ) -> tuple[str, list[Any]]:
+        """Subquery over the period with columns (day, ts, type, sessions, total_s, interruptions).
+
+        Whole days come from `daily_stats` (ts is NULL there); sessions on
+        the partial days at the edges of the period come from raw rows.
+        """
+
+        # Days entirely within [start, end]
+        first_day = -(-start_us // DAY_US) if start_us is not None else None
+        last_day = (end_us + 1) // DAY_US - 1 if end_us is not None else None
+        if not use_rollup or (first_day is not None and last_day is not None and first_day > last_day):
+            return self._raw([(start_us, end_us)], undated)
+
+        edges: list[tuple[int | None, int | None]] = []
+        if start_us is not None and first_day is not None and start_us < first_day * DAY_US:
+            edges.append((start_us, first_day * DAY_US - 1))
+        if end_us is not None and last_day is not None and (last_day + 1) * DAY_US <= end_us:
+            edges.append(((last_day + 1) * DAY_US, end_us))
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        if first_day is not None:
+            clauses.append("day >= ?")
+            params.append(first_day)
+        if last_day is not None:
+            clauses.append("day <= ?")
+            params.append(last_day)
+        where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
+        rollup = f"SELECT day, NULL AS ts, type, sessions, total_s, interruptions FROM daily_stats {where}"
+        if not edges and not undated:
+            return rollup, params
+        raw, raw_params = self._raw(edges, undated)
+        return f"{rollup} UNION ALL {raw}", params + raw_params
+
+    @staticmethod
+    def _raw(ranges: list[tuple[int | None, int | None]], undated: bool = False) -> tuple[str, list[Any]]:
+        # Interruptions: ended early vs declared duration, using the precomputed elapsed_s
+        terms: list[str] = []
+        params: list[Any] = []
+        for lo, hi in ranges:
+            where, range_params = StatsService._build_where_clause(lo, hi)
+            terms.append(f"({where.removeprefix('WHERE ')})" if where else "started_at_us IS NOT NULL")
+            params.extend(range_params)
+        if undated:
+            terms.append("started_at_us IS NULL")
+        return (
+            f"""
+            SELECT started_at_us / {DAY_US} AS day, started_at_us AS ts, type, 1 AS sessions,
+                   duration_s AS total_s, (elapsed_s IS NOT NULL AND duration_s > elapsed_s) AS interruptions
+            FROM sessions
+            WHERE {" OR ".join(terms)}
+            """,
+            params,
         )
 
     @staticmethod
-    def _build_where_clause(start: datetime | None, end: datetime | None) -> tuple[str, list[Any]]:
+    def _build_where_clause(start_us: int | None, end_us: int | None) -> tuple[str, list[Any]]:
         clauses: list[str] = []
         params: list[Any] = []
-        if start is not None:
-            clauses.append("started_at >= ?")
-            params.append(start.isoformat())
-        if end is not None:
-            clauses.append("started_at <= ?")
-            params.append(end.isoformat())
+        if start_us is not None:
+            clauses.append("started_at_us >= ?")
+            params.append(start_us)
+        if end_us is not None:
+            clauses.append("started_at_us <= ?")
+            params.append(end_us)
         where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
         return where, params
 
 
-__all__ = ["StatsService", "StatsResult"]
+# Run by `SessionArchive.map`, possibly in a worker process
+def _compute_shard(path: Path, start: datetime | None, end: datetime | None) -> StatsResult:
+    return StatsService(shard_connection(path))._compute(start, end)
+
+
+def _compute_shard_series(
+    path: Path, start: datetime | None, end: datetime | None, bucket: str, group_by_type: bool
+) -> list[StatsBucket]:
+    return StatsService(shard_connection(path))._compute_series(start, end, bucket, group_by_type)
+
+
+def _merged_order(item: tuple[tuple[Any, SessionType | None], list[int]]) -> tuple[Any, int]:
+    key, s_type = item[0]
+    return key, SESSION_TYPE_CODES[s_type] if s_type is not None else 0
+
+
+_HOUR_US = 3_600 * 1_000_000
+_FOCUS = SESSION_TYPE_CODES[SessionType.FOCUS]
+_BREAK = SESSION_TYPE_CODES[SessionType.BREAK]
+_TYPES_BY_CODE = {code: member for member, code in SESSION_TYPE_CODES.items()}
+
+# SQL bucket key over a `_source` row; 1970-01-01 was a Thursday, so day + 3
+# counts from the Monday before the epoch
+_BUCKET_KEYS = {
+    "hour": f"ts / {_HOUR_US}",
+    "day": "day",
+    "week": "(day + 3) / 7",
+    "weekday": "(day + 3) % 7",
+}
+
+_BUCKET_TO_KEY: dict[str, Callable[[int], Any]] = {
+    "hour": lambda k: epoch_us_to_datetime(k * _HOUR_US),
+    "day": lambda k: epoch_us_to_datetime(k * DAY_US),
+    "week": lambda k: epoch_us_to_datetime((k * 7 - 3) * DAY_US),
+    "weekday": lambda k: k,
+}
+
+
+__all__ = ["StatsService", "StatsResult", "StatsBucket"]
 
 
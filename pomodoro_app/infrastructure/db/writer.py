@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, TypeVar
+
+from pomodoro_app.core.models import Session
+from pomodoro_app.infrastructure.logging import get_logger
+
+from .pool import ConnectionPool
+from .repositories import _INSERT_SESSION, _session_params
+from .utils import safe_execute, transaction
+
+
+logger = get_logger("pomodoro.infrastructure.db")
+
+T = TypeVar("T")
+WriteCommand = Callable[[sqlite3.Connection], T]
+
+# Queued by close(); everything submitted before it is still written
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class WriterMetrics:
+    """Counters of a `DatabaseWriter`.
+
+    - commands: commands run (including failed ones)
+    - failed: commands that raised and were rolled back
+    - batches: transactions committed
+    - max_batch: most commands grouped into one transaction
+    """
+
+    commands: int
+    failed: int
+    batches: int
+    max_batch: int
+
+
+class DatabaseWriter:
+    """Single thread that performs all writes submitted to it.
+
+    `submit(command)` queues `command(conn)` and returns a
+    `concurrent.futures.Future` right away; callers that need confirmation
+    wait on it, others (e.g. the timer thread) just move on. The thread runs
+    commands in submission order, grouping whatever is queued when it wakes
+    up (up to `max_batch`) into one transaction. Each command runs in its
+    own SAVEPOINT, so one that raises is rolled back alone and only its
+    future carries the exception. Futures resolve after COMMIT.
+
+    Commands must not BEGIN/COMMIT themselves (repository methods that
+    commit, like `SessionRepository.add`, are not suitable; use
+    `add_session`). With a `ConnectionPool` each batch checks out the pool
+    writer, so writes stay serialized with other users of the pool.
+    """
+
+    def __init__(self, conn: sqlite3.Connection | ConnectionPool, max_batch: int = 256) -> None:
+        if max_batch <= 0:
+            raise ValueError("max_batch must be > 0")
+        self._conn = conn
+        self._max_batch = max_batch
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._counts = {"commands": 0, "failed": 0, "batches": 0, "max_batch": 0}
+        self._thread = threading.Thread(target=self._run, name="DatabaseWriter", daemon=True)
+        self._thread.start()
+
+    # Commands ------------------------------------------------------------------
+    def submit(self, command: WriteCommand[T]) -> Future[T]:
+        """Queue `command(conn)`; the future holds its result once committed."""
+
+        future: Future[T] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("database writer is closed")
+            self._queue.put((command, future))
+        return future
+
+    def add_session(self, session: Session) -> Future[None]:
+        """Queue the insert of a finished session."""
+
+        params = _session_params(session)
+
+        def _insert(conn: sqlite3.Connection) -> None:
+            safe_execute(conn, _INSERT_SESSION, params)
+
+        return self.submit(_insert)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until everything submitted so far has been committed."""
+
+        self.submit(lambda conn: None).result(timeout)
+
+    # Lifecycle -----------------------------------------------------------------
+    def metrics(self) -> WriterMetrics:
+        with self._lock:
+            return WriterMetrics(**self._counts)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Write what is queued, then stop the thread."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Database writer did not stop within %.1fs", timeout or 0.0)
+        else:
+            logger.info("Database writer stopped")
+
+    def __enter__(self) -> "DatabaseWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # Writer thread -------------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while batch[-1] is not _STOP and len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1] is _STOP
+            commands = [item for item in batch if item is not _STOP and item[1].set_running_or_notify_cancel()]
+            if commands:
+                self._run_batch(commands)
+            if stop:
+                return
+
+    def _run_batch(self, commands: list[tuple[WriteCommand[Any], Future[Any]]]) -> None:
+        outcomes: list[tuple[Future[Any], BaseException | None, Any]] = []
+        try:
+            with self._connection() as conn, transaction(conn):
+                for command, future in commands:
+                    conn.execute("SAVEPOINT command")
+                    try:
+                        result = command(conn)
+                    except Exception as exc:
+                        conn.execute("ROLLBACK TO command")
+                        conn.execute("RELEASE command")
+                        outcomes.append((future, exc, None))
+                    else:
+                        conn.execute("RELEASE command")
+                        outcomes.append((future, None, result))
+        except Exception as exc:
+            # BEGIN/COMMIT (or the pool checkout) failed: nothing was written
+            logger.exception("Database writer batch of %d commands failed", len(commands))
+            for _command, future in commands:
+                future.set_exception(exc)
+            return
+
+        failed = sum(1 for _future, exc, _result in outcomes if exc is not None)
+        with self._lock:
+            self._counts["commands"] += len(commands)
+            self._counts["failed"] += failed
+            self._counts["batches"] += 1
+            self._counts["max_batch"] = max(self._counts["max_batch"], len(commands))
+        for future, exc, result in outcomes:
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        if isinstance(self._conn, ConnectionPool):
+            with self._conn.writer() as conn:
+                yield conn
+        else:
+            yield self._conn
+
+
+__all__ = ["DatabaseWriter", "WriterMetrics"]
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from platformdirs import user_data_dir
+
+from pomodoro_app.core.models import JournalRecord, SessionType
+from pomodoro_app.infrastructure.logging import get_logger
+
+
+logger = get_logger("pomodoro.infrastructure.journal")
+
+# Records are written with a fixed key order, so a session start can be found
+# with a byte search instead of decoding the whole file
+_START_MARK = b'{"op":"start",'
+
+
+def get_journal_path(app_name: str = "pomodoro_app") -> Path:
+    """Return the path of the timer journal in the user data dir.
+
+    e.g.: <user_data_dir>/<app_name>/journal/timer.journal
+    """
+
+    base = Path(user_data_dir(app_name)) / "journal"
+    base.mkdir(parents=True, exist_ok=True)
+    return base / "timer.journal"
+
+
+def _encode(record: JournalRecord) -> bytes:
+    payload = {
+        "op": record.op,
+        "sid": str(record.session_id),
+        "type": record.session_type.name,
+        "dur": record.duration_s,
+        "rem": record.remaining,
+        "mono": record.mono,
+        "wall": record.wall.isoformat(),
+    }
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _decode(line: bytes) -> JournalRecord:
+    payload = json.loads(line)
+    return JournalRecord(
+        op=payload["op"],
+        session_id=UUID(payload["sid"]),
+        session_type=SessionType[payload["type"]],
+        duration_s=int(payload["dur"]),
+        remaining=float(payload["rem"]),
+        mono=float(payload["mono"]),
+        wall=datetime.fromisoformat(payload["wall"]),
+    )
+
+
+class FileJournal:
+    """Append-only JSON-lines journal of timer transitions (a `JournalPort`).
+
+    Every `append` is written straight to the OS (unbuffered), so records
+    survive a crash of the process. Durability against power loss uses group
+    commit: a background flusher fsyncs at most every `sync_interval` seconds,
+    so a burst of transitions shares one fsync, and an fsync in progress
+    never holds up `append`. `sync_interval=0` fsyncs each record before
+    `append` returns, so there `append` blocks on the disk.
+
+    `recover()` only decodes the records after the last "start" marker, so
+    recovery stays cheap when the file has grown large.
+    """
+
+    def __init__(self, path: Path | str | None = None, sync_interval: float = 0.05) -> None:
+        if sync_interval < 0:
+            raise ValueError("sync_interval must be >= 0")
+        self.path = Path(path) if path is not None else get_journal_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._sync_interval = sync_interval
+        self._fh = open(self.path, "ab", buffering=0)
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        # Serializes fsync with close(); never taken by append()
+        self._sync_lock = threading.Lock()
+        self._closing = threading.Event()
+        self._dirty = False
+        self._flusher: threading.Thread | None = None
+        self.syncs = 0
+        self._terminate_torn_tail()
+
+    def _terminate_torn_tail(self) -> None:
+        # A crash mid-write can leave a partial last line; start new records on a fresh one
+        size = self._fh.seek(0, os.SEEK_END)
+        if size:
+            with open(self.path, "rb") as fh:
+                fh.seek(size - 1)
+                if fh.read(1) != b"\n":
+                    self._fh.write(b"\n")
+
+    # JournalPort ---------------------------------------------------------------
+    def append(self, record: JournalRecord) -> None:
+        line = _encode(record)
+        with self._lock:
+            if self._fh.closed:
+                raise ValueError("journal is closed")
+            self._fh.write(line)
+            if self._sync_interval == 0:
+                os.fsync(self._fh.fileno())
+                self.syncs += 1
+                return
+            self._dirty = True
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name="JournalFlusher", daemon=True)
+                self._flusher.start()
+            self._cond.notify()
+
+    def recover(self) -> list[JournalRecord]:
+        with self._lock:
+            try:
+                data = self.path.read_bytes()
+            except FileNotFoundError:
+                return []
+        start = data.rfind(_START_MARK)
+        if start < 0:
+            return []
+        lines = data[start:].splitlines()
+        records: list[JournalRecord] = []
+        for index, line in enumerate(lines):
+            if not line:
+                continue
+            try:
+                records.append(_decode(line))
+            except (ValueError, KeyError):
+                if index == len(lines) - 1:
+                    logger.info("Ignoring torn journal record at end of %s", self.path)
+                else:
+                    logger.warning("Skipping corrupt journal record in %s", self.path)
+        return records
+
+    def reset(self) -> None:
+        with self._lock:
+            os.ftruncate(self._fh.fileno(), 0)
+            self._dirty = True
+
+    # Durability ----------------------------------------------------------------
+    def sync(self) -> None:
+        """fsync records appended so far (no-op when nothing is pending)."""
+
+        with self._sync_lock:
+            with self._lock:
+                if not self._dirty or self._fh.closed:
+                    return
+                self._dirty = False
+                fd = self._fh.fileno()
+            # Appends made meanwhile set _dirty again and get the next fsync
+            os.fsync(fd)
+            self.syncs += 1
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._dirty and not self._closing.is_set():
+                    self._cond.wait()
+            if self._closing.is_set():
+                return
+            # Let the rest of a burst arrive so it shares this fsync
+            self._closing.wait(self._sync_interval)
+            self.sync()
+
+    def close(self) -> None:
+        self._closing.set()
+        with self._cond:
+            self._cond.notify()
+        if self._flusher is not None:
+            self._flusher.join(timeout=2.0)
+        self.sync()
+        with self._sync_lock, self._lock:
+            self._fh.close()
+
+    def __enter__(self) -> "FileJournal":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+__all__ = ["FileJournal", "get_journal_path"]
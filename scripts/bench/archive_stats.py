@@ -0,0 +1,124 @@
+"""Benchmark: one sessions table vs per-year archive shards over 10 years.
+
+Fills a file-backed database with `--per-day` sessions a day for 10 years
+(2015-2024), times queries against it, then moves 2015-2023 into
+`SessionArchive` shards and times the same queries on the live table plus
+archive, aggregating shards in-process ("serial") and across a
+`ProcessPoolExecutor` ("parallel"). The insert column is the mean
+`SessionRepository.add` latency into the live table. Example:
+
+    python scripts/bench/archive_stats.py --per-day 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.models import Session, SessionType, TimerState  # noqa: E402
+from pomodoro_app.infrastructure.db.archive import SessionArchive  # noqa: E402
+from pomodoro_app.infrastructure.db.pool import ConnectionPool  # noqa: E402
+from pomodoro_app.infrastructure.db.repositories import SessionRepository  # noqa: E402
+from pomodoro_app.infrastructure.db.stats import StatsService  # noqa: E402
+
+BASE = datetime(2015, 1, 1)
+DAYS = (datetime(2025, 1, 1) - BASE).days
+
+
+def _sessions(per_day: int, days: int, offset: int = 0) -> Iterator[Session]:
+    step = timedelta(days=1) / per_day
+    for i in range(per_day * days):
+        started = BASE + timedelta(days=offset) + step * i
+        duration = 1500 if i % 2 == 0 else 300
+        yield Session(
+            id=uuid.uuid4(),
+            type=SessionType.FOCUS if i % 2 == 0 else SessionType.BREAK,
+            duration_s=duration,
+            started_at=started,
+            ended_at=started + timedelta(seconds=duration - 60 if i % 7 == 0 else duration),
+            state=TimerState.IDLE,
+        )
+
+
+def _timed(fn: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1e3
+
+
+def _measure(pool: ConnectionPool, archive: SessionArchive | None, repeat: int, per_day: int) -> dict[str, float]:
+    with pool.reader() as conn:
+        stats = StatsService(conn, archive=archive)
+        repo = SessionRepository(conn, archive=archive)
+        # Partial edge days force raw scans on the first and last day
+        mid = (datetime(2016, 3, 14, 15, 0), datetime(2023, 9, 2, 9, 0))
+        out = {
+            "compute_10y": _timed(lambda: stats.compute(), repeat),
+            "compute_edges": _timed(lambda: stats.compute(*mid), repeat),
+            "series_hour_10y": _timed(lambda: stats.compute_series(bucket="hour"), repeat),
+            "series_week_10y": _timed(lambda: stats.compute_series(bucket="week"), repeat),
+            "list_last_month": _timed(lambda: repo.list_by_period(datetime(2024, 12, 1), None), repeat),
+            "list_2016_month": _timed(lambda: repo.list_by_period(datetime(2016, 5, 1), datetime(2016, 6, 1)), repeat),
+        }
+    new = list(_sessions(per_day, 2, offset=DAYS))
+    t0 = time.perf_counter()
+    with pool.writer() as conn:
+        repo = SessionRepository(conn)
+        for session in new:
+            repo.add(session)
+    out["add_us"] = (time.perf_counter() - t0) / len(new) * 1e6
+    return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-day", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    logging.getLogger("pomodoro.infrastructure.db").setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as td:
+        with ConnectionPool(Path(td) / "history.sqlite3", readers=1) as pool:
+            with pool.writer() as conn:
+                SessionRepository(conn).add_many(_sessions(args.per_day, DAYS))
+                rows = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+            print(f"rows={rows:,} over 10 years")
+            results = {"single table": _measure(pool, None, args.repeat, args.per_day)}
+
+            archive = SessionArchive(Path(td) / "archive", parallel=False)
+            t0 = time.perf_counter()
+            with pool.writer() as conn:
+                moved = archive.archive_before(conn, 2024)
+            print(f"archived {sum(moved.values()):,} rows into {len(moved)} shards in {time.perf_counter() - t0:.1f}s")
+            results["archive serial"] = _measure(pool, archive, args.repeat, args.per_day)
+            with SessionArchive(archive.directory, parallel=True, max_workers=args.workers) as parallel:
+                # Start the worker processes outside the timings
+                with pool.reader() as conn:
+                    StatsService(conn, archive=parallel).compute()
+                results["archive parallel"] = _measure(pool, parallel, args.repeat, args.per_day)
+
+    columns = list(next(iter(results.values())))
+    print(f"{'layout':<18} " + " ".join(f"{c:>16}" for c in columns))
+    for layout, values in results.items():
+        print(f"{layout:<18} " + " ".join(f"{values[c]:>16.2f}" for c in columns))
+    print("(times in ms, add_us in microseconds per add)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+"""Benchmark: latency of focus/break transitions, restart path vs cycle plan.
+
+"restart" chains sessions the way a controller had to without plans: wait for
+the IDLE state, then call stop() + start_focus()/start_break() from another
+thread. "plan" hands the whole sequence to `TimerService.start_plan`.
+
+For each transition it reports the gap between the `cycle_end` of one session
+and the RUNNING state of the next, and it counts the distinct worker threads
+that delivered ticks. Example:
+
+    python scripts/bench/cycle_transitions.py --steps 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.models import PlanStep, SessionType, TimerState  # noqa: E402
+from pomodoro_app.core.timer_service import TimerService  # noqa: E402
+
+
+def _steps(count: int) -> list[PlanStep]:
+    return [PlanStep(SessionType.FOCUS if i % 2 == 0 else SessionType.BREAK, 1) for i in range(count)]
+
+
+def run(mode: str, steps: list[PlanStep]) -> tuple[list[float], int]:
+    svc = TimerService(tick_interval=0.05)
+    ended_at: list[float] = []
+    gaps: list[float] = []
+    workers: set[int] = set()
+    idle = threading.Event()
+    done = threading.Event()
+
+    def on_cycle_end(session: object) -> None:
+        ended_at.append(time.perf_counter())
+
+    def on_state(state: TimerState) -> None:
+        if state == TimerState.IDLE:
+            idle.set()
+        elif ended_at and len(gaps) < len(ended_at):
+            gaps.append(time.perf_counter() - ended_at[-1])
+
+    svc.on_cycle_end(on_cycle_end)
+    svc.on_state(on_state)
+    svc.on_tick(lambda e, r, s: workers.add(threading.get_ident()))
+
+    if mode == "plan":
+        svc.start_plan(steps)
+        idle.wait(len(steps) * 2.0)
+    else:
+        def controller() -> None:
+            for step in steps:
+                starter = svc.start_focus if step.type == SessionType.FOCUS else svc.start_break
+                svc.stop()
+                idle.clear()
+                starter(dur_s=step.duration_s)
+                idle.wait(5.0)
+            done.set()
+
+        threading.Thread(target=controller, daemon=True).start()
+        done.wait(len(steps) * 5.0)
+    svc.stop()
+    return gaps, len(workers)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=6)
+    args = parser.parse_args()
+
+    steps = _steps(args.steps)
+    print(f"{'mode':<8} {'transitions':>11} {'gap_p50_us':>11} {'gap_max_us':>11} {'worker_threads':>15}")
+    for mode in ("restart", "plan"):
+        gaps, workers = run(mode, steps)
+        p50 = statistics.median(gaps) * 1e6 if gaps else float("nan")
+        worst = max(gaps) * 1e6 if gaps else float("nan")
+        print(f"{mode:<8} {len(gaps):>11} {p50:>11.1f} {worst:>11.1f} {workers:>15}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
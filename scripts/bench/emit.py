@@ -0,0 +1,79 @@
+"""Micro-benchmark: TimerService._emit cost from 1 to 1,000 subscribers.
+
+Compares the copy-on-write registries against the previous emit path (lock +
+copy of the local set + copy of the module-level set + list concatenation).
+Example:
+
+    python scripts/bench/emit.py --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.models import TimerState  # noqa: E402
+from pomodoro_app.core.timer_service import TimerService  # noqa: E402
+
+
+def _make_callback() -> object:
+    def on_tick(elapsed: int, remaining: int, state: TimerState) -> None:
+        return None
+
+    return on_tick
+
+
+def _legacy_emit(svc: TimerService, local: set[object], module: set[object], *args: object) -> None:
+    # Reproduces the pre copy-on-write emit path for comparison
+    with svc._lock:
+        local_callbacks = list(local)
+    module_callbacks = list(module)
+    for cb in local_callbacks + module_callbacks:
+        try:
+            cb(*args)  # type: ignore[operator]
+        except Exception:
+            pass
+
+
+def run(subscribers: int, iterations: int) -> tuple[float, float]:
+    svc = TimerService()
+    callbacks = [_make_callback() for _ in range(subscribers)]
+    for cb in callbacks:
+        svc.on_tick(cb)  # type: ignore[arg-type]
+    legacy_local = set(callbacks)
+    legacy_module: set[object] = set()
+    args = (1, 2, TimerState.RUNNING_FOCUS)
+
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        _legacy_emit(svc, legacy_local, legacy_module, *args)
+    legacy = (time.perf_counter() - t0) / iterations
+
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        svc._emit("tick", *args)
+    cow = (time.perf_counter() - t0) / iterations
+    return legacy, cow
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--subscribers", type=int, nargs="*", default=[1, 10, 100, 1000])
+    args = parser.parse_args()
+
+    print(f"{'subscribers':>12} {'legacy_us':>12} {'cow_us':>12} {'speedup':>8}")
+    for n in args.subscribers:
+        iterations = max(100, args.iterations // max(1, n // 10))
+        legacy, cow = run(n, iterations)
+        print(f"{n:>12} {legacy * 1e6:>12.2f} {cow * 1e6:>12.2f} {legacy / cow:>8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+"""Benchmark: streaming history export/import (CSV and JSONL).
+
+Fills a file-backed database with N sessions, exports them with
+`export_history`, imports the file into a fresh database with
+`import_history` and imports it once more (every id a duplicate, skipped).
+Reports rows/s and the peak Python memory of each step. Example:
+
+    python scripts/bench/history_transfer.py --rows 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.adapters.cli.history import TransferReport, export_history, import_history  # noqa: E402
+from pomodoro_app.core.models import Session, SessionType, TimerState  # noqa: E402
+from pomodoro_app.infrastructure.db.connection import connect  # noqa: E402
+from pomodoro_app.infrastructure.db.repositories import SessionRepository  # noqa: E402
+from pomodoro_app.infrastructure.db.schema import ensure_schema  # noqa: E402
+
+
+def _sessions(rows: int):  # type: ignore[no-untyped-def]
+    base = datetime(2015, 1, 1, 8, 0, 0)
+    for i in range(rows):
+        started = base + timedelta(minutes=30 * i)
+        duration = 1500 if i % 2 == 0 else 300
+        yield Session(
+            id=uuid.uuid4(),
+            type=SessionType.FOCUS if i % 2 == 0 else SessionType.BREAK,
+            duration_s=duration,
+            started_at=started,
+            ended_at=started + timedelta(seconds=duration - 60 if i % 7 == 0 else duration),
+            state=TimerState.IDLE,
+        )
+
+
+def _repo(path: Path) -> SessionRepository:
+    conn = connect(path)
+    ensure_schema(conn)
+    return SessionRepository(conn)
+
+
+def _traced(fn: Callable[[], TransferReport]) -> tuple[TransferReport, float]:
+    tracemalloc.start()
+    report = fn()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return report, peak / 2**20
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--formats", nargs="+", default=["csv", "jsonl"])
+    parser.add_argument("--trace", action="store_true", help="measure peak memory (slows every step)")
+    args = parser.parse_args()
+    logging.getLogger("pomodoro.infrastructure.db").setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as td:
+        source = _repo(Path(td) / "source.sqlite3")
+        source.add_many(_sessions(args.rows), chunk=50_000)
+        print(f"rows={args.rows:,}")
+        print(f"{'format':<7} {'step':<18} {'rows/s':>10} {'seconds':>8} {'peak_MiB':>9} {'file_MiB':>9}")
+        for fmt in args.formats:
+            path = Path(td) / f"history.{fmt}"
+            target = _repo(Path(td) / f"target_{fmt}.sqlite3")
+            steps: list[tuple[str, Callable[[], TransferReport]]] = [
+                ("export", lambda p=path, f=fmt: export_history(source, str(p), f)),
+                ("import", lambda p=path, t=target: import_history(t, str(p))),
+                ("import duplicates", lambda p=path, t=target: import_history(t, str(p))),
+            ]
+            for name, step in steps:
+                report, peak = _traced(step) if args.trace else (step(), None)
+                assert report.rows == args.rows
+                size = path.stat().st_size / 2**20
+                print(
+                    f"{fmt:<7} {name:<18} {report.rows_per_second:>10,.0f} {report.seconds:>8.1f} "
+                    f"{'-' if peak is None else f'{peak:.1f}':>9} {size:>9.1f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
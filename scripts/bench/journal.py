@@ -0,0 +1,104 @@
+"""Benchmark: cost of journaling timer transitions and of recovering from it.
+
+1. Per-transition overhead: runs start/pause/resume/stop cycles on a simulated
+   TimerService with no journal, with an fsync per record and with batched
+   (group-commit) fsyncs.
+2. Recovery time: fills a journal with many past sessions plus one long
+   running session and times `TimerService.recover()`.
+
+Example:
+
+    python scripts/bench/journal.py --cycles 2000 --records 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.models import JournalRecord, SessionType  # noqa: E402
+from pomodoro_app.core.simulation import simulated_service  # noqa: E402
+from pomodoro_app.infrastructure.journal.file_journal import FileJournal  # noqa: E402
+
+
+def transition_cost(cycles: int, journal: FileJournal | None) -> float:
+    """Return microseconds per transition (4 transitions per cycle)."""
+
+    svc, sim = simulated_service(tick_interval=1.0, journal=journal)
+    t0 = time.perf_counter()
+    for _ in range(cycles):
+        svc.start_focus(dur_s=1500)
+        sim.run_for(1)
+        svc.pause()
+        svc.resume()
+        svc.stop()
+    elapsed = time.perf_counter() - t0
+    if journal is not None:
+        journal.close()
+    return elapsed / (cycles * 4) * 1e6
+
+
+def _fill(path: Path, records: int, last_session_records: int) -> None:
+    # Bypass TimerService (which resets the journal per session) to grow the file
+    wall = datetime(2024, 1, 1)
+    with FileJournal(path, sync_interval=60.0) as journal:
+        written = 0
+        while written < records - last_session_records:
+            sid = uuid.uuid4()
+            for op in ("start", "pause", "resume", "finish"):
+                journal.append(JournalRecord(op, sid, SessionType.FOCUS, 1500, 750.0, 0.0, wall))
+                written += 1
+            wall += timedelta(minutes=30)
+        sid = uuid.uuid4()
+        journal.append(JournalRecord("start", sid, SessionType.FOCUS, 1500, 1500.0, 0.0, wall))
+        for i in range(last_session_records - 1):
+            journal.append(JournalRecord("pause" if i % 2 == 0 else "resume", sid, SessionType.FOCUS, 1500, 900.0, 0.0, wall))
+
+
+def recovery_time(path: Path) -> tuple[float, int]:
+    journal = FileJournal(path)
+    svc, _ = simulated_service(tick_interval=1.0, journal=journal)
+    t0 = time.perf_counter()
+    recovered = svc.recover()
+    elapsed = time.perf_counter() - t0
+    assert recovered
+    journal.close()
+    return elapsed, path.stat().st_size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cycles", type=int, default=2000)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as td:
+        base = Path(td)
+        print(f"{'journal':<24} {'us/transition':>14}")
+        for name, factory in (
+            ("none", lambda: None),
+            ("fsync per record", lambda: FileJournal(base / "per_record.journal", sync_interval=0)),
+            ("batched (50ms)", lambda: FileJournal(base / "batched.journal", sync_interval=0.05)),
+        ):
+            print(f"{name:<24} {transition_cost(args.cycles, factory()):>14.1f}")
+
+        print()
+        print(f"{'records':>10} {'last_session':>13} {'file_MiB':>9} {'recover_ms':>11}")
+        for last_session in (2, 10_000):
+            path = base / f"large_{last_session}.journal"
+            _fill(path, args.records, last_session)
+            elapsed, size = recovery_time(path)
+            print(f"{args.records:>10,} {last_session:>13,} {size / 2**20:>9.1f} {elapsed * 1e3:>11.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,82 @@
+"""Benchmark: cycle_end -> state latency with inline persistence vs the writer thread.
+
+Runs a cycle plan of N one-second sessions against a file-backed database
+and measures, on the timer thread, the time from the start of `cycle_end`
+dispatch to the `state` event of the next session. "inline" wires
+persistence to the connection pool (the insert and its WAL sync run inside
+the `cycle_end` callback); "writer" wires it to a `DatabaseWriter`, which
+only queues the insert. Example:
+
+    python scripts/bench/persistence_latency.py --steps 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.models import PlanStep, SessionType, TimerState  # noqa: E402
+from pomodoro_app.core.timer_service import TimerService  # noqa: E402
+from pomodoro_app.infrastructure.db.integration import wire_persistence  # noqa: E402
+from pomodoro_app.infrastructure.db.pool import ConnectionPool  # noqa: E402
+from pomodoro_app.infrastructure.db.writer import DatabaseWriter  # noqa: E402
+
+
+def run(db_path: Path, mode: str, synchronous: str, steps: int) -> list[float]:
+    with ConnectionPool(db_path, readers=1) as pool:
+        with pool.writer() as conn:
+            conn.execute(f"PRAGMA synchronous={synchronous}")
+        writer = DatabaseWriter(pool) if mode == "writer" else None
+        service = TimerService(tick_interval=0.25)
+        ended: list[float] = []
+        gaps: list[float] = []
+        idle = threading.Event()
+
+        def on_state(state: TimerState) -> None:
+            if state == TimerState.IDLE:
+                idle.set()
+            if ended and len(gaps) < len(ended):
+                gaps.append(time.perf_counter() - ended[-1])
+
+        # Registered before the persistence observer, so it runs first
+        service.on_cycle_end(lambda session: ended.append(time.perf_counter()))
+        unsubscribe = wire_persistence(service, writer if writer is not None else pool)
+        service.on_state(on_state)
+        service.start_plan([PlanStep(SessionType.FOCUS, 1) for _ in range(steps)])
+        idle.wait(steps * 2.0)
+        service.close()
+        unsubscribe()
+        if writer is not None:
+            writer.close()
+        with pool.reader() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == steps
+    return gaps
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=10)
+    args = parser.parse_args()
+    logging.getLogger("pomodoro.infrastructure.db").setLevel(logging.WARNING)
+
+    print(f"{'synchronous':<12} {'mode':<8} {'samples':>8} {'p50_us':>9} {'max_us':>9}")
+    with tempfile.TemporaryDirectory() as td:
+        for synchronous in ("NORMAL", "FULL"):
+            for mode in ("inline", "writer"):
+                gaps = run(Path(td) / f"{synchronous}_{mode}.sqlite3", mode, synchronous, args.steps)
+                p50, worst = statistics.median(gaps) * 1e6, max(gaps) * 1e6
+                print(f"{synchronous:<12} {mode:<8} {len(gaps):>8} {p50:>9.1f} {worst:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
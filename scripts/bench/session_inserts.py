@@ -0,0 +1,82 @@
+"""Benchmark: session insert throughput, per-row add() vs write-behind batches.
+
+Inserts N synthetic sessions into a fresh file-backed database (WAL, as
+opened by `connect()`) through `SessionRepository.add`, once committing each
+row and once with `write_behind=True`. Example:
+
+    python scripts/bench/session_inserts.py --rows 20000 --batch-size 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.models import Session, SessionType, TimerState  # noqa: E402
+from pomodoro_app.infrastructure.db.connection import connect  # noqa: E402
+from pomodoro_app.infrastructure.db.repositories import SessionRepository  # noqa: E402
+from pomodoro_app.infrastructure.db.schema import ensure_schema  # noqa: E402
+
+
+def _sessions(rows: int) -> list[Session]:
+    base = datetime(2024, 1, 1, 8, 0, 0)
+    return [
+        Session(
+            id=uuid.uuid4(),
+            type=SessionType.FOCUS,
+            duration_s=1500,
+            started_at=base + timedelta(minutes=30 * i),
+            ended_at=base + timedelta(minutes=30 * i + 25),
+            state=TimerState.IDLE,
+        )
+        for i in range(rows)
+    ]
+
+
+def run(db_path: Path, sessions: list[Session], write_behind: bool, batch_size: int, synchronous: str) -> float:
+    conn = connect(db_path)
+    conn.execute(f"PRAGMA synchronous={synchronous}")
+    ensure_schema(conn)
+    repo = SessionRepository(conn, write_behind=write_behind, batch_size=batch_size)
+    t0 = time.perf_counter()
+    for session in sessions:
+        repo.add(session)
+    repo.close()
+    elapsed = time.perf_counter() - t0
+    assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == len(sessions)
+    conn.close()
+    return len(sessions) / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    # Keep the logger from dominating the per-row numbers
+    logging.getLogger("pomodoro.infrastructure.db").setLevel(logging.WARNING)
+    sessions = _sessions(args.rows)
+    print(f"rows={args.rows:,} batch_size={args.batch_size}")
+    print(f"{'synchronous':<12} {'mode':<14} {'rows/s':>12}")
+    with tempfile.TemporaryDirectory() as td:
+        for synchronous in ("NORMAL", "FULL"):
+            for write_behind in (False, True):
+                path = Path(td) / f"{synchronous}_{write_behind}.sqlite3"
+                rate = run(path, sessions, write_behind, args.batch_size, synchronous)
+                mode = "write-behind" if write_behind else "per-row"
+                print(f"{synchronous:<12} {mode:<14} {rate:>12,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
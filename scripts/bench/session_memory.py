@@ -0,0 +1,110 @@
+"""Benchmark: memory used by loaded session histories, Session vs CompactSession.
+
+Fills an in-memory SQLite database with synthetic sessions, then loads the
+whole history through `SessionRepository.list_by_period` in both modes and
+reports the memory retained by the resulting list, then streams it through
+`iter_by_period` and reports the peak memory of each approach. Example:
+
+    python scripts/bench/session_memory.py --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sqlite3
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.models import SessionType, TimerState, datetime_to_epoch_us  # noqa: E402
+from pomodoro_app.infrastructure.db.repositories import SessionRepository  # noqa: E402
+from pomodoro_app.infrastructure.db.schema import (  # noqa: E402
+    SESSION_TYPE_CODES,
+    TIMER_STATE_CODES,
+    ensure_schema,
+)
+
+
+def _fill(conn: sqlite3.Connection, rows: int) -> None:
+    base = datetime(2020, 1, 1, 8, 0, 0)
+
+    def _rows():  # type: ignore[no-untyped-def]
+        for i in range(rows):
+            started = base + timedelta(minutes=30 * i)
+            yield (
+                uuid.uuid4().bytes,
+                SESSION_TYPE_CODES[SessionType.FOCUS if i % 2 == 0 else SessionType.BREAK],
+                1500 if i % 2 == 0 else 300,
+                started.isoformat(),
+                (started + timedelta(seconds=1500 if i % 2 == 0 else 300)).isoformat(),
+                TIMER_STATE_CODES[TimerState.IDLE],
+                datetime_to_epoch_us(started),
+            )
+
+    conn.execute("BEGIN")
+    conn.executemany(
+        "INSERT INTO sessions(id, type, duration_s, started_at, ended_at, state, started_at_us)"
+        " VALUES(?, ?, ?, ?, ?, ?, ?)",
+        _rows(),
+    )
+    conn.execute("COMMIT")
+
+
+def measure(conn: sqlite3.Connection, compact: bool) -> tuple[float, float, float]:
+    repo = SessionRepository(conn, compact=compact)
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    sessions = repo.list_by_period(None, None)
+    elapsed = time.perf_counter() - t0
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_row = retained / max(1, len(sessions))
+    del sessions
+    return per_row, peak, elapsed
+
+
+def measure_stream(conn: sqlite3.Connection, chunk: int) -> tuple[int, float, float]:
+    repo = SessionRepository(conn)
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    count = sum(1 for _ in repo.iter_by_period(None, None, chunk=chunk))
+    elapsed = time.perf_counter() - t0
+    _retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, peak, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk", type=int, default=500)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    ensure_schema(conn)
+    _fill(conn, args.rows)
+
+    print(f"rows={args.rows:,}")
+    print(f"{'mode':<16} {'bytes/session':>14} {'total_MiB':>10} {'peak_MiB':>10} {'load_s':>8}")
+    for compact in (False, True):
+        per_row, peak, elapsed = measure(conn, compact)
+        name = "CompactSession" if compact else "Session"
+        total = per_row * args.rows / 2**20
+        print(f"{name:<16} {per_row:>14.1f} {total:>10.1f} {peak / 2**20:>10.1f} {elapsed:>8.2f}")
+    count, peak, elapsed = measure_stream(conn, args.chunk)
+    assert count == args.rows
+    print(f"{'iter_by_period':<16} {'-':>14} {'-':>10} {peak / 2**20:>10.1f} {elapsed:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
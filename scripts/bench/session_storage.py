@@ -0,0 +1,146 @@
+"""Benchmark: sessions table layout, schema v3 (TEXT uuid key) vs v4 (rowid + BLOB uuid).
+
+Creates two file-backed databases, one stopped at schema v3 (random UUID4
+text primary key, enum names) and one at the current schema (INTEGER rowid
+key, 16-byte BLOB uuid under a unique index, integer enum codes). Inserts
+the same N sessions into both in 10k-row transactions, then scans the
+whole table into `Session` objects and looks up random ids. Reports file
+size and throughput. Example:
+
+    python scripts/bench/session_storage.py --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.models import Session, SessionType, TimerState  # noqa: E402
+from pomodoro_app.infrastructure.db import schema  # noqa: E402
+from pomodoro_app.infrastructure.db.connection import connect  # noqa: E402
+from pomodoro_app.infrastructure.db.repositories import (  # noqa: E402
+    _INSERT_SESSION,
+    SessionRepository,
+    _session_params,
+)
+from pomodoro_app.infrastructure.db.utils import transaction  # noqa: E402
+
+CHUNK = 10_000
+
+
+def _sessions(rows: int) -> list[Session]:
+    base = datetime(2015, 1, 1, 8, 0, 0)
+    return [
+        Session(
+            id=uuid.uuid4(),
+            type=SessionType.FOCUS if i % 2 == 0 else SessionType.BREAK,
+            duration_s=1500 if i % 2 == 0 else 300,
+            started_at=base + timedelta(minutes=30 * i),
+            ended_at=base + timedelta(minutes=30 * i + 25),
+            state=TimerState.IDLE,
+        )
+        for i in range(rows)
+    ]
+
+
+def _v3_params(session: Session) -> tuple[Any, ...]:
+    # The v3 row: text uuid and enum names, same timestamp columns
+    params = _session_params(session)
+    return (str(session.id), session.type.name) + params[2:5] + (session.state.name,) + params[6:]
+
+
+def _v3_row(row: tuple[Any, ...]) -> Session:
+    sid, stype, duration_s, started_at, ended_at, state = row
+    return Session(
+        id=uuid.UUID(sid),
+        type=SessionType[stype],
+        duration_s=duration_s,
+        started_at=datetime.fromisoformat(started_at),
+        ended_at=datetime.fromisoformat(ended_at),
+        state=TimerState[state],
+    )
+
+
+def _open(path: Path, version: int) -> sqlite3.Connection:
+    conn = connect(path)
+    for stmt in schema.SCHEMA_STATEMENTS:
+        conn.execute(stmt)
+    for migration in schema.MIGRATIONS[:version]:
+        migration(conn)
+    conn.execute(f"PRAGMA user_version = {version}")
+    return conn
+
+
+def _insert(conn: sqlite3.Connection, params: list[tuple[Any, ...]]) -> float:
+    t0 = time.perf_counter()
+    for i in range(0, len(params), CHUNK):
+        with transaction(conn):
+            conn.executemany(_INSERT_SESSION, params[i : i + CHUNK])
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return time.perf_counter() - t0
+
+
+def _timed(fn: Callable[[], Any]) -> tuple[float, Any]:
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+    logging.getLogger("pomodoro.infrastructure.db").setLevel(logging.WARNING)
+
+    sessions = _sessions(args.rows)
+    probe = random.Random(1).sample(sessions, min(args.lookups, len(sessions)))
+    layouts = {
+        "v3 text uuid": (3, [_v3_params(s) for s in sessions], lambda s: str(s.id)),
+        f"v{schema.SCHEMA_VERSION} rowid+blob": (
+            schema.SCHEMA_VERSION,
+            [_session_params(s) for s in sessions],
+            lambda s: s.id.bytes,
+        ),
+    }
+    print(f"rows={args.rows:,}")
+    print(f"{'layout':<16} {'file_MiB':>9} {'insert/s':>10} {'scan/s':>10} {'lookup/s':>10}")
+    with tempfile.TemporaryDirectory() as td:
+        for name, (version, params, key) in layouts.items():
+            path = Path(td) / f"v{version}.sqlite3"
+            conn = _open(path, version)
+            t_insert = _insert(conn, params)
+            size = path.stat().st_size / 2**20
+            sql = "SELECT id, type, duration_s, started_at, ended_at, state FROM sessions ORDER BY started_at_us"
+            if version == 3:
+                t_scan, loaded = _timed(lambda c=conn, q=sql: [_v3_row(r) for r in c.execute(q)])
+            else:
+                t_scan, loaded = _timed(lambda c=conn: SessionRepository(c).list_by_period(None, None))
+            assert loaded == sessions
+            lookup = "SELECT rowid FROM sessions WHERE id = ?"
+            t_lookup, found = _timed(
+                lambda c=conn, q=lookup, k=key: [c.execute(q, (k(s),)).fetchone() for s in probe]
+            )
+            assert None not in found
+            conn.close()
+            print(
+                f"{name:<16} {size:>9.1f} {args.rows / t_insert:>10,.0f} {args.rows / t_scan:>10,.0f} "
+                f"{len(probe) / t_lookup:>10,.0f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+"""Benchmark: StatsService queries on ISO-text vs integer-epoch columns.
+
+Builds a schema-v0 database (ISO text timestamps only) with N sessions, times
+the legacy text/julianday statistics queries, migrates it with
+`ensure_schema` (integer epoch columns + `elapsed_s`, backfilled in chunks)
+and times `StatsService.compute` on the same ranges. Example:
+
+    python scripts/bench/stats_queries.py --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.infrastructure.db.schema import SCHEMA_STATEMENTS, ensure_schema  # noqa: E402
+from pomodoro_app.infrastructure.db.stats import StatsService  # noqa: E402
+
+BASE = datetime(2020, 1, 1, 8, 0, 0)
+
+
+def _fill_v0(conn: sqlite3.Connection, rows: int) -> None:
+    for stmt in SCHEMA_STATEMENTS:
+        conn.execute(stmt)
+    conn.execute("CREATE INDEX idx_sessions_started_at ON sessions(started_at)")
+
+    def _rows():  # type: ignore[no-untyped-def]
+        for i in range(rows):
+            started = BASE + timedelta(minutes=30 * i)
+            duration = 1500 if i % 2 == 0 else 300
+            elapsed = duration - 60 if i % 7 == 0 else duration
+            yield (
+                str(uuid.uuid4()),
+                "FOCUS" if i % 2 == 0 else "BREAK",
+                duration,
+                started.isoformat(),
+                (started + timedelta(seconds=elapsed)).isoformat(),
+                "IDLE",
+            )
+
+    conn.execute("BEGIN")
+    conn.executemany("INSERT INTO sessions VALUES(?, ?, ?, ?, ?, ?)", _rows())
+    conn.execute("COMMIT")
+
+
+def legacy_compute(conn: sqlite3.Connection, start: datetime | None, end: datetime | None) -> tuple[Any, ...]:
+    # The pre-migration StatsService.compute: text comparisons and julianday per row
+    clauses: list[str] = []
+    params: list[Any] = []
+    if start is not None:
+        clauses.append("started_at >= ?")
+        params.append(start.isoformat())
+    if end is not None:
+        clauses.append("started_at <= ?")
+        params.append(end.isoformat())
+    where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
+    sums = conn.execute(
+        f"""
+        SELECT COALESCE(SUM(CASE WHEN type='FOCUS' THEN duration_s ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN type='BREAK' THEN duration_s ELSE 0 END), 0),
+               COUNT(*)
+        FROM sessions {where}
+        """,
+        params,
+    ).fetchone()
+    intr_where = " AND ".join(
+        clauses
+        + [
+            "started_at IS NOT NULL",
+            "ended_at IS NOT NULL",
+            "(CAST(duration_s AS INTEGER) > CAST(ROUND((julianday(ended_at) - julianday(started_at)) * 86400.0) AS INTEGER))",
+        ]
+    )
+    intr = conn.execute(f"SELECT COUNT(*) FROM sessions WHERE {intr_where}", params).fetchone()
+    return (sums[0], sums[1], intr[0], sums[2])
+
+
+def _best(fn: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.getLogger("pomodoro.infrastructure.db").setLevel(logging.WARNING)
+
+    span = timedelta(minutes=30 * args.rows)
+    ranges = {
+        "all": (None, None),
+        "last 30 days": (BASE + span - timedelta(days=30), BASE + span),
+        "last year": (BASE + span - timedelta(days=365), BASE + span),
+    }
+    with tempfile.TemporaryDirectory() as td:
+        conn = sqlite3.connect(str(Path(td) / "stats.sqlite3"), isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        _fill_v0(conn, args.rows)
+
+        before = {name: _best(lambda r=r: legacy_compute(conn, *r), args.repeat) for name, r in ranges.items()}
+        t0 = time.perf_counter()
+        ensure_schema(conn)
+        migration_s = time.perf_counter() - t0
+        stats = StatsService(conn)
+        after = {name: _best(lambda r=r: stats.compute(*r), args.repeat) for name, r in ranges.items()}
+
+    print(f"rows={args.rows:,} migration={migration_s:.1f}s")
+    print(f"{'range':<14} {'before_ms':>10} {'after_ms':>10} {'speedup':>8}")
+    for name in ranges:
+        (t_before, r_before), (t_after, r_after) = before[name], after[name]
+        assert tuple(r_before) == (
+            r_after.total_focus_seconds,
+            r_after.total_break_seconds,
+            r_after.interruptions,
+            r_after.sessions_count,
+        ), name
+        print(f"{name:<14} {t_before * 1e3:>10.1f} {t_after * 1e3:>10.1f} {t_before / t_after:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
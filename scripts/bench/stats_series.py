@@ -0,0 +1,109 @@
+"""Benchmark: StatsService.compute_series vs one compute() call per bucket.
+
+Fills a file-backed database with N sessions (one every 30 minutes) and,
+for each bucket size, times a single `compute_series` call against the naive
+chart loop that calls `compute(bucket_start, bucket_end)` for every bucket
+of the period. Example:
+
+    python scripts/bench/stats_series.py --rows 200000 --days 365
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.models import Session, SessionType, TimerState  # noqa: E402
+from pomodoro_app.infrastructure.db.connection import connect  # noqa: E402
+from pomodoro_app.infrastructure.db.repositories import SessionRepository  # noqa: E402
+from pomodoro_app.infrastructure.db.schema import ensure_schema  # noqa: E402
+from pomodoro_app.infrastructure.db.stats import StatsService  # noqa: E402
+
+BASE = datetime(2020, 1, 1, 8, 0, 0)
+WIDTHS = {"hour": timedelta(hours=1), "day": timedelta(days=1), "week": timedelta(weeks=1)}
+
+
+def _fill(path: Path, rows: int) -> None:
+    conn = connect(path)
+    ensure_schema(conn)
+    repo = SessionRepository(conn, write_behind=True, batch_size=5_000)
+    for i in range(rows):
+        started = BASE + timedelta(minutes=30 * i)
+        duration = 1500 if i % 2 == 0 else 300
+        repo.add(
+            Session(
+                id=uuid.uuid4(),
+                type=SessionType.FOCUS if i % 2 == 0 else SessionType.BREAK,
+                duration_s=duration,
+                started_at=started,
+                ended_at=started + timedelta(seconds=duration - 60 if i % 7 == 0 else duration),
+                state=TimerState.IDLE,
+            )
+        )
+    repo.close()
+    conn.close()
+
+
+def naive_series(stats: StatsService, start: datetime, end: datetime, width: timedelta) -> list[Any]:
+    out = []
+    lo = start
+    while lo <= end:
+        res = stats.compute(lo, min(end, lo + width - timedelta(microseconds=1)))
+        if res.sessions_count:
+            out.append((lo, res.total_focus_seconds + res.total_break_seconds, res.interruptions, res.sessions_count))
+        lo += width
+    return out
+
+
+def _best(fn: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--days", type=int, default=365, help="length of the charted period (ending at the last row)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.getLogger("pomodoro.infrastructure.db").setLevel(logging.WARNING)
+
+    end = BASE + timedelta(minutes=30 * args.rows)
+    # Monday-aligned start, so naive week buckets line up with compute_series
+    start = end - timedelta(days=args.days)
+    start = datetime(start.year, start.month, start.day) - timedelta(days=start.weekday())
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "series.sqlite3"
+        _fill(path, args.rows)
+        conn = connect(path)
+        stats = StatsService(conn)
+        print(f"rows={args.rows:,} period={start.date()}..{end.date()}")
+        print(f"{'bucket':<8} {'buckets':>8} {'loop_ms':>10} {'series_ms':>10} {'speedup':>8}")
+        for bucket, width in WIDTHS.items():
+            t_loop, expected = _best(lambda w=width: naive_series(stats, start, end, w), args.repeat)
+            t_series, series = _best(
+                lambda b=bucket: stats.compute_series(start, end, bucket=b, group_by_type=False), args.repeat
+            )
+            got = [(b.key, b.total_seconds, b.interruptions, b.sessions_count) for b in series]
+            assert got == expected, bucket
+            print(f"{bucket:<8} {len(series):>8} {t_loop * 1e3:>10.1f} {t_series * 1e3:>10.1f} {t_loop / t_series:>7.1f}x")
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
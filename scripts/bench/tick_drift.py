@@ -0,0 +1,95 @@
+"""Benchmark: tick drift and jitter of TimerService under synthetic callback load.
+
+Runs one long session per tick mode with a tick callback that burns a random
+amount of time, then reports how far tick boundaries drifted, how many ticks
+were skipped/repeated and the per-tick lateness. Example:
+
+    python scripts/bench/tick_drift.py --seconds 120 --tick-interval 0.05 --load-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.models import TimerState  # noqa: E402
+from pomodoro_app.core.timer_service import TimerService  # noqa: E402
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def run(mode: str, seconds: int, tick_interval: float, load_ms: float, seed: int) -> dict[str, float]:
+    rng = random.Random(seed)
+    svc = TimerService(tick_interval=tick_interval, tick_mode=mode)  # type: ignore[arg-type]
+    done = threading.Event()
+    seqs: list[int] = []
+    lateness: list[float] = []
+    phase: list[float] = []
+    start = [0.0]
+
+    def on_tick(elapsed: int, remaining: int, state: TimerState) -> None:
+        now = time.monotonic()
+        timing = svc.last_tick_timing
+        if timing is not None:
+            seqs.append(timing.seq)
+            lateness.append(timing.lateness)
+        # Offset of this wakeup from the ideal grid start + k * tick_interval
+        offset = (now - start[0]) % tick_interval
+        phase.append(min(offset, tick_interval - offset))
+        time.sleep(rng.uniform(0.0, load_ms) / 1000.0)
+
+    svc.on_tick(on_tick)
+    svc.on_cycle_end(lambda _s: done.set())
+    start[0] = time.monotonic()
+    svc.start_focus(dur_s=seconds)
+    done.wait(timeout=seconds * 2 + 5)
+    total = time.monotonic() - start[0]
+    svc.stop()
+
+    steps = [b - a for a, b in zip(seqs, seqs[1:])]
+    return {
+        "ticks": float(len(seqs)),
+        "expected_ticks": float(int(seconds / tick_interval) - 1),
+        "skipped": float(sum(max(0, d - 1) for d in steps)),
+        "repeated": float(sum(1 for d in steps if d <= 0)),
+        "phase_drift_max_ms": 1000.0 * max(phase) if phase else 0.0,
+        "lateness_p50_ms": 1000.0 * _percentile(lateness, 50),
+        "lateness_p99_ms": 1000.0 * _percentile(lateness, 99),
+        "lateness_mean_ms": 1000.0 * statistics.fmean(lateness) if lateness else 0.0,
+        "session_overrun_ms": 1000.0 * (total - seconds),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mode", choices=["interval", "deadline", "both"], default="both")
+    parser.add_argument("--seconds", type=int, default=60)
+    parser.add_argument("--tick-interval", type=float, default=0.05)
+    parser.add_argument("--load-ms", type=float, default=20.0, help="max synthetic callback time per tick")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    modes = ["interval", "deadline"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        result = run(mode, args.seconds, args.tick_interval, args.load_ms, args.seed)
+        print(f"mode={mode}")
+        for key, value in result.items():
+            print(f"  {key:>20}: {value:,.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,53 @@
+"""Benchmark: timer wakeups for one 25-minute session by subscriber resolution.
+
+Runs the session on a virtual clock (no real sleeping) and counts how many
+times the timer had to wake up for each subscriber mix. Example:
+
+    python scripts/bench/tick_wakeups.py --minutes 25
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.simulation import simulated_service  # noqa: E402
+
+
+SCENARIOS: dict[str, list[float | None]] = {
+    "gui 1s": [None],
+    "gui 1s + tray 60s": [None, 60.0],
+    "tray 60s (window hidden)": [60.0],
+    "persistence only (no ticks)": [],
+}
+
+
+def run(minutes: int, tick_mode: str, resolutions: list[float | None]) -> tuple[int, int]:
+    svc, sim = simulated_service(tick_interval=1.0, tick_mode=tick_mode)
+    delivered = [0]
+    for r in resolutions:
+        svc.on_tick(lambda e, rem, s: delivered.__setitem__(0, delivered[0] + 1), resolution=r)
+    svc.start_focus(dur_s=minutes * 60)
+    wakeups = sim.run_until_idle()
+    return wakeups, delivered[0]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=int, default=25)
+    parser.add_argument("--tick-mode", choices=["interval", "deadline"], default="deadline")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<30} {'wakeups':>8} {'ticks_delivered':>16}")
+    for name, resolutions in SCENARIOS.items():
+        wakeups, delivered = run(args.minutes, args.tick_mode, resolutions)
+        print(f"{name:<30} {wakeups:>8} {delivered:>16}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
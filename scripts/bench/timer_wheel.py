@@ -0,0 +1,102 @@
+"""Benchmark: CPU use and tick jitter of many concurrent TimerService instances.
+
+Compares the shared timing wheel (one thread) against the legacy thread-per-timer
+loop. Example:
+
+    python scripts/bench/timer_wheel.py --timers 10000 --seconds 10
+    python scripts/bench/timer_wheel.py --mode threads --timers 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.models import TimerState  # noqa: E402
+from pomodoro_app.core.scheduler import TimingWheelScheduler  # noqa: E402
+from pomodoro_app.core.timer_service import TimerService  # noqa: E402
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def run(mode: str, timers: int, seconds: float, tick_interval: float, resolution: float, workers: int) -> dict[str, float]:
+    wheel = TimingWheelScheduler(resolution=resolution, workers=workers) if mode == "wheel" else None
+    jitters: list[float] = []
+    lock = threading.Lock()
+
+    def make_observer() -> object:
+        last: list[float | None] = [None]
+
+        def on_tick(elapsed: int, remaining: int, state: TimerState) -> None:
+            now = time.monotonic()
+            if last[0] is not None:
+                with lock:
+                    jitters.append(abs((now - last[0]) - tick_interval))
+            last[0] = now
+
+        return on_tick
+
+    services = [TimerService(tick_interval=tick_interval, scheduler=wheel) for _ in range(timers)]
+    for svc in services:
+        svc.on_tick(make_observer())  # type: ignore[arg-type]
+
+    threads_before = threading.active_count()
+    cpu0 = time.process_time()
+    wall0 = time.perf_counter()
+    for svc in services:
+        svc.start_focus(dur_s=int(seconds) + 60)
+    threads_peak = threading.active_count()
+    time.sleep(seconds)
+    cpu1 = time.process_time()
+    wall1 = time.perf_counter()
+    with lock:
+        samples = list(jitters)
+    for svc in services:
+        svc.stop()
+    if wheel is not None:
+        wheel.shutdown()
+
+    wall = wall1 - wall0
+    return {
+        "timers": float(timers),
+        "threads_added": float(threads_peak - threads_before),
+        "ticks": float(len(samples)),
+        "cpu_pct": 100.0 * (cpu1 - cpu0) / wall if wall else 0.0,
+        "jitter_mean_ms": 1000.0 * statistics.fmean(samples) if samples else 0.0,
+        "jitter_p99_ms": 1000.0 * _percentile(samples, 99),
+        "jitter_max_ms": 1000.0 * max(samples) if samples else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mode", choices=["wheel", "threads"], default="wheel")
+    parser.add_argument("--timers", type=int, default=10_000)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--tick-interval", type=float, default=1.0)
+    parser.add_argument("--resolution", type=float, default=0.01)
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+
+    result = run(args.mode, args.timers, args.seconds, args.tick_interval, args.resolution, args.workers)
+    print(f"mode={args.mode}")
+    for key, value in result.items():
+        print(f"  {key:>16}: {value:,.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,117 @@
+"""Benchmark: SQLite auto-checkpoint vs `DatabaseMaintenance`.
+
+Writes bursts of single-session transactions separated by idle gaps and
+measures commit latency, `last_n` read latency and the peak -wal size.
+"auto" leaves checkpointing to SQLite (it runs inside the commit that
+crosses 1000 WAL pages); "maintenance" runs PASSIVE checkpoints from the
+maintenance thread during the gaps. Afterwards most rows are deleted and
+one incremental vacuum pass reports its longest writer hold. Example:
+
+    python scripts/bench/wal_maintenance.py --bursts 20 --burst 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pomodoro_app.core.models import Session, SessionType, TimerState  # noqa: E402
+from pomodoro_app.infrastructure.db.maintenance import DatabaseMaintenance  # noqa: E402
+from pomodoro_app.infrastructure.db.pool import ConnectionPool  # noqa: E402
+from pomodoro_app.infrastructure.db.repositories import SessionRepository  # noqa: E402
+
+
+def _session(i: int) -> Session:
+    start = datetime(2020, 1, 1) + timedelta(minutes=30 * i)
+    return Session(
+        id=uuid.uuid4(),
+        type=SessionType.FOCUS if i % 2 == 0 else SessionType.BREAK,
+        duration_s=1500,
+        started_at=start,
+        ended_at=start + timedelta(seconds=1500),
+        state=TimerState.IDLE,
+    )
+
+
+def _pct(values: list[float], q: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(q * len(values)))] * 1e6
+
+
+def run(db_path: Path, mode: str, bursts: int, burst: int, gap: float) -> dict[str, float]:
+    with ConnectionPool(db_path, readers=1) as pool:
+        maintenance = (
+            DatabaseMaintenance(pool, check_interval=gap / 4, idle_after=gap / 4) if mode == "maintenance" else None
+        )
+        wal_file = f"{db_path}-wal"
+        commits: list[float] = []
+        reads: list[float] = []
+        peak_wal = 0
+        n = 0
+        for _ in range(bursts):
+            for _ in range(burst):
+                t0 = time.perf_counter()
+                with pool.writer() as conn:
+                    SessionRepository(conn).add(_session(n))
+                commits.append(time.perf_counter() - t0)
+                n += 1
+                if n % 50 == 0:
+                    t0 = time.perf_counter()
+                    with pool.reader() as conn:
+                        SessionRepository(conn).last_n(50)
+                    reads.append(time.perf_counter() - t0)
+            peak_wal = max(peak_wal, os.path.getsize(wal_file))
+            time.sleep(gap)
+
+        with pool.writer() as conn:
+            conn.execute("DELETE FROM sessions WHERE seq % 10 != 0")
+        result = {
+            "commit_p50": statistics.median(commits) * 1e6,
+            "commit_p99": _pct(commits, 0.99),
+            "commit_max": max(commits) * 1e6,
+            "read_p50": statistics.median(reads) * 1e6,
+            "peak_wal": peak_wal / 2**20,
+            "vacuum_hold": float("nan"),
+        }
+        if maintenance is not None:
+            maintenance.vacuum()
+            result["vacuum_hold"] = maintenance.metrics().max_writer_hold_s * 1e3
+            maintenance.close()
+        result["final_wal"] = os.path.getsize(wal_file) / 2**20
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bursts", type=int, default=10)
+    parser.add_argument("--burst", type=int, default=500)
+    parser.add_argument("--gap", type=float, default=0.5)
+    args = parser.parse_args()
+    logging.getLogger("pomodoro.infrastructure.db").setLevel(logging.WARNING)
+
+    print(
+        f"{'mode':<12} {'commit_p50':>10} {'commit_p99':>10} {'commit_max':>10} {'read_p50':>9} "
+        f"{'peak_wal_MiB':>12} {'final_wal_MiB':>13} {'vacuum_hold_ms':>14}"
+    )
+    with tempfile.TemporaryDirectory() as td:
+        for mode in ("auto", "maintenance"):
+            r = run(Path(td) / f"{mode}.sqlite3", mode, args.bursts, args.burst, args.gap)
+            print(
+                f"{mode:<12} {r['commit_p50']:>10.1f} {r['commit_p99']:>10.1f} {r['commit_max']:>10.1f} "
+                f"{r['read_p50']:>9.1f} {r['peak_wal']:>12.2f} {r['final_wal']:>13.2f} {r['vacuum_hold']:>14.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+
+from pomodoro_app.core.models import TimerState
+from pomodoro_app.core.timer_service import TimerService
+
+
+def _latency(call, reached: threading.Event) -> float:  # type: ignore[no-untyped-def]
+    # Time from the control call until the worker thread has reacted to it
+    reached.clear()
+    started = time.perf_counter()
+    call()
+    assert reached.wait(1.0)
+    return time.perf_counter() - started
+
+
+def test_control_calls_take_effect_without_waiting_for_a_tick() -> None:
+    # A long tick interval: any latency tied to the tick would show up as ~1s
+    svc = TimerService(tick_interval=1.0)
+    loop_iterations = [0]
+    woke = threading.Event()
+    next_delay = svc._next_delay
+
+    def counting_next_delay(now: float) -> float:
+        loop_iterations[0] += 1
+        woke.set()
+        return next_delay(now)
+
+    svc._next_delay = counting_next_delay  # type: ignore[method-assign]
+    samples: dict[str, list[float]] = {"pause": [], "resume": [], "stop": []}
+    stopped = threading.Event()
+    svc.on_state(lambda s: stopped.set() if s == TimerState.IDLE else None)
+
+    for _ in range(50):
+        woke.clear()
+        svc.start_focus(dur_s=60)
+        assert woke.wait(1.0)
+
+        started = time.perf_counter()
+        svc.pause()
+        samples["pause"].append(time.perf_counter() - started)
+        # Paused timers park: the loop must not come back around on its own
+        before = loop_iterations[0]
+        time.sleep(0.002)
+        assert loop_iterations[0] == before
+
+        samples["resume"].append(_latency(svc.resume, woke))
+        samples["stop"].append(_latency(svc.stop, stopped))
+    svc.close()
+
+    for name, values in samples.items():
+        # Typically a few microseconds; bounds are loose for busy CI machines
+        assert statistics.median(values) < 0.005, name
+        assert max(values) < 0.2, name
+
+
+def test_paused_timer_does_not_wake_up() -> None:
+    svc = TimerService(tick_interval=0.005)
+    calls = [0]
+    next_delay = svc._next_delay
+
+    def counting_next_delay(now: float) -> float:
+        calls[0] += 1
+        return next_delay(now)
+
+    svc._next_delay = counting_next_delay  # type: ignore[method-assign]
+    svc.start_focus(dur_s=60)
+    time.sleep(0.05)
+    svc.pause()
+    time.sleep(0.01)
+    parked_at = calls[0]
+    time.sleep(0.1)
+    # Polling every tick would have added ~20 iterations
+    assert calls[0] == parked_at
+    svc.resume()
+    time.sleep(0.05)
+    assert calls[0] > parked_at
+    svc.close()
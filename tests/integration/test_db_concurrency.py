@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import logging
+import sqlite3
 import threading
+import time
 from datetime import datetime, timedelta
 
+import pytest
+
 from pomodoro_app.core.models import Session, SessionType, TimerState
 from pomodoro_app.infrastructure.db.repositories import SessionRepository
 
@@ -36,3 +41,142 @@ def test_concurrent_inserts_serialized_by_sqlite(temp_conn) -> None:
     # Expect 40 sessions total
     assert len(repo.last_n(1000)) == 40
 
+
+def test_pool_readers_do_not_wait_for_an_open_write_transaction(tmp_path) -> None:
+    from pomodoro_app.infrastructure.db.pool import ConnectionPool
+    from pomodoro_app.infrastructure.db.utils import transaction
+
+    base = datetime(2024, 1, 1, 0, 0, 0)
+    with ConnectionPool(tmp_path / "pool.sqlite3", readers=2) as pool:
+        with pool.writer() as conn:
+            SessionRepository(conn).add(_mk_session(0, base))
+            with transaction(conn):
+                conn.execute(
+                    "INSERT INTO sessions(id, type, duration_s, state) VALUES(?, 1, 60, 1)",
+                    (_mk_session(1, base).id.bytes,),
+                )
+                # WAL: a reader sees the last committed state without blocking
+                with pool.reader(timeout=0.5) as reader:
+                    assert len(SessionRepository(reader).last_n(10)) == 1
+        with pool.reader() as reader:
+            assert len(SessionRepository(reader).last_n(10)) == 2
+            # Readers are read-only connections
+            try:
+                reader.execute("DELETE FROM sessions")
+            except sqlite3.OperationalError:
+                pass
+            else:
+                raise AssertionError("reader connection accepted a write")
+
+        metrics = pool.metrics()
+        assert metrics.writer_checkouts == 1
+        assert metrics.reader_checkouts == 2
+        assert metrics.readers_open == 1
+        assert metrics.readers_in_use == 0
+
+
+def test_get_pool_rejects_a_second_database(tmp_path) -> None:
+    from pomodoro_app.infrastructure.db.pool import close_pool, get_pool
+
+    try:
+        pool = get_pool(tmp_path / "a.sqlite3")
+        assert get_pool() is pool
+        assert get_pool(tmp_path / "sub" / ".." / "a.sqlite3") is pool
+        with pytest.raises(ValueError):
+            get_pool(tmp_path / "b.sqlite3")
+    finally:
+        close_pool()
+
+
+def _read_write_throughput(read: object, write: object, seconds: float, readers: int) -> tuple[int, int, float]:
+    stop = threading.Event()
+    counts: dict[str, float] = {"reads": 0, "writes": 0, "max_read": 0.0}
+    lock = threading.Lock()
+    base = datetime(2024, 1, 1, 0, 0, 0)
+
+    def writer_loop() -> None:
+        i = 0
+        while not stop.is_set():
+            write(_mk_session(i, base))  # type: ignore[operator]
+            i += 1
+        with lock:
+            counts["writes"] += i
+
+    def reader_loop() -> None:
+        n, worst = 0, 0.0
+        while not stop.is_set():
+            started = time.perf_counter()
+            read()  # type: ignore[operator]
+            worst = max(worst, time.perf_counter() - started)
+            n += 1
+        with lock:
+            counts["reads"] += n
+            counts["max_read"] = max(counts["max_read"], worst)
+
+    threads = [threading.Thread(target=writer_loop)] + [threading.Thread(target=reader_loop) for _ in range(readers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    return int(counts["reads"]), int(counts["writes"]), counts["max_read"]
+
+
+def test_concurrent_read_write_throughput_shared_connection_vs_pool(tmp_path) -> None:
+    from pomodoro_app.infrastructure.db.connection import connect
+    from pomodoro_app.infrastructure.db.pool import ConnectionPool
+    from pomodoro_app.infrastructure.db.schema import ensure_schema
+
+    logging.getLogger("pomodoro.infrastructure.db").setLevel(logging.WARNING)
+    seconds, readers = 0.5, 4
+    # Stands in for the disk flush of a commit: the write lock is held, the CPU is free
+    flush = 0.002
+    query = (
+        "SELECT id, type, duration_s, started_at FROM sessions ORDER BY started_at_us DESC LIMIT 20"
+    )
+    try:
+        # Baseline: one connection shared by every thread (serialized by a lock)
+        shared = connect(tmp_path / "shared.sqlite3")
+        ensure_schema(shared)
+        shared_lock = threading.Lock()
+        shared_repo = SessionRepository(shared)
+
+        def shared_read() -> None:
+            with shared_lock:
+                shared.execute(query).fetchall()
+
+        def shared_write(session: Session) -> None:
+            with shared_lock:
+                shared_repo.add(session)
+                time.sleep(flush)
+
+        baseline = _read_write_throughput(shared_read, shared_write, seconds, readers)
+        shared.close()
+
+        with ConnectionPool(tmp_path / "pooled.sqlite3", readers=readers) as pool:
+
+            def pool_read() -> None:
+                with pool.reader() as conn:
+                    conn.execute(query).fetchall()
+
+            def pool_write(session: Session) -> None:
+                with pool.writer() as conn:
+                    SessionRepository(conn).add(session)
+                    time.sleep(flush)
+
+            pooled = _read_write_throughput(pool_read, pool_write, seconds, readers)
+            metrics = pool.metrics()
+    finally:
+        logging.getLogger("pomodoro.infrastructure.db").setLevel(logging.NOTSET)
+
+    assert pooled[0] > 0 and pooled[1] > 0
+    # Readers of a shared connection keep taking its lock and starve the writer;
+    # WAL readers never block the pool's writer
+    assert pooled[1] >= 2 * baseline[1], (baseline, pooled)
+    # ...and reads do not collapse now that the writer gets its share of the CPU
+    # (0.4-0.8x of the starved baseline on one core; more with several)
+    assert pooled[0] >= 0.25 * baseline[0], (baseline, pooled)
+    assert metrics.reader_checkouts == pooled[0]
+    assert metrics.writer_checkouts == pooled[1]
+    assert metrics.readers_open <= readers
@@ -46,3 +46,46 @@ def test_load_settings_defaults_and_overrides(temp_conn) -> None:
     loaded = load_settings(conn)
     assert loaded == {"durations": {"focus": 10, "break": 20}, "overlay": True, "language": "en"}
 
+
+def test_get_settings_is_a_shared_cache_over_the_pool() -> None:
+    from pomodoro_app.infrastructure.db.integration import get_settings
+    from pomodoro_app.infrastructure.db.pool import close_pool
+
+    close_pool()
+    try:
+        settings = get_settings()
+        assert get_settings() is settings
+        seen: list[dict] = []
+        settings.subscribe(seen.append)
+        settings.set("language", "pt_BR")
+        assert load_settings(settings)["language"] == "pt_BR"
+        assert seen == [{"language": "pt_BR"}]
+    finally:
+        close_pool()
+    assert get_settings() is not settings
+    close_pool()
+
+
+def test_writer_thread_keeps_database_waits_off_the_timer_thread(tmp_path) -> None:
+    import threading
+
+    from pomodoro_app.core.models import TimerState
+    from pomodoro_app.infrastructure.db.pool import ConnectionPool
+    from pomodoro_app.infrastructure.db.writer import DatabaseWriter
+
+    with ConnectionPool(tmp_path / "writer.sqlite3", readers=1) as pool, DatabaseWriter(pool) as writer:
+        service = TimerService(tick_interval=0.05)
+        unsubscribe = wire_persistence(service, writer)
+        idle = threading.Event()
+        service.on_state(lambda s: idle.set() if s == TimerState.IDLE else None)
+        try:
+            # Another connection user holds the database while the session ends
+            with pool.writer():
+                service.start_focus(dur_s=1)
+                assert idle.wait(3.0)
+            writer.flush(2.0)
+            with pool.reader() as conn:
+                assert len(SessionRepository(conn).last_n(1)) == 1
+        finally:
+            service.close()
+            unsubscribe()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from pomodoro_app.core.async_timer_service import AsyncTimerService
+from pomodoro_app.core.errors import InvalidStateError
+from pomodoro_app.core.models import Session, TimerState
+
+
+def test_async_service_shares_state_guards() -> None:
+    async def scenario() -> None:
+        svc = AsyncTimerService(tick_interval=0.01)
+        with pytest.raises(InvalidStateError):
+            svc.pause()
+        svc.start_focus(dur_s=2)
+        with pytest.raises(InvalidStateError):
+            svc.start_break(dur_s=1)
+        svc.pause()
+        assert svc.is_paused
+        svc.resume()
+        assert svc.is_running
+        svc.stop()
+        assert svc.state == TimerState.IDLE
+
+    asyncio.run(scenario())
+
+
+def test_awaitable_observers_and_tick_stream_without_threads() -> None:
+    async def scenario() -> tuple[list[int], list[Session], list[TimerState]]:
+        threads_before = threading.active_count()
+        svc = AsyncTimerService(tick_interval=0.25)
+        ended: list[Session] = []
+        states: list[TimerState] = []
+
+        async def on_cycle_end(session: Session) -> None:
+            await asyncio.sleep(0)
+            ended.append(session)
+
+        svc.on_cycle_end(on_cycle_end)
+        svc.on_state(states.append)
+        svc.start_focus(dur_s=1)
+        assert threading.active_count() == threads_before
+
+        remaining = [tick.remaining async for tick in svc.ticks()]
+        await svc.drain()
+        return remaining, ended, states
+
+    remaining, ended, states = asyncio.run(scenario())
+    assert len(remaining) == 3  # boundaries at 0.25s, 0.5s and 0.75s
+    assert len(ended) == 1
+    assert states == [TimerState.RUNNING_FOCUS, TimerState.IDLE]
+
+
+def test_many_timers_on_one_loop() -> None:
+    async def scenario() -> int:
+        services = [AsyncTimerService(tick_interval=0.05) for _ in range(500)]
+        for svc in services:
+            svc.start_focus(dur_s=1)
+        counts = await asyncio.gather(*(_count_ticks(svc) for svc in services))
+        return sum(counts)
+
+    async def _count_ticks(svc: AsyncTimerService) -> int:
+        return len([tick async for tick in svc.ticks()])
+
+    assert asyncio.run(scenario()) > 0
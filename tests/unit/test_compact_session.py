@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from pomodoro_app.core.models import CompactSession, Session, SessionType, TimerState
+from pomodoro_app.infrastructure.db.repositories import SessionRepository
+
+
+def _mk_session(idx: int) -> Session:
+    base = datetime(2024, 3, 10, 8, 30, 15, 123456)
+    return Session(
+        id=uuid4(),
+        type=SessionType.FOCUS if idx % 2 == 0 else SessionType.BREAK,
+        duration_s=1500,
+        started_at=base + timedelta(minutes=idx),
+        ended_at=base + timedelta(minutes=idx, seconds=1500),
+        state=TimerState.IDLE,
+    )
+
+
+def test_compact_session_round_trips_and_is_attribute_compatible() -> None:
+    session = _mk_session(1)
+    compact = CompactSession.from_session(session)
+
+    assert compact == session
+    assert compact.to_session() == session
+    assert (compact.id, compact.type, compact.duration_s) == (session.id, session.type, 1500)
+    assert compact.started_at == session.started_at
+    assert compact.ended_at == session.ended_at
+
+    # Mutable like the dataclass (TimerService assigns ended_at/state)
+    compact.ended_at = None
+    compact.state = TimerState.RUNNING_FOCUS
+    assert compact.ended_at is None
+    assert compact.started_at == session.started_at
+    assert compact.state == TimerState.RUNNING_FOCUS
+    assert not hasattr(compact, "__dict__")
+
+
+def test_compact_session_keeps_aware_datetimes() -> None:
+    tz = timezone(timedelta(hours=-3))
+    started = datetime(2024, 1, 1, 12, 0, tzinfo=tz)
+    compact = CompactSession(uuid4(), SessionType.FOCUS, 60, started, None, TimerState.IDLE)
+    assert compact.started_at == started
+    assert compact.started_at is not None and compact.started_at.utcoffset() == timedelta(hours=-3)
+
+
+def test_repository_compact_mode(temp_conn) -> None:
+    repo = SessionRepository(temp_conn)
+    sessions = [_mk_session(i) for i in range(5)]
+    for s in sessions:
+        repo.add(s)
+
+    compact_repo = SessionRepository(temp_conn, compact=True)
+    loaded = compact_repo.list_by_period(None, None)
+    assert all(isinstance(s, CompactSession) for s in loaded)
+    assert loaded == sessions
+    assert compact_repo.last_n(2) == sessions[3:]
+
+    # Re-inserting through the repository works off the compact attributes too
+    other = CompactSession.from_session(_mk_session(9))
+    repo.add(other)
+    assert repo.last_n(1) == [other]
+    assert sys.getsizeof(loaded[0]) < sys.getsizeof(sessions[0]) + sys.getsizeof(sessions[0].__dict__)
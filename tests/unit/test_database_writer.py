@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from pomodoro_app.core.models import Session, SessionType, TimerState
+from pomodoro_app.infrastructure.db.repositories import SessionRepository
+from pomodoro_app.infrastructure.db.writer import DatabaseWriter
+
+
+def _session(i: int) -> Session:
+    start = datetime(2024, 1, 1, 12, 0, 0) + timedelta(minutes=30 * i)
+    return Session(
+        id=uuid.uuid5(uuid.NAMESPACE_DNS, f"writer-{i}"),
+        type=SessionType.FOCUS,
+        duration_s=1500,
+        started_at=start,
+        ended_at=start + timedelta(seconds=1500),
+        state=TimerState.IDLE,
+    )
+
+
+def test_queued_commands_share_a_transaction_and_fail_alone(temp_conn) -> None:
+    started, gate = threading.Event(), threading.Event()
+
+    def hold(conn: sqlite3.Connection) -> bool:
+        started.set()
+        return gate.wait(2.0)
+
+    with DatabaseWriter(temp_conn) as writer:
+        # Hold the writer thread so the next commands queue up behind it
+        blocker = writer.submit(hold)
+        assert started.wait(2.0)
+        futures = [writer.add_session(_session(i)) for i in range(5)]
+        duplicate = writer.add_session(_session(2))
+        answer = writer.submit(lambda conn: conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0])
+        gate.set()
+
+        assert blocker.result(2.0) is True
+        assert [f.result(2.0) for f in futures] == [None] * 5
+        with pytest.raises(sqlite3.IntegrityError):
+            duplicate.result(2.0)
+        # Sees its own batch's uncommitted rows, minus the rolled-back duplicate
+        assert answer.result(2.0) == 5
+
+        metrics = writer.metrics()
+        assert (metrics.commands, metrics.failed, metrics.batches, metrics.max_batch) == (8, 1, 2, 7)
+    assert len(SessionRepository(temp_conn).last_n(10)) == 5
+
+
+def test_close_writes_queued_commands_then_rejects_new_ones(temp_conn) -> None:
+    writer = DatabaseWriter(temp_conn, max_batch=2)
+    futures = [writer.add_session(_session(i)) for i in range(7)]
+    writer.close()
+    assert all(f.done() and f.exception() is None for f in futures)
+    assert temp_conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 7
+    assert writer.metrics().max_batch <= 2
+    with pytest.raises(RuntimeError):
+        writer.add_session(_session(8))
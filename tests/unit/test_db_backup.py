@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from pomodoro_app.core.models import Session, SessionType, TimerState
+from pomodoro_app.infrastructure.db.backup import BackupService, backup_database, restore_database
+from pomodoro_app.infrastructure.db.pool import ConnectionPool
+from pomodoro_app.infrastructure.db.repositories import SessionRepository
+
+
+def _sessions(start: int, n: int) -> list[Session]:
+    base = datetime(2024, 1, 1, 8, 0, 0)
+    return [
+        Session(
+            id=uuid.uuid5(uuid.NAMESPACE_DNS, f"backup-{i}"),
+            type=SessionType.FOCUS if i % 2 == 0 else SessionType.BREAK,
+            duration_s=1500,
+            started_at=base + timedelta(minutes=30 * i),
+            ended_at=base + timedelta(minutes=30 * i, seconds=1500),
+            state=TimerState.IDLE,
+        )
+        for i in range(start, start + n)
+    ]
+
+
+def _count(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+
+def test_backup_rotates_and_restore_brings_the_copy_back(tmp_path) -> None:
+    with ConnectionPool(tmp_path / "db.sqlite3", readers=1) as pool:
+        with pool.writer() as conn:
+            SessionRepository(conn).add_many(_sessions(0, 500))
+        with BackupService(pool, tmp_path / "backups", keep=2, pages_per_step=8) as service:
+            results = [service.backup_now().result(10) for _ in range(3)]
+            kept = service.backups()
+        assert kept == [r.path for r in results[1:]]
+        assert not list((tmp_path / "backups").glob("*.partial"))
+        assert results[-1].steps > 1
+        with sqlite3.connect(kept[-1]) as copy:
+            assert _count(copy) == 500
+            assert copy.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+        with pool.writer() as conn:
+            SessionRepository(conn).add_many(_sessions(500, 100))
+        restore_database(pool, kept[-1])
+        with pool.reader() as conn:
+            assert _count(conn) == 500
+            # The rollup came back with the rows
+            assert conn.execute("SELECT SUM(sessions) FROM daily_stats").fetchone()[0] == 500
+        with pool.writer() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            SessionRepository(conn).add_many(_sessions(500, 1))
+
+
+def test_restore_rejects_an_invalid_file_without_touching_the_database(tmp_path) -> None:
+    bogus = tmp_path / "bogus.sqlite3"
+    bogus.write_bytes(b"not a database" * 100)
+    with ConnectionPool(tmp_path / "db.sqlite3", readers=1) as pool:
+        with pool.writer() as conn:
+            SessionRepository(conn).add_many(_sessions(0, 10))
+        with pytest.raises(ValueError):
+            restore_database(pool, bogus)
+        with pytest.raises(ValueError):
+            restore_database(pool, tmp_path / "missing.sqlite3")
+        with pool.reader() as conn:
+            assert _count(conn) == 10
+
+
+def test_add_throughput_stays_flat_while_a_large_backup_runs(tmp_path) -> None:
+    with ConnectionPool(tmp_path / "db.sqlite3", readers=1) as pool:
+        with pool.writer() as conn:
+            SessionRepository(conn).add_many(_sessions(0, 30_000))
+        fresh = iter(_sessions(30_000, 10_000))
+
+        def add_rate(n: int) -> float:
+            t0 = time.perf_counter()
+            for _ in range(n):
+                with pool.writer() as conn:
+                    SessionRepository(conn).add(next(fresh))
+            return n / (time.perf_counter() - t0)
+
+        baseline = add_rate(300)
+        with BackupService(pool, tmp_path / "backups", pages_per_step=4, pause=0.002) as service:
+            future = service.backup_now()
+            during = add_rate(300)
+            # The adds really overlapped the copy
+            assert not future.done()
+            result = future.result(60)
+        assert during >= 0.5 * baseline, (baseline, during)
+
+        # A consistent snapshot: whole commits only, none lost or torn
+        with sqlite3.connect(result.path) as copy:
+            assert 30_300 <= _count(copy) <= 30_600
+            assert copy.execute("PRAGMA quick_check").fetchone()[0] == "ok"
+
+
+def test_backup_of_an_in_memory_pool(tmp_path) -> None:
+    with ConnectionPool(None) as pool:
+        with pool.writer() as conn:
+            SessionRepository(conn).add_many(_sessions(0, 20))
+        result = backup_database(pool, tmp_path / "mem.sqlite3")
+        with sqlite3.connect(result.path) as copy:
+            assert _count(copy) == 20
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import uuid
+from datetime import datetime, timedelta
+
+from pomodoro_app.core.models import Session, SessionType, TimerState
+from pomodoro_app.infrastructure.db.maintenance import DatabaseMaintenance
+from pomodoro_app.infrastructure.db.pool import ConnectionPool
+from pomodoro_app.infrastructure.db.repositories import SessionRepository
+
+
+def _sessions(n: int) -> list[Session]:
+    base = datetime(2024, 1, 1, 8, 0, 0)
+    return [
+        Session(
+            id=uuid.uuid5(uuid.NAMESPACE_DNS, f"maintenance-{i}"),
+            type=SessionType.FOCUS,
+            duration_s=1500,
+            started_at=base + timedelta(minutes=30 * i),
+            ended_at=base + timedelta(minutes=30 * i, seconds=1500),
+            state=TimerState.IDLE,
+        )
+        for i in range(n)
+    ]
+
+
+def _wal_size(pool: ConnectionPool) -> int:
+    return os.path.getsize(f"{pool.db_file}-wal")
+
+
+def test_idle_pass_checkpoints_and_close_truncates_the_wal(tmp_path) -> None:
+    with ConnectionPool(tmp_path / "m.sqlite3", readers=1) as pool:
+        # Thread parked: passes are driven by hand
+        maintenance = DatabaseMaintenance(pool, check_interval=3600, idle_after=0.0, vacuum_interval=3600)
+        with pool.writer() as conn:
+            SessionRepository(conn).add_many(_sessions(2_000))
+        wal = _wal_size(pool)
+        assert wal > 0
+
+        maintenance.run_once()
+        metrics = maintenance.metrics()
+        assert metrics.checkpoints == 1
+        assert metrics.frames_checkpointed > 0
+        assert metrics.wal_bytes == wal
+
+        maintenance.close()
+        assert _wal_size(pool) == 0
+        with pool.writer() as conn:
+            assert conn.execute("PRAGMA wal_autocheckpoint").fetchone()[0] == 1000
+            assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 2_000
+
+
+def test_busy_pool_waits_unless_the_wal_is_too_large(tmp_path) -> None:
+    with ConnectionPool(tmp_path / "m.sqlite3", readers=1) as pool:
+        with pool.writer() as conn:
+            SessionRepository(conn).add_many(_sessions(100))
+        with DatabaseMaintenance(pool, check_interval=3600, idle_after=3600, max_wal_bytes=1 << 40) as maintenance:
+            maintenance.run_once()
+            assert maintenance.metrics().checkpoints == 0
+        with pool.writer() as conn:
+            SessionRepository(conn).add_many(_sessions(200)[100:])
+        with DatabaseMaintenance(pool, check_interval=3600, idle_after=3600, max_wal_bytes=1) as maintenance:
+            maintenance.run_once()
+            assert maintenance.metrics().checkpoints == 1
+
+
+def test_vacuum_releases_free_pages_in_steps(tmp_path) -> None:
+    with ConnectionPool(tmp_path / "m.sqlite3", readers=1) as pool:
+        with DatabaseMaintenance(pool, check_interval=3600, idle_after=0.0, vacuum_interval=0.0) as maintenance:
+            with pool.writer() as conn:
+                assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+                SessionRepository(conn).add_many(_sessions(5_000))
+                conn.execute("DELETE FROM sessions")
+                free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            assert free > 0
+
+            maintenance.run_once()
+            metrics = maintenance.metrics()
+            assert metrics.vacuum_runs == 1
+            assert metrics.pages_vacuumed == free
+            assert metrics.max_writer_hold_s > 0
+            with pool.writer() as conn:
+                assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+
+def test_in_memory_pool_is_a_no_op() -> None:
+    with ConnectionPool(None) as pool:
+        maintenance = DatabaseMaintenance(pool)
+        maintenance.run_once()
+        assert maintenance.checkpoint() == (0, 0, 0)
+        assert maintenance.vacuum() == 0
+        maintenance.close()
+        assert maintenance.metrics().checkpoints == 0
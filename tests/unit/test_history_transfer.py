@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from pomodoro_app.adapters.cli.history import (
+    add_history_commands,
+    export_history,
+    import_history,
+    run_history_command,
+)
+from pomodoro_app.core.models import Session, SessionType, TimerState
+from pomodoro_app.infrastructure.db.pool import ConnectionPool
+from pomodoro_app.infrastructure.db.repositories import SessionRepository
+from pomodoro_app.infrastructure.db.stats import StatsService
+
+
+def _sessions(n: int) -> list[Session]:
+    base = datetime(2024, 1, 1, 8, 0, 0)
+    return [
+        Session(
+            id=uuid.uuid5(uuid.NAMESPACE_DNS, f"transfer-{i}"),
+            type=SessionType.FOCUS if i % 2 == 0 else SessionType.BREAK,
+            duration_s=1500 if i % 2 == 0 else 300,
+            started_at=base + timedelta(minutes=30 * i) if i else None,
+            ended_at=base + timedelta(minutes=30 * i, seconds=1200) if i else None,
+            state=TimerState.IDLE,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+def test_export_import_round_trip(temp_conn, tmp_path, suffix) -> None:
+    source = SessionRepository(temp_conn)
+    assert source.add_many(_sessions(25), chunk=7) == 25
+    path = str(tmp_path / f"history{suffix}")
+
+    exported = export_history(source, path, chunk=4)
+    assert (exported.rows, exported.written) == (25, 25)
+
+    target_conn = sqlite3.connect(str(tmp_path / "target.sqlite3"), isolation_level=None)
+    from pomodoro_app.infrastructure.db.schema import ensure_schema
+
+    ensure_schema(target_conn)
+    target = SessionRepository(target_conn)
+    imported = import_history(target, path, batch_size=10)
+    assert (imported.rows, imported.written) == (25, 25)
+    assert list(target.iter_by_period(None, None)) == list(source.iter_by_period(None, None))
+    assert StatsService(target_conn).compute() == StatsService(temp_conn).compute()
+
+    # Re-importing skips every existing id
+    again = import_history(target, path, batch_size=10)
+    assert (again.rows, again.written) == (25, 0)
+    with pytest.raises(sqlite3.IntegrityError):
+        import_history(target, path, on_duplicate="fail")
+    target_conn.close()
+
+
+def test_replace_keeps_rollup_consistent_and_bad_lines_are_reported(temp_conn, tmp_path) -> None:
+    repo = SessionRepository(temp_conn)
+    repo.add_many(_sessions(5))
+    path = tmp_path / "edit.jsonl"
+    export_history(repo, str(path))
+    lines = path.read_text().splitlines()
+    path.write_text("\n".join(line.replace('"type":"BREAK"', '"type":"FOCUS"') for line in lines) + "\n")
+
+    report = import_history(repo, str(path), on_duplicate="replace")
+    assert report.written == 5
+    stats = StatsService(temp_conn).compute()
+    assert (stats.total_break_seconds, stats.sessions_count) == (0, 5)
+    assert stats.total_focus_seconds == 3 * 1500 + 2 * 300
+
+    bad = tmp_path / "bad.csv"
+    bad.write_text("id,type,duration_s,started_at,ended_at,state\nnot-a-uuid,FOCUS,1,,,IDLE\n")
+    with pytest.raises(ValueError, match="line 2"):
+        import_history(repo, str(bad))
+    with pytest.raises(ValueError):
+        import_history(repo, str(tmp_path / "history.txt"))
+
+
+def test_run_history_command_reports_throughput(tmp_path, capsys) -> None:
+    parser = argparse.ArgumentParser()
+    add_history_commands(parser.add_subparsers(dest="command"))
+    with ConnectionPool(tmp_path / "cli.sqlite3", readers=1) as pool:
+        with pool.writer() as conn:
+            SessionRepository(conn).add_many(_sessions(10))
+        out = str(tmp_path / "out.csv")
+        assert run_history_command(parser.parse_args(["export", out, "--start", "2024-01-01T09:00"]), pool) == 0
+        assert "exported 8 of 8 sessions" in capsys.readouterr().err
+        assert run_history_command(parser.parse_args(["import", out]), pool) == 0
+        assert "imported 0 of 8 sessions" in capsys.readouterr().err
+        assert run_history_command(parser.parse_args(["import", str(tmp_path / "missing.csv")]), pool) == 1
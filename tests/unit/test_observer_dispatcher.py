@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from pomodoro_app.core.dispatch import ObserverDispatcher
+from pomodoro_app.core.models import TimerState
+from pomodoro_app.core.timer_service import TimerService
+
+
+def test_ticks_are_latest_wins_behind_a_slow_subscriber() -> None:
+    dispatcher = ObserverDispatcher(workers=1)
+    gate = threading.Event()
+    seen: list[int] = []
+
+    def slow_tick(elapsed: int, remaining: int, state: TimerState) -> None:
+        gate.wait(1.0)
+        seen.append(remaining)
+
+    proxy = dispatcher.wrap("tick", slow_tick)
+    for remaining in range(100, 0, -1):
+        proxy(0, remaining, TimerState.RUNNING_FOCUS)
+    gate.set()
+    assert dispatcher.flush(timeout=2.0)
+    dispatcher.shutdown()
+
+    # First event was already running; everything queued behind it collapsed into the newest
+    assert seen[-1] == 1
+    assert len(seen) <= 2
+    [metrics] = dispatcher.metrics()
+    assert metrics.dropped == 100 - len(seen)
+    assert metrics.max_depth == 1
+
+
+def test_state_events_are_delivered_in_order_under_backpressure() -> None:
+    dispatcher = ObserverDispatcher(workers=2, maxsize=2)
+    seen: list[int] = []
+
+    def slow_state(value: int) -> None:
+        time.sleep(0.002)
+        seen.append(value)
+
+    proxy = dispatcher.wrap("state", slow_state)
+    for value in range(20):
+        proxy(value)
+    assert dispatcher.flush(timeout=2.0)
+    dispatcher.shutdown()
+
+    assert seen == list(range(20))
+    [metrics] = dispatcher.metrics()
+    assert metrics.dropped == 0
+    assert metrics.max_depth <= 2
+    assert metrics.delivered == 20
+
+
+def test_cycle_end_and_state_of_one_consumer_keep_emission_order() -> None:
+    dispatcher = ObserverDispatcher(workers=4)
+    consumer = object()
+    seen: list[tuple[str, int]] = []
+
+    def slow_cycle_end(n: int) -> None:
+        time.sleep(0.002)
+        seen.append(("cycle_end", n))
+
+    def state(n: int) -> None:
+        seen.append(("state", n))
+
+    end_proxy = dispatcher.wrap("cycle_end", slow_cycle_end, consumer=consumer)
+    state_proxy = dispatcher.wrap("state", state, consumer=consumer)
+    for n in range(20):
+        end_proxy(n)
+        state_proxy(n)
+    assert dispatcher.flush(timeout=2.0)
+    dispatcher.shutdown()
+
+    # Free workers never overtake the slow cycle_end with the state emitted after it
+    assert seen == [(event, n) for n in range(20) for event in ("cycle_end", "state")]
+    assert {m.event: m.delivered for m in dispatcher.metrics()} == {"cycle_end": 20, "state": 20}
+
+
+def test_slow_subscriber_does_not_delay_timer_thread() -> None:
+    dispatcher = ObserverDispatcher(workers=2)
+    svc = TimerService(tick_interval=0.01, dispatcher=dispatcher)
+    ended: list[object] = []
+    release = threading.Event()
+
+    def slow_cycle_end(session: object) -> None:
+        release.wait(2.0)
+        ended.append(session)
+
+    unsubscribe = svc.on_cycle_end(slow_cycle_end)
+    svc.on_tick(lambda e, r, s: time.sleep(0.05))
+    started = time.monotonic()
+    svc.start_focus(dur_s=1)
+
+    deadline = time.monotonic() + 3.0
+    while time.monotonic() < deadline and svc.state != TimerState.IDLE:
+        time.sleep(0.01)
+    # The session finished on time although both subscribers are slower than the ticks
+    assert svc.state == TimerState.IDLE
+    assert time.monotonic() - started < 1.5
+    assert ended == []
+
+    release.set()
+    assert dispatcher.flush(timeout=2.0)
+    assert len(ended) == 1
+    names = {m.name for m in dispatcher.metrics()}
+    assert any("slow_cycle_end" in n for n in names)
+
+    unsubscribe()
+    assert not any("slow_cycle_end" in m.name for m in dispatcher.metrics())
+    svc.stop()
+    dispatcher.shutdown()
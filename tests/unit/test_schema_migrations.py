@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import sqlite3
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pomodoro_app.infrastructure.db import schema
+from pomodoro_app.infrastructure.db.connection import connect
+from pomodoro_app.infrastructure.db.repositories import SessionRepository
+from pomodoro_app.infrastructure.db.schema import (
+    SCHEMA_VERSION,
+    enable_incremental_vacuum,
+    ensure_schema,
+    migrate,
+    schema_version,
+)
+from pomodoro_app.infrastructure.db.stats import StatsService
+
+
+def _id(name: str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, name))
+
+
+def _v0_database() -> sqlite3.Connection:
+    # Layout written by releases before user_version was used
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    for stmt in schema.SCHEMA_STATEMENTS:
+        conn.execute(stmt)
+    conn.execute("CREATE INDEX idx_sessions_started_at ON sessions(started_at)")
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    rows = []
+    for i in range(25):
+        started = base + timedelta(minutes=30 * i)
+        ended = started + timedelta(seconds=1500 if i % 5 else 1000)
+        rows.append((_id(f"id-{i}"), "FOCUS", 1500, started.isoformat(), ended.isoformat(), "IDLE"))
+    aware = datetime(2024, 1, 2, 9, 0, 0, tzinfo=timezone(timedelta(hours=-3)))
+    ended = aware + timedelta(seconds=300)
+    rows.append((_id("aware"), "BREAK", 300, aware.isoformat(), ended.isoformat(), "IDLE"))
+    rows.append((str(uuid.uuid4()), "FOCUS", 1500, base.isoformat(), None, "RUNNING_FOCUS"))
+    conn.executemany("INSERT INTO sessions VALUES(?, ?, ?, ?, ?, ?)", rows)
+    return conn
+
+
+def test_v0_database_is_migrated_and_backfilled_in_chunks(monkeypatch) -> None:
+    monkeypatch.setattr(schema, "BACKFILL_CHUNK", 4)
+    conn = _v0_database()
+    assert schema_version(conn) == 0
+
+    ensure_schema(conn)
+    assert schema_version(conn) == SCHEMA_VERSION
+    row = conn.execute(
+        "SELECT started_at_us, ended_at_us, elapsed_s FROM sessions WHERE id = ?", (uuid.UUID(_id("id-0")).bytes,)
+    ).fetchone()
+    started_us = (datetime(2024, 1, 1, 12, 0, 0) - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+    assert row == (started_us, started_us + 1_000 * 1_000_000, 1000)
+    # Aware timestamps are normalized to UTC
+    aware_us = conn.execute("SELECT started_at_us FROM sessions WHERE type = 2").fetchone()[0]
+    assert aware_us == (datetime(2024, 1, 2, 12, 0, 0) - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+    assert conn.execute("SELECT elapsed_s FROM sessions WHERE ended_at IS NULL").fetchone()[0] is None
+    assert conn.execute("SELECT COUNT(*) FROM sessions WHERE started_at_us IS NULL").fetchone()[0] == 0
+
+    indexes = {r[1] for r in conn.execute("PRAGMA index_list(sessions)")}
+    assert "idx_sessions_started_at_us" in indexes and "idx_sessions_started_at" not in indexes
+
+    # Same answers as the text-based queries gave: 5 early focus sessions
+    stats = StatsService(conn).compute()
+    assert (stats.sessions_count, stats.interruptions, stats.total_break_seconds) == (27, 5, 300)
+    window = SessionRepository(conn).list_by_period(datetime(2024, 1, 1, 13, 0), datetime(2024, 1, 1, 14, 0))
+    assert [s.started_at for s in window] == [
+        datetime(2024, 1, 1, 13, 0),
+        datetime(2024, 1, 1, 13, 30),
+        datetime(2024, 1, 1, 14, 0),
+    ]
+
+    # Idempotent
+    ensure_schema(conn)
+    assert migrate(conn) == SCHEMA_VERSION
+
+
+def test_interrupted_migration_is_rerun_and_newer_schema_is_rejected() -> None:
+    conn = _v0_database()
+    # Columns added but the version never recorded (crash during backfill)
+    conn.execute("ALTER TABLE sessions ADD COLUMN started_at_us INTEGER")
+    assert migrate(conn) == SCHEMA_VERSION
+    assert conn.execute("SELECT COUNT(*) FROM sessions WHERE started_at_us IS NULL").fetchone()[0] == 0
+
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    with pytest.raises(RuntimeError):
+        migrate(conn)
+
+
+def test_v4_stores_blob_uuids_and_enum_codes_under_an_integer_key() -> None:
+    conn = _v0_database()
+    migrate(conn)
+    columns = {row[1]: (row[2], row[5]) for row in conn.execute("PRAGMA table_info(sessions)")}
+    assert columns["seq"] == ("INTEGER", 1) and columns["id"][0] == "BLOB"
+    # Original insertion order is kept as the rowid order
+    first = conn.execute("SELECT seq, id, type, state FROM sessions ORDER BY seq LIMIT 1").fetchone()
+    assert first == (1, uuid.UUID(_id("id-0")).bytes, 1, 1)
+    assert conn.execute("SELECT DISTINCT type FROM daily_stats ORDER BY type").fetchall() == [(1,), (2,)]
+    assert conn.execute("SELECT COUNT(*) FROM sessions WHERE state = 2").fetchone()[0] == 1
+
+    repo = SessionRepository(conn)
+    running = [s for s in repo.list_by_period(None, None) if s.ended_at is None]
+    assert [(s.type.name, s.state.name) for s in running] == [("FOCUS", "RUNNING_FOCUS")]
+    session = repo.last_n(1)[0]
+    repo.add_many([session], on_duplicate="skip")
+    assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 27
+
+
+def test_interrupted_v4_copy_is_restarted(monkeypatch) -> None:
+    monkeypatch.setattr(schema, "BACKFILL_CHUNK", 5)
+    conn = _v0_database()
+    for migration in schema.MIGRATIONS[:3]:
+        migration(conn)
+    conn.execute("PRAGMA user_version = 3")
+    # Partial copy left behind by a crash
+    conn.execute(schema._COMPACT_SESSIONS)
+    conn.execute("INSERT INTO sessions_v4(id, type, duration_s, state) VALUES(x'00', 1, 1, 1)")
+
+    assert migrate(conn) == SCHEMA_VERSION
+    assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 27
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'sessions_v4'").fetchone() is None
+    assert StatsService(conn).compute().sessions_count == 27
+
+
+def test_v5_leaves_existing_databases_unvacuumed_until_converted_explicitly(tmp_path) -> None:
+    # A pre-v5 file: created without auto_vacuum, with free pages to reclaim
+    conn = sqlite3.connect(tmp_path / "old.sqlite3", isolation_level=None)
+    ensure_schema(conn)
+    conn.execute("PRAGMA user_version = 4")
+    rows = [(uuid.uuid4().bytes, 1, 1500, None, None, 1) for _ in range(2_000)]
+    conn.executemany(
+        "INSERT INTO sessions(id, type, duration_s, started_at, ended_at, state) VALUES(?, ?, ?, ?, ?, ?)", rows
+    )
+    conn.execute("DELETE FROM sessions WHERE seq % 2 = 0")
+    free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    assert free > 0
+
+    assert migrate(conn) == SCHEMA_VERSION
+    # No VACUUM ran at startup: the file and its free pages are untouched
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+    assert conn.execute("PRAGMA freelist_count").fetchone()[0] == free
+
+    assert enable_incremental_vacuum(conn) is True
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 1_000
+    assert enable_incremental_vacuum(conn) is False
+
+    fresh = connect(tmp_path / "new.sqlite3")
+    ensure_schema(fresh)
+    assert fresh.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from pomodoro_app.core.models import Session, SessionType, TimerState
+from pomodoro_app.infrastructure.db.archive import SessionArchive, year_bounds_us
+from pomodoro_app.infrastructure.db.pool import ConnectionPool
+from pomodoro_app.infrastructure.db.repositories import SessionRepository
+from pomodoro_app.infrastructure.db.stats import StatsService
+
+
+def _history() -> list[Session]:
+    # Every 13 hours from mid-2019 to 2024, some stopped early, plus one undated
+    base = datetime(2019, 6, 1, 7, 30)
+    sessions = []
+    for i in range(3_500):
+        start = base + timedelta(hours=13 * i)
+        duration = 1500 if i % 3 else 300
+        elapsed = duration - 120 if i % 7 == 0 else duration
+        sessions.append(
+            Session(
+                id=uuid.uuid5(uuid.NAMESPACE_DNS, f"archive-{i}"),
+                type=SessionType.FOCUS if i % 3 else SessionType.BREAK,
+                duration_s=duration,
+                started_at=start,
+                ended_at=start + timedelta(seconds=elapsed),
+                state=TimerState.IDLE,
+            )
+        )
+    sessions.append(
+        Session(uuid.uuid5(uuid.NAMESPACE_DNS, "archive-undated"), SessionType.FOCUS, 60, None, None, TimerState.IDLE)
+    )
+    return sessions
+
+
+@pytest.fixture()
+def pool(tmp_path):
+    with ConnectionPool(tmp_path / "db.sqlite3", readers=1) as pool:
+        with pool.writer() as conn:
+            SessionRepository(conn).add_many(_history())
+        yield pool
+
+
+PERIODS = [
+    (None, None),
+    (datetime(2020, 3, 14, 15, 0), datetime(2023, 2, 1, 9, 0)),
+    (datetime(2021, 12, 31, 20, 0), datetime(2022, 1, 1, 4, 0)),
+    (datetime(2023, 5, 1), None),
+]
+
+
+def test_archived_years_are_read_back_transparently(pool, tmp_path) -> None:
+    with pool.reader() as conn:
+        repo = SessionRepository(conn)
+        before = {p: [s.id for s in repo.list_by_period(*p)] for p in PERIODS}
+
+    with SessionArchive(tmp_path / "archive") as archive:
+        with pool.writer() as conn:
+            moved = archive.archive_before(conn, 2023)
+            assert list(moved) == [2019, 2020, 2021, 2022] == archive.years()
+            assert conn.execute("SELECT MIN(started_at_us) FROM sessions").fetchone()[0] >= year_bounds_us(2023)[0]
+            assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 3_501 - sum(moved.values())
+            # Archived days left the live rollup with their rows
+            assert conn.execute("SELECT COUNT(*) FROM daily_stats WHERE sessions = 0").fetchone()[0] == 0
+        with pool.reader() as conn:
+            repo = SessionRepository(conn, archive=archive)
+            for period, ids in before.items():
+                assert [s.id for s in repo.list_by_period(*period)] == ids, period
+                assert [s.id for s in repo.iter_by_period(*period, chunk=97)] == ids, period
+            assert conn.execute("PRAGMA database_list").fetchall()[1:] == []
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_stats_across_shards_match_the_single_table(pool, tmp_path, parallel) -> None:
+    with pool.reader() as conn:
+        stats = StatsService(conn)
+        totals = {p: stats.compute(*p) for p in PERIODS}
+        series = {b: stats.compute_series(*PERIODS[1], bucket=b) for b in ("hour", "day", "week", "weekday")}
+        untyped = stats.compute_series(bucket="week", group_by_type=False)
+
+    with SessionArchive(tmp_path / "archive", parallel=parallel, max_workers=2) as archive:
+        with pool.writer() as conn:
+            archive.archive_before(conn, 2024)
+        with pool.reader() as conn:
+            stats = StatsService(conn, archive=archive)
+            for period, expected in totals.items():
+                assert stats.compute(*period) == expected, period
+            for bucket, expected_series in series.items():
+                assert stats.compute_series(*PERIODS[1], bucket=bucket) == expected_series, bucket
+            assert stats.compute_series(bucket="week", group_by_type=False) == untyped
+
+
+def test_archiving_again_heals_rows_copied_but_not_deleted(pool, tmp_path) -> None:
+    archive = SessionArchive(tmp_path / "archive", parallel=False)
+    with pool.writer() as conn:
+        first = archive.archive_before(conn, 2022)
+        assert archive.archive_before(conn, 2022) == {}
+        # As if a crash hit between the copy and the delete
+        SessionRepository(conn).add_many(s for s in _history() if s.started_at and s.started_at.year == 2021)
+        assert archive.archive_before(conn, 2022) == {2021: first[2021]}
+    with pool.reader() as conn:
+        assert StatsService(conn, archive=archive).compute().sessions_count == 3_501
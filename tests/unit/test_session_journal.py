@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from pomodoro_app.core.models import Session, SessionType, TimerState
+from pomodoro_app.core.simulation import EventRecorder, SimulationScheduler, VirtualClock, simulated_service
+from pomodoro_app.infrastructure.journal.file_journal import FileJournal
+
+
+def _restart(journal_path: Path, down_for: float, offset: float) -> tuple[object, SimulationScheduler, EventRecorder]:
+    # A fresh process: new monotonic origin, wall clock moved on by the downtime
+    clock = VirtualClock(start=0.0, wall_start=datetime(2024, 1, 1) + timedelta(seconds=offset + down_for))
+    sim = SimulationScheduler(clock)
+    svc, _ = simulated_service(tick_interval=1.0, scheduler=sim, journal=FileJournal(journal_path))
+    return svc, sim, EventRecorder(svc, clock)
+
+
+def test_running_session_survives_restart(tmp_path: Path) -> None:
+    path = tmp_path / "timer.journal"
+    svc, sim = simulated_service(tick_interval=1.0, journal=FileJournal(path, sync_interval=0))
+    svc.start_focus(dur_s=600)
+    session_id = svc._current_session.id  # type: ignore[union-attr]
+    sim.run_for(100)
+    svc.pause()
+    sim.run_for(30)
+    svc.resume()
+    sim.run_for(20)
+    # Crash: the service is dropped without stop()
+
+    restarted, sim2, recorder = _restart(path, down_for=50, offset=150)
+    assert restarted.recover()
+    assert restarted.state == TimerState.RUNNING_FOCUS
+    # 100s + 20s run before the crash, 50s while down
+    assert restarted._remaining == 430.0  # type: ignore[attr-defined]
+
+    sim2.run_until_idle()
+    ticks = [args for _, name, args in recorder.events if name == "tick"]
+    assert ticks[0] == (171, 429, TimerState.RUNNING_FOCUS)
+    [(_, _, (finished,))] = [e for e in recorder.events if e[1] == "cycle_end"]
+    assert isinstance(finished, Session)
+    assert finished.id == session_id
+    assert finished.started_at == datetime(2024, 1, 1)
+    assert finished.ended_at == datetime(2024, 1, 1) + timedelta(seconds=630)
+    # Nothing left to recover once the session has finished
+    assert not _restart(path, down_for=0, offset=700)[0].recover()
+
+
+def test_close_keeping_the_session_leaves_it_recoverable(tmp_path: Path) -> None:
+    path = tmp_path / "timer.journal"
+    svc, sim = simulated_service(tick_interval=1.0, journal=FileJournal(path, sync_interval=0))
+    svc.start_focus(dur_s=600)
+    session_id = svc._current_session.id  # type: ignore[union-attr]
+    sim.run_for(100)
+    # Crash, then a normal quit after recovering
+    restarted, sim2, recorder = _restart(path, down_for=50, offset=100)
+    assert restarted.recover()
+    sim2.run_for(30)
+    restarted.close(keep_session=True)
+    assert [name for _, name, _ in recorder.events] == ["state"] + ["tick"] * 30
+    assert sim2.run_until_idle() == 0
+
+    again, _, recorder = _restart(path, down_for=20, offset=180)
+    assert again.recover()
+    assert again.state == TimerState.RUNNING_FOCUS
+    assert again._current_session.id == session_id  # type: ignore[union-attr]
+    # 100s before the crash, 50s down, 30s after recovering, 20s down
+    assert again._remaining == 400.0  # type: ignore[attr-defined]
+
+
+def test_paused_session_recovers_paused_and_expired_session_ends(tmp_path: Path) -> None:
+    path = tmp_path / "timer.journal"
+    svc, sim = simulated_service(tick_interval=1.0, journal=FileJournal(path, sync_interval=0))
+    svc.start_break(dur_s=300)
+    sim.run_for(60)
+    svc.pause()
+
+    paused, _, _ = _restart(path, down_for=3600, offset=60)
+    assert paused.recover()
+    assert paused.state == TimerState.PAUSED
+    assert paused._remaining == 240.0  # type: ignore[attr-defined]
+    paused.resume()
+
+    # Down for longer than the 240s that were left: finished while stopped
+    expired, _, recorder = _restart(path, down_for=1000, offset=3660)
+    assert expired.recover()
+    assert expired.state == TimerState.IDLE
+    [(_, name, (finished,))] = recorder.events
+    assert name == "cycle_end"
+    assert finished.type == SessionType.BREAK
+    assert finished.ended_at == datetime(2024, 1, 1) + timedelta(seconds=3660 + 240)
+
+
+def test_recover_skips_torn_tail_and_older_sessions(tmp_path: Path) -> None:
+    path = tmp_path / "timer.journal"
+    journal = FileJournal(path, sync_interval=0.01)
+    svc, sim = simulated_service(tick_interval=1.0, journal=journal)
+    svc.start_focus(dur_s=60)
+    sim.run_until_idle()
+    svc.start_focus(dur_s=60)
+    sim.run_for(10)
+    svc.pause()
+    journal.close()
+    assert journal.syncs >= 1
+    with open(path, "ab") as fh:
+        fh.write(b'{"op":"resume","sid":"')
+
+    reopened = FileJournal(path)
+    records = reopened.recover()
+    assert [r.op for r in records] == ["start", "pause"]
+    assert records[-1].remaining == 50.0
+    # New records start on a fresh line after the torn one
+    reopened.append(records[-1])
+    assert [r.op for r in reopened.recover()] == ["start", "pause", "pause"]
+    reopened.close()
+
+
+def test_append_does_not_wait_for_an_fsync_in_progress(tmp_path: Path, monkeypatch) -> None:
+    import threading
+
+    from pomodoro_app.infrastructure.journal import file_journal
+
+    in_fsync, release = threading.Event(), threading.Event()
+    real_fsync = file_journal.os.fsync
+
+    def slow_fsync(fd: int) -> None:
+        in_fsync.set()
+        release.wait(2.0)
+        real_fsync(fd)
+
+    journal = FileJournal(tmp_path / "timer.journal", sync_interval=60)
+    svc, sim = simulated_service(tick_interval=1.0, journal=journal)
+    svc.start_focus(dur_s=60)
+    monkeypatch.setattr(file_journal.os, "fsync", slow_fsync)
+    syncer = threading.Thread(target=journal.sync)
+    syncer.start()
+    assert in_fsync.wait(1.0)
+    try:
+        # The control path only needs the write, not the disk
+        done = threading.Event()
+        threading.Thread(target=lambda: (svc.pause(), done.set())).start()
+        assert done.wait(1.0)
+    finally:
+        release.set()
+        syncer.join()
+    monkeypatch.undo()
+    journal.close()
+    assert journal.syncs == 2
+    with FileJournal(tmp_path / "timer.journal") as reopened:
+        assert [r.op for r in reopened.recover()] == ["start", "pause"]
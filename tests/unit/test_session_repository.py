@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from uuid import UUID
 
 from pomodoro_app.core.models import Session, SessionType, TimerState
 from pomodoro_app.infrastructure.db.connection import connect
@@ -39,3 +40,96 @@ def test_add_and_last_n_and_period() -> None:
     assert [s.id for s in by_period] == [sessions[1].id, sessions[2].id, sessions[3].id]
 
 
+def _count(conn) -> int:  # type: ignore[no-untyped-def]
+    return conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+
+def test_write_behind_buffers_until_batch_size_or_flush(temp_conn) -> None:
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    repo = SessionRepository(temp_conn, write_behind=True, batch_size=3, flush_interval=60.0)
+    repo.add(_mk_session(base, 0))
+    repo.add(_mk_session(base, 1))
+    assert _count(temp_conn) == 0
+
+    # Reaching batch_size writes the whole batch at once
+    repo.add(_mk_session(base, 2))
+    assert _count(temp_conn) == 3
+
+    repo.add(_mk_session(base, 3))
+    assert repo.flush() == 1
+    assert repo.flush() == 0
+
+    # Queries see buffered rows
+    repo.add(_mk_session(base, 4))
+    assert len(repo.last_n(10)) == 5
+
+    repo.add(_mk_session(base, 5))
+    repo.close()
+    assert _count(temp_conn) == 6
+
+
+def test_write_behind_flushes_after_interval(temp_conn) -> None:
+    import time
+
+    repo = SessionRepository(temp_conn, write_behind=True, batch_size=1000, flush_interval=0.05)
+    repo.add(_mk_session(datetime(2024, 1, 1), 0))
+    deadline = time.monotonic() + 2.0
+    while _count(temp_conn) == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _count(temp_conn) == 1
+    repo.close()
+
+
+def test_iter_by_period_streams_keyset_pages_in_order(temp_conn) -> None:
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    repo = SessionRepository(temp_conn)
+    # Ties on started_at across chunk boundaries, plus undated sessions
+    for i in range(23):
+        s = _mk_session(base, i // 4)
+        repo.add(s)
+    for _ in range(3):
+        undated = _mk_session(base, 0)
+        repo.add(Session(undated.id, undated.type, undated.duration_s, None, None, undated.state))
+
+    # Undated first, then by start time; ties in insertion (seq) order
+    order = "started_at_us IS NOT NULL, started_at_us, seq"
+    everything = repo.list_by_period(None, None)
+    by_id = {s.id: s for s in everything}
+    everything = [by_id[UUID(bytes=r[0])] for r in temp_conn.execute(f"SELECT id FROM sessions ORDER BY {order}")]
+    assert len(everything) == 26
+    for chunk in (1, 3, 4, 100):
+        assert [s.id for s in repo.iter_by_period(None, None, chunk=chunk)] == [s.id for s in everything]
+
+    start, end = base + timedelta(minutes=1), base + timedelta(minutes=3)
+    window = [s.id for s in repo.iter_by_period(start, end, chunk=2)]
+    assert window == [s.id for s in everything if s.started_at is not None and start <= s.started_at <= end]
+    assert len(window) == 12
+
+    # The connection stays usable (and writable) between chunks
+    it = repo.iter_by_period(None, None, chunk=5)
+    first = [next(it) for _ in range(5)]
+    repo.add(_mk_session(base, 100))
+    rest = list(it)
+    assert len(first) + len(rest) == 27
+
+
+def test_page_returns_cursor_until_exhausted(temp_conn) -> None:
+    import pytest
+
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    repo = SessionRepository(temp_conn, write_behind=True, flush_interval=60.0)
+    for i in range(5):
+        repo.add(_mk_session(base, i))
+
+    first = repo.page(limit=2)
+    assert len(first.items) == 2 and first.next_cursor is not None
+    second = repo.page(first.next_cursor, limit=2)
+    third = repo.page(second.next_cursor, limit=2)
+    assert [s.started_at for s in first.items + second.items + third.items] == [
+        base + timedelta(minutes=i) for i in range(5)
+    ]
+    assert third.next_cursor is None
+    assert repo.page(limit=5).next_cursor is None
+    with pytest.raises(ValueError):
+        repo.page(limit=0)
+    repo.close()
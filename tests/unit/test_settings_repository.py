@@ -18,3 +18,35 @@ def test_set_and_get_json_values() -> None:
     assert repo.get("language") == "pt_BR"
     assert repo.get("overlay") is True
     assert repo.get("missing", default=42) == 42
+
+
+def test_cache_loads_once_and_set_many_notifies_subscribers(temp_conn) -> None:
+    statements: list[str] = []
+    temp_conn.set_trace_callback(statements.append)
+    repo = SettingsRepository(temp_conn)
+    repo.set_many({"durations": {"focus": 1500, "break": 300}, "language": "en"})
+    assert sum(s == "BEGIN" for s in statements) == 1
+
+    changes: list[dict] = []
+    unsubscribe = repo.subscribe(changes.append)
+    statements.clear()
+    for _ in range(10):
+        assert repo.get("language") == "en"
+        repo.get("durations")["focus"] = 0  # callers get copies
+    assert repo.get("durations") == {"focus": 1500, "break": 300}
+    assert repo.get("missing", default=1) == 1
+    assert statements == []
+
+    repo.set_many({"language": "en", "overlay": True})
+    assert changes == [{"overlay": True}]
+    unsubscribe()
+    repo.set("overlay", False)
+    assert changes == [{"overlay": True}]
+
+    # A fresh instance loads every key with a single query
+    statements.clear()
+    fresh = SettingsRepository(temp_conn)
+    assert fresh.all() == {"durations": {"focus": 1500, "break": 300}, "language": "en", "overlay": False}
+    assert fresh.get("overlay") is False
+    assert len([s for s in statements if s.startswith("SELECT")]) == 1
+    temp_conn.set_trace_callback(None)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+
+from pomodoro_app.core.models import Session, TimerState
+from pomodoro_app.core.simulation import EventRecorder, SimulationScheduler, VirtualClock, replay, simulated_service
+
+
+def test_full_pomodoro_runs_in_virtual_time() -> None:
+    svc, sim = simulated_service(tick_interval=1.0)
+    recorder = EventRecorder(svc, sim.clock)
+
+    started = time.perf_counter()
+    svc.start_focus(dur_s=25 * 60)
+    sim.run_until_idle()
+    assert time.perf_counter() - started < 5.0
+
+    events = recorder.events
+    assert events[0] == (0.0, "state", (TimerState.RUNNING_FOCUS,))
+    ticks = [args for _, name, args in events if name == "tick"]
+    assert len(ticks) == 25 * 60 - 1
+    assert ticks[0] == (1, 1499, TimerState.RUNNING_FOCUS)
+    assert ticks[-1] == (1499, 1, TimerState.RUNNING_FOCUS)
+    assert [name for _, name, _ in events[-2:]] == ["cycle_end", "state"]
+    assert events[-1] == (1500.0, "state", (TimerState.IDLE,))
+
+    session = events[-2][2][0]
+    assert isinstance(session, Session)
+    assert session.started_at == datetime(2024, 1, 1)
+    assert session.ended_at == datetime(2024, 1, 1) + timedelta(seconds=1500)
+
+
+def test_replayed_trace_is_deterministic() -> None:
+    trace = [(0, "start_focus", 10), (3.5, "pause"), (10, "resume")]
+
+    def run() -> list[tuple[float, str, tuple[object, ...]]]:
+        sim = SimulationScheduler(VirtualClock(start=1000.0))
+        svc, _ = simulated_service(tick_interval=1.0, scheduler=sim)
+        recorder = EventRecorder(svc, sim.clock)
+        replay(svc, sim, trace)
+        return [(t, name, args) for t, name, args in recorder.events if name != "cycle_end"]
+
+    first = run()
+    assert first == run()
+    states = [(t, args[0]) for t, name, args in first if name == "state"]
+    assert states == [
+        (1000.0, TimerState.RUNNING_FOCUS),
+        (1003.5, TimerState.PAUSED),
+        (1010.0, TimerState.RUNNING_FOCUS),
+        (1016.5, TimerState.IDLE),
+    ]
+    elapsed = [args[0] for _, name, args in first if name == "tick"]
+    assert elapsed == list(range(1, 10))
+
+
+def test_paced_run_is_fast_forwarded() -> None:
+    svc, sim = simulated_service(tick_interval=1.0)
+    svc.start_focus(dur_s=60)
+    started = time.perf_counter()
+    sim.run_until_idle(speed=10_000)
+    # 60 virtual seconds at 10,000x take about 6ms of real time
+    assert time.perf_counter() - started < 1.0
+    assert svc.state == TimerState.IDLE
+    assert sim.clock.now() == 60.0
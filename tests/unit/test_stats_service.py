@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 
 from pomodoro_app.core.models import Session, SessionType, TimerState
 from pomodoro_app.infrastructure.db.connection import connect
-from pomodoro_app.infrastructure.db.schema import ensure_schema
+from pomodoro_app.infrastructure.db.schema import SESSION_TYPE_CODES, ensure_schema
 from pomodoro_app.infrastructure.db.repositories import SessionRepository
 from pomodoro_app.infrastructure.db.stats import StatsService
 
@@ -39,3 +39,102 @@ def test_stats_compute(temp_conn) -> None:
     assert res.interruptions == 2
 
 
+def test_rollup_matches_raw_rows_for_any_range(temp_conn) -> None:
+    import random
+
+    from pomodoro_app.infrastructure.db.schema import rebuild_daily_stats
+
+    conn = temp_conn
+    repo = SessionRepository(conn, write_behind=True, batch_size=50)
+    rng = random.Random(7)
+    base = datetime(2024, 1, 1, 0, 0, 0)
+    for i in range(300):
+        start = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 20))
+        s_type = SessionType.FOCUS if rng.random() < 0.6 else SessionType.BREAK
+        repo.add(_mk_session(i, start, rng.choice((300, 1500)), rng.random() < 0.3, s_type))
+    repo.close()
+
+    def brute(start: datetime | None, end: datetime | None) -> tuple[int, int, int, int]:
+        rows = [
+            s for s in SessionRepository(conn).list_by_period(None, None)
+            if (start is None or s.started_at >= start) and (end is None or s.started_at <= end)
+        ]
+        return (
+            sum(s.duration_s for s in rows if s.type == SessionType.FOCUS),
+            sum(s.duration_s for s in rows if s.type == SessionType.BREAK),
+            sum(1 for s in rows if (s.ended_at - s.started_at).total_seconds() < s.duration_s),
+            len(rows),
+        )
+
+    stats = StatsService(conn)
+    ranges = [(None, None), (base + timedelta(days=3), None), (None, base + timedelta(days=5, hours=7))]
+    for _ in range(30):
+        a = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 21))
+        b = a + timedelta(minutes=rng.randrange(0, 60 * 24 * 8))
+        ranges.append((a, b))
+    ranges.append((base + timedelta(days=2), base + timedelta(days=4) - timedelta(microseconds=1)))
+
+    def check() -> None:
+        for start, end in ranges:
+            res = stats.compute(start, end)
+            got = (res.total_focus_seconds, res.total_break_seconds, res.interruptions, res.sessions_count)
+            assert got == brute(start, end), (start, end)
+
+    check()
+    # Triggers keep the rollup current on delete and update as well
+    conn.execute("DELETE FROM sessions WHERE rowid % 5 = 0")
+    conn.execute("UPDATE sessions SET type = ? WHERE rowid % 7 = 0", (SESSION_TYPE_CODES[SessionType.BREAK],))
+    check()
+
+    conn.execute("UPDATE daily_stats SET sessions = 0, total_s = 0")
+    assert rebuild_daily_stats(conn) > 0
+    check()
+
+
+def test_compute_series_matches_per_bucket_compute(temp_conn) -> None:
+    import random
+
+    conn = temp_conn
+    repo = SessionRepository(conn, write_behind=True)
+    rng = random.Random(11)
+    base = datetime(2024, 3, 1, 0, 0, 0)
+    for i in range(200):
+        start = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 30))
+        s_type = SessionType.FOCUS if rng.random() < 0.6 else SessionType.BREAK
+        repo.add(_mk_session(i, start, rng.choice((300, 1500)), rng.random() < 0.3, s_type))
+    repo.close()
+    stats = StatsService(conn)
+    start, end = base + timedelta(days=2, hours=5), base + timedelta(days=25, hours=13)
+    tick = timedelta(microseconds=1)
+
+    widths = {"hour": timedelta(hours=1), "day": timedelta(days=1), "week": timedelta(weeks=1)}
+    for bucket, width in widths.items():
+        series = stats.compute_series(start, end, bucket=bucket, group_by_type=False)
+        assert sum(b.sessions_count for b in series) == stats.compute(start, end).sessions_count
+        for b in series:
+            assert b.type is None
+            if bucket == "week":
+                assert b.key.weekday() == 0
+            expected = stats.compute(max(start, b.key), min(end, b.key + width - tick))
+            assert b.total_seconds == expected.total_focus_seconds + expected.total_break_seconds
+            assert (b.interruptions, b.sessions_count) == (expected.interruptions, expected.sessions_count)
+
+    by_type = stats.compute_series(start, end, bucket="day")
+    focus = sum(b.total_seconds for b in by_type if b.type == SessionType.FOCUS)
+    assert focus == stats.compute(start, end).total_focus_seconds
+    codes = [(b.key, SESSION_TYPE_CODES[b.type]) for b in by_type]
+    assert codes == sorted(codes)
+
+    weekdays = stats.compute_series(start, end, bucket="weekday", group_by_type=False)
+    sessions = SessionRepository(conn).list_by_period(start, end)
+    for b in weekdays:
+        assert b.sessions_count == sum(1 for s in sessions if s.started_at.weekday() == b.key)
+
+
+def test_compute_series_rejects_unknown_bucket(temp_conn) -> None:
+    import pytest
+
+    stats = StatsService(temp_conn)
+    assert stats.compute_series() == []
+    with pytest.raises(ValueError):
+        stats.compute_series(bucket="month")
@@ -1,20 +1,23 @@
 from __future__ import annotations
 
-import time
-
 import pytest
 
 from pomodoro_app.core.errors import InvalidDurationError, InvalidStateError
-from pomodoro_app.core.models import SessionType, TimerState
+from pomodoro_app.core.models import CyclePlan, PlanStep, SessionType, TimerState
+from pomodoro_app.core.simulation import EventRecorder, VirtualClock, simulated_service
 from pomodoro_app.core.timer_service import TimerService
 
 
 def test_start_focus_and_stop_transitions_to_idle() -> None:
-    svc = TimerService(tick_interval=0.01)
+    svc, sim = simulated_service(tick_interval=0.01)
     svc.start_focus(dur_s=1)
     assert svc.is_running
+    sim.run_for(0.5)
+    assert svc.is_running
     svc.stop()
     assert svc.state == TimerState.IDLE
+    # Nothing left to fire once stopped
+    assert sim.run_until_idle() == 0
 
 
 def test_invalid_duration_raises() -> None:
@@ -24,31 +27,293 @@ def test_invalid_duration_raises() -> None:
 
 
 def test_pause_resume_guards() -> None:
-    svc = TimerService(tick_interval=0.01)
+    svc, sim = simulated_service(tick_interval=0.01)
     with pytest.raises(InvalidStateError):
         svc.pause()
     svc.start_focus(dur_s=2)
+    sim.run_for(0.5)
     svc.pause()
     assert svc.is_paused
+    # Paused time does not count
+    sim.run_for(10)
+    assert svc.snapshot().remaining == pytest.approx(1.5)
     svc.resume()
     assert svc.is_running
+    sim.run_until_idle()
+    assert svc.state == TimerState.IDLE
+    assert sim.clock() == pytest.approx(12.0)
 
 
-def test_tick_and_finish_cycle_emits_state_idle(monkeypatch) -> None:
-    # Use a fast clock to force progression
-    base = [0.0]
+@pytest.mark.parametrize("tick_mode", ["interval", "deadline"])
+def test_tick_and_finish_cycle_emits_state_idle(tick_mode: str) -> None:
+    svc, sim = simulated_service(tick_interval=1.0, tick_mode=tick_mode)
+    recorder = EventRecorder(svc, sim.clock)
+    svc.start_focus(dur_s=3)
+    sim.run_until_idle()
 
-    def fake_monotonic() -> float:
-        base[0] += 0.05
-        return base[0]
+    assert svc.state == TimerState.IDLE
+    ticks = [(t, args[:2]) for t, name, args in recorder.events if name == "tick"]
+    assert ticks == [(1.0, (1, 2)), (2.0, (2, 1))]
+    others = [(t, name) for t, name, _ in recorder.events if name != "tick"]
+    assert others == [(0.0, "state"), (3.0, "cycle_end"), (3.0, "state")]
+    assert svc.snapshot().state == TimerState.IDLE
+
+
+class _ManualScheduler:
+    """Scheduler stub that records the requested delay; the test fires callbacks."""
+
+    def __init__(self) -> None:
+        self.pending: list[tuple[float, object]] = []
+
+    def call_later(self, delay: float, callback):  # type: ignore[no-untyped-def]
+        entry = (delay, callback)
+        self.pending.append(entry)
+        pending = self.pending
+
+        class _Handle:
+            def cancel(self) -> None:
+                if entry in pending:
+                    pending.remove(entry)
+
+        return _Handle()
+
+    def fire(self) -> float:
+        delay, callback = self.pending.pop(0)
+        callback()  # type: ignore[operator]
+        return delay
+
+
+def test_deadline_mode_ticks_on_boundaries_and_coalesces_missed_ticks() -> None:
+    now = [100.0]
+    sched = _ManualScheduler()
+    svc = TimerService(tick_interval=1.0, clock=lambda: now[0], scheduler=sched, tick_mode="deadline")
+    ticks: list[tuple[int, int]] = []
+    ended: list[object] = []
+    svc.on_tick(lambda e, r, s: ticks.append((e, r)))
+    svc.on_cycle_end(ended.append)
+
+    svc.start_focus(dur_s=5)
+    assert sched.pending[0][0] == pytest.approx(1.0)
+
+    # Slow callbacks: each wakeup is 0.3s late, yet the next deadline stays on the grid
+    now[0] = 101.3
+    sched.fire()
+    assert sched.pending[0][0] == pytest.approx(0.7)
+    assert svc.last_tick_timing is not None
+    assert svc.last_tick_timing.lateness == pytest.approx(0.3)
+
+    # Oversleep past two boundaries: one catch-up tick
+    now[0] = 103.5
+    sched.fire()
+    assert svc.last_tick_timing.coalesced == 1
+
+    now[0] = 104.0
+    sched.fire()
+    now[0] = 105.0
+    sched.fire()
+
+    assert ticks == [(1, 4), (3, 2), (4, 1)]
+    assert len(ended) == 1
+    assert svc.state == TimerState.IDLE
+
+
+def test_observers_can_unsubscribe_during_emit_and_module_registry_is_copy_on_write() -> None:
+    from pomodoro_app.core.ports import STATE_CALLBACKS
+
+    svc = TimerService()
+    seen: list[str] = []
+    unsub_holder: list[object] = []
+
+    def once(state: TimerState) -> None:
+        seen.append("once")
+        unsub_holder[0]()  # type: ignore[operator]
+
+    def module_cb(state: TimerState) -> None:
+        seen.append("module")
+
+    unsub_holder.append(svc.on_state(once))
+    before = STATE_CALLBACKS.snapshot
+    STATE_CALLBACKS.add(module_cb)
+    try:
+        # Subscribing rebuilt the snapshot instead of mutating the old one
+        assert module_cb not in before
+        svc._emit("state", TimerState.IDLE)
+        svc._emit("state", TimerState.IDLE)
+    finally:
+        STATE_CALLBACKS.discard(module_cb)
+
+    assert seen == ["once", "module", "module"]
+    assert module_cb not in STATE_CALLBACKS
 
-    svc = TimerService(tick_interval=0.01, clock=fake_monotonic)
-    svc.start_focus(dur_s=1)
 
-    # Wait a bit for loop to progress
-    time.sleep(0.2)
-    # Force stop to ensure thread cleanup and state IDLE
+def test_tick_resolution_limits_wakeups_to_needed_boundaries() -> None:
+    now = [0.0]
+    sched = _ManualScheduler()
+    svc = TimerService(tick_interval=1.0, clock=lambda: now[0], scheduler=sched, tick_mode="deadline")
+    minutes: list[tuple[int, int]] = []
+    seconds: list[int] = []
+    svc.on_tick(lambda e, r, s: minutes.append((e, r)), resolution=60.0)
+
+    svc.start_focus(dur_s=150)
+    # Only a minute subscriber: sleep straight to the first minute boundary
+    assert [d for d, _ in sched.pending] == [pytest.approx(60.0)]
+    now[0] = 60.0
+    sched.fire()
+    assert minutes == [(60, 90)]
+
+    # A per-second subscriber joining mid-session pulls the next wakeup in
+    now[0] = 60.5
+    unsubscribe = svc.on_tick(lambda e, r, s: seconds.append(e))
+    assert [d for d, _ in sched.pending] == [pytest.approx(0.5)]
+    now[0] = 61.0
+    sched.fire()
+    assert seconds == [61]
+    assert minutes == [(60, 90)]
+
+    # Without tick subscribers the loop only wakes for the end of the session
+    unsubscribe()
+    now[0] = 62.0
+    sched.fire()
+    assert sched.pending[0][0] == pytest.approx(58.0)
+    now[0] = 120.0
+    sched.fire()
+    assert minutes == [(60, 90), (120, 30)]
+
+    # "interval" mode: a minute subscriber still wakes the loop for the end of the session
+    for pause_at, switch_at, expected_end in ((30.5, None, 1510.0), (None, 100.3, 1500.0)):
+        svc, sim = simulated_service(tick_interval=1.0, tick_mode="interval")
+        ended: list[float] = []
+        svc.on_cycle_end(lambda session: ended.append(sim.clock()))
+        unsubscribe = svc.on_tick(lambda e, r, s: None, resolution=None if switch_at else 60.0)
+        svc.start_focus(dur_s=1500)
+        if pause_at is not None:
+            sim.run_until(pause_at)
+            svc.pause()
+            sim.run_for(10)
+            svc.resume()
+        else:
+            sim.run_until(switch_at)
+            svc.on_tick(lambda e, r, s: None, resolution=60.0)
+            unsubscribe()
+        sim.run_until_idle()
+        assert ended == [pytest.approx(expected_end)]
+
+
+def test_cycle_plan_chains_sessions_without_idle_gap() -> None:
+    svc, sim = simulated_service(tick_interval=1.0)
+    recorder = EventRecorder(svc, sim.clock)
+    plan = CyclePlan.pomodoro(focus_s=10, break_s=2, long_break_s=5, cycles=2)
+    assert [(s.type, s.duration_s) for s in plan.steps] == [
+        (SessionType.FOCUS, 10),
+        (SessionType.BREAK, 2),
+        (SessionType.FOCUS, 10),
+        (SessionType.BREAK, 5),
+    ]
+
+    svc.start_plan(plan)
+    sim.run_for(11)
+    assert svc.plan_index == 1
+    sim.run_until_idle()
+
+    states = [(t, args[0]) for t, name, args in recorder.events if name == "state"]
+    assert states == [
+        (0.0, TimerState.RUNNING_FOCUS),
+        (10.0, TimerState.RUNNING_BREAK),
+        (12.0, TimerState.RUNNING_FOCUS),
+        (22.0, TimerState.RUNNING_BREAK),
+        (27.0, TimerState.IDLE),
+    ]
+    ended = [args[0] for _, name, args in recorder.events if name == "cycle_end"]
+    assert [(s.type, s.duration_s) for s in ended] == [(s.type, s.duration_s) for s in plan.steps]
+    assert len({s.id for s in ended}) == 4
+    # Ticks restart from zero in every step
+    second_break = [args[:2] for t, name, args in recorder.events if name == "tick" and t > 22.0]
+    assert second_break == [(1, 4), (2, 3), (3, 2), (4, 1)]
+    assert svc.plan_index is None
+
+    with pytest.raises(InvalidDurationError):
+        svc.start_plan([PlanStep(SessionType.FOCUS, 10), (SessionType.BREAK, 0)])
+
+
+def test_worker_thread_is_reused_across_sessions_until_closed() -> None:
+    # A real worker thread on a frozen virtual clock: sessions never progress on their own
+    svc = TimerService(tick_interval=0.01, clock=VirtualClock())
+    svc.start_focus(dur_s=5)
+    worker = svc._thread
+    svc.stop()
+    svc.start_break(dur_s=5)
+    assert svc._thread is worker
     svc.stop()
+    # Parked while idle, not exited
+    assert worker is not None
+    worker.join(timeout=0.05)
+    assert worker.is_alive()
+
+    svc.close()
+    assert not worker.is_alive()
+    svc.start_focus(dur_s=5)
+    assert svc._thread is not worker
+    svc.close()
     assert svc.state == TimerState.IDLE
 
 
+def test_paused_timer_cancels_its_scheduled_tick() -> None:
+    now = [0.0]
+    sched = _ManualScheduler()
+    svc = TimerService(tick_interval=1.0, clock=lambda: now[0], scheduler=sched, tick_mode="deadline")
+    svc.on_tick(lambda e, r, s: None)
+    svc.start_focus(dur_s=10)
+    now[0] = 2.5
+    sched.fire()
+    svc.pause()
+    assert sched.pending == []
+
+    now[0] = 100.0
+    svc.resume()
+    # Back on the grid of the running time (2.5s elapsed)
+    assert [d for d, _ in sched.pending] == [pytest.approx(0.5)]
+
+
+def test_snapshot_is_consistent_and_readable_while_timer_lock_is_held() -> None:
+    import threading
+
+    svc, sim = simulated_service(tick_interval=1.0)
+    assert svc.snapshot().state == TimerState.IDLE
+    svc.on_tick(lambda e, r, s: None)
+    svc.start_focus(dur_s=100)
+    first = svc.snapshot()
+    assert (first.state, first.remaining, first.elapsed, first.tick_seq) == (TimerState.RUNNING_FOCUS, 100.0, 0.0, 0)
+
+    sim.run_for(42)
+    snap = svc.snapshot()
+    assert snap.session_id == first.session_id
+    assert (snap.remaining, snap.elapsed, snap.tick_seq, snap.taken_at) == (58.0, 42.0, 42, 42.0)
+    # Published objects are immutable; new ticks swap in a new one
+    with pytest.raises(AttributeError):
+        snap.remaining = 0.0  # type: ignore[misc]
+    sim.run_for(1)
+    assert svc.snapshot() is not snap and snap.remaining == 58.0
+
+    svc.pause()
+    assert svc.is_paused and svc.snapshot().remaining == 57.0
+
+    # A reader never waits for the timer lock
+    held, release = threading.Event(), threading.Event()
+
+    def hold_lock() -> None:
+        with svc._lock:
+            held.set()
+            release.wait(2.0)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    held.wait(1.0)
+    try:
+        assert svc.snapshot().state == TimerState.PAUSED
+        assert not svc.is_running
+    finally:
+        release.set()
+        holder.join()
+
+    svc.stop()
+    assert svc.snapshot().state == TimerState.IDLE and svc.snapshot().session_id is None
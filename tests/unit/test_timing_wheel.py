@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+
+from pomodoro_app.core.models import TimerState
+from pomodoro_app.core.scheduler import TimingWheelScheduler
+from pomodoro_app.core.timer_service import TimerService
+
+
+def test_wheel_fires_each_timer_on_its_tick_across_levels() -> None:
+    # Drive the wheel by hand with a fake clock to check cascading exactly
+    now = [0.0]
+    wheel = TimingWheelScheduler(resolution=1.0, wheel_bits=(2, 2, 2), clock=lambda: now[0])
+    fired: dict[int, int] = {}
+    rng = random.Random(7)
+    delays = [rng.randint(1, 200) for _ in range(300)]
+    for i, d in enumerate(delays):
+        wheel.call_later(d, lambda i=i: fired.__setitem__(i, wheel._current))
+    wheel.shutdown()
+
+    for t in range(1, 201):
+        now[0] = float(t)
+        with wheel._cond:
+            expired = wheel._advance_to(t)
+        for timer in expired:
+            timer.callback()
+
+    assert fired == {i: d for i, d in enumerate(delays)}
+
+
+def test_cancelled_timer_does_not_fire() -> None:
+    done = threading.Event()
+    calls: list[str] = []
+    with TimingWheelScheduler(resolution=0.005) as wheel:
+        handle = wheel.call_later(0.02, lambda: calls.append("cancelled"))
+        handle.cancel()
+        wheel.call_later(0.04, done.set)
+        assert done.wait(1.0)
+    assert calls == []
+
+
+def test_many_timer_services_share_one_wheel_thread() -> None:
+    with TimingWheelScheduler(resolution=0.005) as wheel:
+        threads_before = threading.active_count()
+        services = [TimerService(tick_interval=0.01, scheduler=wheel) for _ in range(50)]
+        ended: list[object] = []
+        ticks = [0]
+        lock = threading.Lock()
+
+        def on_tick(elapsed: int, remaining: int, state: TimerState) -> None:
+            with lock:
+                ticks[0] += 1
+
+        for svc in services:
+            svc.on_tick(on_tick)
+            svc.on_cycle_end(ended.append)
+            svc.start_focus(dur_s=1)
+        assert threading.active_count() == threads_before
+
+        deadline = time.time() + 5.0
+        while time.time() < deadline and len(ended) < len(services):
+            time.sleep(0.02)
+
+        assert len(ended) == len(services)
+        assert ticks[0] > 0
+        assert all(svc.state == TimerState.IDLE for svc in services)
+
+
+def test_stop_cancels_scheduled_ticks() -> None:
+    with TimingWheelScheduler(resolution=0.005) as wheel:
+        svc = TimerService(tick_interval=0.01, scheduler=wheel)
+        ticks: list[int] = []
+        svc.on_tick(lambda e, r, s: ticks.append(r))
+        svc.start_focus(dur_s=5)
+        time.sleep(0.05)
+        svc.stop()
+        seen = len(ticks)
+        time.sleep(0.05)
+        assert len(ticks) == seen
+        assert svc.state == TimerState.IDLE